@@ -1,13 +1,13 @@
 import itertools
 
-from typing import Callable, Dict, Mapping, Optional, Sequence, Set, Tuple, List
+from typing import Callable, Dict, Mapping, Optional, Sequence, Set, Tuple, List, Union
 
 from Asciinpy.utils import get_floor, get_floor_ceil
 
 from ..screen import Screen
 from ..types import AnyInt, AnyIntCoordinate
 from ..objects import Blitable
-from ..values import Color, ANSI
+from ..values import Color
 from ..geometry import rotate
 
 
@@ -16,6 +16,8 @@ CharacterMappingType = Mapping[str, OccupancySetType]
 ImageType = List[str]
 Transformer = Callable[[AnyIntCoordinate], AnyIntCoordinate]
 MaskPixmap = Dict[str, List[AnyIntCoordinate]]
+# the colour of every cell of a pixmap, in the order of its coordinates
+MaskColors = Dict[str, List[Optional[Color]]]
 
 
 class Collidable:
@@ -91,31 +93,23 @@ class Plane(Collidable, Blitable):
 
     @property
     def pixels(self):
-        if self.color is not None:
-            return self.rasterize()
-        else:
-            return self.image
-
-    def rasterize(self):
-        is_coloring = False
-        ammended_pix = list(self.image)
-        if self.color:
-            for i, char in enumerate(self.image):
-                if char == "\n":
-                    continue
-
-                if not is_coloring:
-                    ammended_pix[i] = "".join((str(self.color.ansi()), char))
-                    is_coloring = True
-                if i + 1 == len(self.image) or self.image[i + 1] in (" ", "\n"):
-                    ammended_pix[i] += ANSI.RESET
-        return ammended_pix
+        return self.image
+
+    def rasterize(self) -> List[Tuple[str, Optional[Color]]]:
+        """
+        The glyphs of the image along with their colour, spaces are left uncoloured.
+        The colour is drawn into the attribute plane of the screen rather than into
+        the glyphs.
+        """
+        color = self.color
+        return [(char, None if char == " " else color) for char in self.image]
 
     def blit(self, screen: Screen):
         x, y = self.x, self.y
         res_width, res_height = screen.resolution.value
         self.occupancy = set()
-        for char in self.pixels:
+        color = self.color
+        for char in self.image:
             if char == "\n":
                 x = self.x
                 y += 1
@@ -126,7 +120,7 @@ class Plane(Collidable, Blitable):
 
             if x >= 0 and x <= res_width and y >= 0 and y <= res_height:
                 self.occupancy.add((x, y))
-                screen.draw((x, y), char)
+                screen.draw((x, y), char, None if char == " " else color)
             x += 1
 
 
@@ -140,18 +134,40 @@ class Mask(Collidable, Blitable):
 
     Masks rasterizes objects by constructing simply a mappings of pixels instead of shallow images for rasterization and therefore
     extending the operations you can do on Masks.
+
+    A mask is coloured as a whole by a colour, per glyph by a mapping of the glyphs to
+    their colour or per cell by rows of colours laid over the image. Spaces are only
+    coloured per cell. The colours are drawn into the attribute plane of the screen,
+    which writes every run of a colour out with a single sequence.
+
+    .. code:: py
+
+       ship = Mask("<^>\\n|o|", (10, 5), {"^": Color.foreground(255, 0, 0)})
+       flag = Mask("##\\n##", (0, 0), colors=[[red, None], [None, blue]])
+
+    :param color:
+        The colour of the whole mask or of each glyph.
+    :type color: Optional[Union[:class:`~Asciinpy.values.Color`, Mapping[:class:`str`, :class:`~Asciinpy.values.Color`]]]
+    :param colors:
+        The colour of every cell of the image by its row and column, a cell that is
+        None or missing takes the colour of its glyph.
+    :type colors: Optional[Sequence[Sequence[Optional[:class:`~Asciinpy.values.Color`]]]]
     """
 
-    __slots__ = ("color", "_coordinate", "_pixmap")
+    __slots__ = ("color", "_coordinate", "_pixmap", "_colors")
 
     def __init__(
         self,
         image: str,
         coordinate: Sequence[AnyInt] = [1, 1],
-        color: Optional[Color] = None,
+        color: Optional[Union[Color, Mapping[str, Color]]] = None,
+        colors: Optional[Sequence[Sequence[Optional[Color]]]] = None,
     ):
         self.color = color
         self._pixmap = self.get_pixmap(coordinate, image)
+        self._colors: Optional[MaskColors] = (
+            None if colors is None else self.get_colors(image, colors)
+        )
         self._topleft = coordinate
 
     @staticmethod
@@ -176,6 +192,30 @@ class Mask(Collidable, Blitable):
             x_depth += 1
         return pixmap
 
+    @staticmethod
+    def get_colors(image: str, colors: Sequence[Sequence[Optional[Color]]]) -> MaskColors:
+        """
+        Lays the rows of colours over the image, in the order of the coordinates of its
+        pixmap so they follow every transformation.
+        """
+        cells: MaskColors = {}
+        for line, row in itertools.zip_longest(image.split("\n"), colors[: image.count("\n") + 1]):
+            row = row or ()
+            for i, pixel in enumerate(line):
+                cells.setdefault(pixel, []).append(row[i] if i < len(row) else None)
+        return cells
+
+    def glyph_color(self, char: str) -> Optional[Color]:
+        """
+        The colour the cells of a glyph are drawn in unless coloured per cell.
+        """
+        color = self.color
+        if color is None or char == " ":
+            return None
+        if isinstance(color, Color):
+            return color
+        return color.get(char)
+
     @property
     def dimension(self) -> AnyIntCoordinate:
         floor, ceil = get_floor_ceil(self.occupancy)
@@ -237,6 +277,13 @@ class Mask(Collidable, Blitable):
         self._topleft = get_floor(self.occupancy)
 
     def blit(self, screen: Screen):
+        draw = screen.draw
+        cells = self._colors
         for char, presences in self._pixmap.items():
-            for x, y in presences:
-                screen.draw((round(x), round(y)), char)
+            color = self.glyph_color(char)
+            if cells is None or char not in cells:
+                for x, y in presences:
+                    draw((round(x), round(y)), char, color)
+                continue
+            for (x, y), cell in zip(presences, cells[char]):
+                draw((round(x), round(y)), char, color if cell is None else cell)
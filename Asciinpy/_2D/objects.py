@@ -53,21 +53,23 @@ class Polygon(Mask):
         texture: str = DEFAULT_BRICK,
         color: Optional[Color] = None,
     ):
-        self.coordinates = coordinates
+        # kept as tuples so the edges can be cached by their coordinates
+        self.coordinates = tuple(map(tuple, coordinates))
         self.texture = texture or DEFAULT_BRICK
         self.color = color
 
-        self.mappings = {self.texture: self.get_edge_mapping(self.edges)}
-        self._coordinate = get_floor(self.occupancy)
+        self._pixmap = {self.texture: list(self.get_edge_mapping(self.edges))}
+        self._colors = None
+        self._coordinate = tuple(get_floor(self.occupancy))
 
     @staticmethod
     @lru_cache(maxsize=64)
-    def get_edge_mapping(edges: List[Line]) -> OccupancySetType:
+    def get_edge_mapping(edges: Tuple[Line, ...]) -> OccupancySetType:
         return set(itertools.chain.from_iterable(e.points for e in edges))
 
     @staticmethod
     @lru_cache(maxsize=64)
-    def get_edges(coordinates: List[Tuple[int, int]]) -> Tuple[Line]:
+    def get_edges(coordinates: Tuple[Tuple[int, int], ...]) -> Tuple[Line, ...]:
         ends = len(coordinates) - 1
         edges = [
             Line(coordinates[i], coordinates[i + 1])
@@ -89,7 +91,7 @@ class Polygon(Mask):
     def x(self, value: AnyInt):
         translates = value - self._coordinate[0]
         self._coordinate = (value, self._coordinate[1])
-        self.coordinates = list(
+        self.coordinates = tuple(
             map(lambda coord: (coord[0] + translates, coord[1]), self.coordinates)
         )
 
@@ -101,12 +103,12 @@ class Polygon(Mask):
     def y(self, value: AnyInt):
         translates = value - self._coordinate[1]
         self._coordinate = (self._coordinate[0], value)
-        self.coordinates = list(
+        self.coordinates = tuple(
             map(lambda coord: (coord[0], coord[1] + translates), self.coordinates)
         )
 
     def blit(self, screen: Screen):
-        self.mappings[self.texture] = self.get_edge_mapping(self.edges)
+        self._pixmap[self.texture] = list(self.get_edge_mapping(self.edges))
         return super().blit(screen)
 
 
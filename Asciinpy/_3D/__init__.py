@@ -1 +1,3 @@
-# This page is left intentionally blank.
\ No newline at end of file
+from .models import *
+from .transforms import *
+from .camera import *
@@ -0,0 +1,518 @@
+from math import cos, pi, sin, sqrt, tan
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+from ..geometry import Line
+from .._2D.objects import DEFAULT_BRICK
+from .models import Instances, Model, Vertex
+from .transforms import (
+    IDENTITY,
+    Matrix4,
+    compose,
+    max_scale,
+    multiply,
+    rotation_x,
+    rotation_y,
+    transform_point,
+    translation,
+)
+
+__all__ = ["Camera"]
+
+ClipVertex = Tuple[float, float, float, float]
+Plane = Tuple[float, float, float, float]
+ScreenPoint = Tuple[float, float]
+
+# clipping planes in homogeneous clip space, a point (x, y, z, w) is inside
+# when the dot product with every plane is non-negative
+CLIP_PLANES: Tuple[Plane, ...] = (
+    (0.0, 0.0, 1.0, 0.0),  # near, z >= 0
+    (1.0, 0.0, 0.0, 1.0),  # left, x >= -w
+    (-1.0, 0.0, 0.0, 1.0),  # right, x <= w
+    (0.0, 1.0, 0.0, 1.0),  # bottom, y >= -w
+    (0.0, -1.0, 0.0, 1.0),  # top, y <= w
+    (0.0, 0.0, -1.0, 1.0),  # far, z <= w
+)
+
+
+def _inside(c: ClipVertex) -> bool:
+    x, y, z, w = c
+    return 0 <= z <= w and -w <= x <= w and -w <= y <= w
+
+
+def _dot(p: Plane, c: ClipVertex) -> float:
+    return p[0] * c[0] + p[1] * c[1] + p[2] * c[2] + p[3] * c[3]
+
+
+def _lerp(a: ClipVertex, b: ClipVertex, t: float) -> ClipVertex:
+    return (
+        a[0] + (b[0] - a[0]) * t,
+        a[1] + (b[1] - a[1]) * t,
+        a[2] + (b[2] - a[2]) * t,
+        a[3] + (b[3] - a[3]) * t,
+    )
+
+
+def clip_polygon(polygon: Sequence[ClipVertex]) -> List[ClipVertex]:
+    """
+    Clips a convex polygon in homogeneous clip space against the view frustum
+    with Sutherland-Hodgman, the near plane is clipped before the perspective
+    divide so vertices behind the camera never get projected.
+    """
+    output = list(polygon)
+    for plane in CLIP_PLANES:
+        if not output:
+            break
+        source, output = output, []
+        prev = source[-1]
+        prev_d = _dot(plane, prev)
+        for cur in source:
+            cur_d = _dot(plane, cur)
+            if cur_d >= 0:
+                if prev_d < 0:
+                    output.append(_lerp(prev, cur, prev_d / (prev_d - cur_d)))
+                output.append(cur)
+            elif prev_d >= 0:
+                output.append(_lerp(prev, cur, prev_d / (prev_d - cur_d)))
+            prev, prev_d = cur, cur_d
+    return output
+
+
+def clip_segment(a: ClipVertex, b: ClipVertex) -> Optional[Tuple[ClipVertex, ClipVertex]]:
+    """
+    Clips a line segment in homogeneous clip space against the view frustum,
+    returns None when nothing of it is visible.
+    """
+    t0, t1 = 0.0, 1.0
+    for plane in CLIP_PLANES:
+        da, db = _dot(plane, a), _dot(plane, b)
+        if da < 0 and db < 0:
+            return None
+        if da < 0:
+            t0 = max(t0, da / (da - db))
+        elif db < 0:
+            t1 = min(t1, da / (da - db))
+        if t0 > t1:
+            return None
+    return (
+        a if t0 == 0.0 else _lerp(a, b, t0),
+        b if t1 == 1.0 else _lerp(a, b, t1),
+    )
+
+
+class Camera:
+    """
+    A perspective camera looking down its local +z axis.
+
+    The view and projection matrices are only rebuilt when a property they depend
+    on is changed, so an unmoving camera costs nothing per frame. Models are culled
+    by their bounding sphere before any of their vertices are transformed.
+
+    .. code:: py
+
+       camera = Camera(position=(0, 0, -5), aspect_ratio=screen.aspect_ratio)
+       while True:
+           camera.yaw += 0.01
+           camera.render(screen, model, rotation_y(angle))
+           screen.refresh()
+
+    :param position:
+        The position of the camera in world space.
+    :type position: Tuple[:class:`float`, :class:`float`, :class:`float`]
+    :param yaw:
+        Rotation around the y axis in radians.
+    :type yaw: :class:`float`
+    :param pitch:
+        Rotation around the x axis in radians.
+    :type pitch: :class:`float`
+    :param fov:
+        The vertical field of view in radians. Defaults to 90 degrees or pi/2.
+    :type fov: :class:`float`
+    :param aspect_ratio:
+        Height over width of the viewport.
+    :type aspect_ratio: :class:`float`
+    :param near:
+        Distance to the near clipping plane.
+    :type near: :class:`float`
+    :param far:
+        Distance to the far clipping plane.
+    :type far: :class:`float`
+    """
+
+    __slots__ = (
+        "_position",
+        "_yaw",
+        "_pitch",
+        "_fov",
+        "_aspect_ratio",
+        "_near",
+        "_far",
+        "_view",
+        "_projection",
+        "_view_projection",
+        "_frustum",
+    )
+
+    def __init__(
+        self,
+        position: Vertex = (0.0, 0.0, 0.0),
+        yaw: float = 0.0,
+        pitch: float = 0.0,
+        fov: float = pi / 2,
+        aspect_ratio: float = 1.0,
+        near: float = 0.1,
+        far: float = 1000.0,
+    ):
+        if not 0 < near < far:
+            raise ValueError(f"near {near} and far {far} planes must satisfy 0 < near < far")
+        self._position = tuple(position)
+        self._yaw = yaw
+        self._pitch = pitch
+        self._fov = fov
+        self._aspect_ratio = aspect_ratio
+        self._near = near
+        self._far = far
+        self._view: Optional[Matrix4] = None
+        self._projection: Optional[Matrix4] = None
+        self._view_projection: Optional[Matrix4] = None
+        self._frustum: Optional[Tuple[Plane, ...]] = None
+
+    def _invalidate_view(self):
+        self._view = None
+        self._view_projection = None
+        self._frustum = None
+
+    def _invalidate_projection(self):
+        self._projection = None
+        self._view_projection = None
+        self._frustum = None
+
+    @property
+    def position(self) -> Vertex:
+        return self._position  # type: ignore
+
+    @position.setter
+    def position(self, value: Vertex):
+        value = tuple(value)
+        if value != self._position:
+            self._position = value
+            self._invalidate_view()
+
+    @property
+    def yaw(self) -> float:
+        return self._yaw
+
+    @yaw.setter
+    def yaw(self, value: float):
+        if value != self._yaw:
+            self._yaw = value
+            self._invalidate_view()
+
+    @property
+    def pitch(self) -> float:
+        return self._pitch
+
+    @pitch.setter
+    def pitch(self, value: float):
+        if value != self._pitch:
+            self._pitch = value
+            self._invalidate_view()
+
+    @property
+    def fov(self) -> float:
+        return self._fov
+
+    @fov.setter
+    def fov(self, value: float):
+        if value != self._fov:
+            self._fov = value
+            self._invalidate_projection()
+
+    @property
+    def aspect_ratio(self) -> float:
+        return self._aspect_ratio
+
+    @aspect_ratio.setter
+    def aspect_ratio(self, value: float):
+        if value != self._aspect_ratio:
+            self._aspect_ratio = value
+            self._invalidate_projection()
+
+    @property
+    def near(self) -> float:
+        return self._near
+
+    @near.setter
+    def near(self, value: float):
+        if value != self._near:
+            self._near = value
+            self._invalidate_projection()
+
+    @property
+    def far(self) -> float:
+        return self._far
+
+    @far.setter
+    def far(self, value: float):
+        if value != self._far:
+            self._far = value
+            self._invalidate_projection()
+
+    @property
+    def forward(self) -> Vertex:
+        """
+        The unit direction the camera is looking at in world space.
+        """
+        return (
+            sin(self._yaw) * cos(self._pitch),
+            -sin(self._pitch),
+            cos(self._yaw) * cos(self._pitch),
+        )
+
+    def move(self, dx: float = 0.0, dy: float = 0.0, dz: float = 0.0):
+        """
+        Moves the camera in world space.
+        """
+        x, y, z = self._position
+        self.position = (x + dx, y + dy, z + dz)
+
+    @property
+    def view(self) -> Matrix4:
+        """
+        The world to camera space transformation.
+        """
+        if self._view is None:
+            x, y, z = self._position
+            self._view = compose(
+                translation(-x, -y, -z), rotation_y(-self._yaw), rotation_x(-self._pitch)
+            )
+        return self._view
+
+    @property
+    def projection(self) -> Matrix4:
+        """
+        The camera to clip space transformation.
+        """
+        if self._projection is None:
+            f = 1 / tan(self._fov / 2)
+            q = self._far / (self._far - self._near)
+            a = self._aspect_ratio
+            self._projection = (
+                a * f, 0.0, 0.0, 0.0,
+                0.0, f, 0.0, 0.0,
+                0.0, 0.0, q, 1.0,
+                0.0, 0.0, -self._near * q, 0.0,
+            )
+        return self._projection
+
+    @property
+    def view_projection(self) -> Matrix4:
+        """
+        The world to clip space transformation.
+        """
+        if self._view_projection is None:
+            self._view_projection = multiply(self.view, self.projection)
+        return self._view_projection
+
+    @property
+    def frustum(self) -> Tuple[Plane, ...]:
+        """
+        The normalized world space planes of the view frustum, a point is inside
+        when ``a*x + b*y + c*z + d >= 0`` for every plane.
+        """
+        if self._frustum is None:
+            m = self.view_projection
+            planes = []
+            for p in CLIP_PLANES:
+                # a clip space plane pulled back through the matrix is the
+                # combination of its columns
+                plane = tuple(
+                    p[0] * m[i] + p[1] * m[i + 1] + p[2] * m[i + 2] + p[3] * m[i + 3]
+                    for i in range(0, 16, 4)
+                )
+                norm = sqrt(plane[0] ** 2 + plane[1] ** 2 + plane[2] ** 2)
+                planes.append(tuple(c / norm for c in plane))
+            self._frustum = tuple(planes)  # type: ignore
+        return self._frustum  # type: ignore
+
+    def sphere_visible(self, center: Vertex, radius: float) -> bool:
+        """
+        Whether any part of a sphere in world space is inside the view frustum.
+        """
+        cx, cy, cz = center
+        for a, b, c, d in self.frustum:
+            if a * cx + b * cy + c * cz + d < -radius:
+                return False
+        return True
+
+    def is_visible(self, model: Model, transform: Matrix4 = IDENTITY) -> bool:
+        """
+        Whether the bounding sphere of a model placed by the transformation is
+        inside the view frustum.
+        """
+        (x, y, z), radius = model.bounding_sphere
+        center = transform_point(transform, x, y, z)
+        return self.sphere_visible(center[:3], radius * max_scale(transform))  # type: ignore
+
+    def to_clip_space(self, model: Model, transform: Matrix4 = IDENTITY) -> List[ClipVertex]:
+        """
+        Transforms every vertex of a model into homogeneous clip space.
+        """
+        v = model.vertices
+        return self._transform(
+            zip(v[0::3], v[1::3], v[2::3]), multiply(transform, self.view_projection)
+        )
+
+    @staticmethod
+    def _transform(points: Iterable[Vertex], m: Matrix4) -> List[ClipVertex]:
+        m0, m1, m2, m3, m4, m5, m6, m7, m8, m9, m10, m11, m12, m13, m14, m15 = m
+        return [
+            (
+                x * m0 + y * m4 + z * m8 + m12,
+                x * m1 + y * m5 + z * m9 + m13,
+                x * m2 + y * m6 + z * m10 + m14,
+                x * m3 + y * m7 + z * m11 + m15,
+            )
+            for x, y, z in points
+        ]
+
+    def cull_instances(self, instances: Instances) -> List[Tuple[int, bool]]:
+        """
+        Culls every instance by its bounding sphere in one batch.
+
+        The sphere centers and radii of all instances are derived from strided
+        columns of the transformation array at once, then whittled down plane by
+        plane of the frustum.
+
+        :returns: (List[Tuple[:class:`int`, :class:`bool`]]) The index of every visible
+            instance and whether it is entirely inside the frustum.
+        """
+        (x, y, z), radius = instances.model.bounding_sphere
+        t = instances.transforms
+        centers = zip(
+            [x * a + y * b + z * c + d for a, b, c, d in zip(t[0::16], t[4::16], t[8::16], t[12::16])],
+            [x * a + y * b + z * c + d for a, b, c, d in zip(t[1::16], t[5::16], t[9::16], t[13::16])],
+            [x * a + y * b + z * c + d for a, b, c, d in zip(t[2::16], t[6::16], t[10::16], t[14::16])],
+            [
+                radius * sqrt(max(a * a + b * b + c * c, d * d + e * e + f * f, g * g + h * h + i * i))
+                for a, b, c, d, e, f, g, h, i in zip(
+                    t[0::16], t[1::16], t[2::16],
+                    t[4::16], t[5::16], t[6::16],
+                    t[8::16], t[9::16], t[10::16],
+                )
+            ],
+        )
+        candidates = [(i, cx, cy, cz, r) for i, (cx, cy, cz, r) in enumerate(centers)]
+        partial = set()
+        for a, b, c, d in self.frustum:
+            kept = []
+            for item in candidates:
+                _, cx, cy, cz, r = item
+                distance = a * cx + b * cy + c * cz + d
+                if distance < -r:
+                    continue
+                if distance < r:
+                    partial.add(item[0])
+                kept.append(item)
+            candidates = kept
+        return [(item[0], item[0] not in partial) for item in candidates]
+
+    @staticmethod
+    def to_screen(c: ClipVertex, width: int, height: int) -> ScreenPoint:
+        """
+        The perspective divide and viewport mapping of a clipped vertex.
+        """
+        x, y, _, w = c
+        return (x / w + 1) * 0.5 * (width - 1), (1 - y / w) * 0.5 * (height - 1)
+
+    def project(
+        self, model: Model, width: int, height: int, transform: Matrix4 = IDENTITY
+    ) -> List[List[ScreenPoint]]:
+        """
+        Projects the triangles of a model onto a viewport of the given size.
+
+        Triangles crossing the frustum are clipped, which can leave polygons of
+        more than three vertices. Nothing is transformed when the model is culled.
+
+        :returns: (List[List[Tuple[:class:`float`, :class:`float`]]]) The visible polygons.
+        """
+        if not self.is_visible(model, transform):
+            return []
+
+        clip = self.to_clip_space(model, transform)
+        idx = model.indices
+        to_screen = self.to_screen
+        polygons = []
+        for i in range(0, len(idx), 3):
+            tri = (clip[idx[i]], clip[idx[i + 1]], clip[idx[i + 2]])
+            if not (_inside(tri[0]) and _inside(tri[1]) and _inside(tri[2])):
+                tri = clip_polygon(tri)  # type: ignore
+                if not tri:
+                    continue
+            polygons.append([to_screen(c, width, height) for c in tri])
+        return polygons
+
+    def render(
+        self,
+        screen,
+        model: Model,
+        transform: Matrix4 = IDENTITY,
+        texture: str = DEFAULT_BRICK,
+    ) -> bool:
+        """
+        Draws the wireframe of a model onto the screen.
+
+        :returns: (:class:`bool`) Whether the model was visible.
+        """
+        if not self.is_visible(model, transform):
+            return False
+
+        clip = self.to_clip_space(model, transform)
+        self._draw_edges(screen, clip, model.edges, texture)
+        return True
+
+    def render_instances(
+        self, screen, instances: Instances, texture: str = DEFAULT_BRICK
+    ) -> int:
+        """
+        Draws the wireframe of every visible instance onto the screen.
+
+        Instances are culled together with :meth:`Camera.cull_instances`, the mesh
+        data is unpacked once for the whole batch and instances entirely inside the
+        frustum skip clipping.
+
+        :returns: (:class:`int`) The number of instances drawn.
+        """
+        visible = self.cull_instances(instances)
+        if not visible:
+            return 0
+
+        v = instances.model.vertices
+        points = list(zip(v[0::3], v[1::3], v[2::3]))
+        edges = instances.model.edges
+        vp = self.view_projection
+        t = instances.transforms
+        for i, inside in visible:
+            clip = self._transform(points, multiply(tuple(t[i * 16 : i * 16 + 16]), vp))
+            self._draw_edges(screen, clip, edges, texture, inside)
+        return len(visible)
+
+    def _draw_edges(
+        self,
+        screen,
+        clip: List[ClipVertex],
+        edges: Sequence[int],
+        texture: str,
+        inside: bool = False,
+    ):
+        width, height = screen.width, screen.height
+        to_screen = self.to_screen
+        draw = screen.draw
+        for i in range(0, len(edges), 2):
+            a, b = clip[edges[i]], clip[edges[i + 1]]
+            if not inside and not (_inside(a) and _inside(b)):
+                segment = clip_segment(a, b)
+                if segment is None:
+                    continue
+                a, b = segment
+            for x, y in Line.get_points(to_screen(a, width, height), to_screen(b, width, height)):
+                draw((round(x), round(y)), texture)
@@ -1,8 +1,393 @@
+import os
+import struct
+import sys
+
+from array import array
+from math import sqrt
+from typing import Iterable, Iterator, Optional, Sequence, Tuple, Union
+
+__all__ = ["Model", "Cube", "Instances"]
+
+Vertex = Tuple[float, float, float]
+Triangle = Tuple[Vertex, Vertex, Vertex]
+BoundingSphere = Tuple[Vertex, float]
+
+# 32 bit indices regardless of the platform's C long size
+INDEX_TYPECODE = "I" if array("I").itemsize == 4 else "L"
+
+
 class Model:
-    pass
+    """
+    A triangle mesh held in two flat contiguous arrays.
+
+    Vertices are shared between triangles, :attr:`vertices` keeps the ``x, y, z``
+    of every vertex in sequence as 32 bit floats and :attr:`indices` keeps three
+    vertex indices per triangle.
+
+    .. code:: py
+
+       model = Model.from_cached_obj("teapot.obj")
+       for p1, p2, p3 in model.triangles():
+           ...
+
+    :param vertices:
+        A flat sequence of vertex components, ``[x0, y0, z0, x1, y1, z1, ...]``.
+    :type vertices: Iterable[:class:`float`]
+    :param indices:
+        A flat sequence of vertex indices, three per triangle.
+    :type indices: Iterable[:class:`int`]
+    """
+
+    CACHE_MAGIC = b"AMDL"
+    CACHE_VERSION = 1
+    # magic, version, vertex component count, index count
+    CACHE_HEADER = struct.Struct("<4sHII")
+
+    __slots__ = ("vertices", "indices", "_bounding_sphere", "_edges")
+
+    def __init__(self, vertices: Iterable[float], indices: Iterable[int]):
+        self.vertices = (
+            vertices
+            if isinstance(vertices, array) and vertices.typecode == "f"
+            else array("f", vertices)
+        )
+        self.indices = (
+            indices
+            if isinstance(indices, array) and indices.typecode == INDEX_TYPECODE
+            else array(INDEX_TYPECODE, indices)
+        )
+        self._bounding_sphere: Optional[BoundingSphere] = None
+        self._edges: Optional[array] = None
+
+        if len(self.vertices) % 3 != 0:
+            raise ValueError("vertex components must come in multiples of three")
+        if len(self.indices) % 3 != 0:
+            raise ValueError("indices must come in multiples of three")
+        if self.indices and max(self.indices) >= self.vertex_count:
+            raise ValueError("index out of range of the given vertices")
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} vertices={self.vertex_count} faces={self.face_count}>"
+
+    @property
+    def vertex_count(self) -> int:
+        return len(self.vertices) // 3
+
+    @property
+    def face_count(self) -> int:
+        return len(self.indices) // 3
+
+    @property
+    def bounding_sphere(self) -> BoundingSphere:
+        """
+        The center and radius of a sphere enclosing every vertex of the model, this
+        is calculated once on the first access.
+
+        :type: Tuple[Tuple[:class:`float`, :class:`float`, :class:`float`], :class:`float`]
+        """
+        if self._bounding_sphere is None:
+            verts = self.vertices
+            if not verts:
+                self._bounding_sphere = ((0.0, 0.0, 0.0), 0.0)
+            else:
+                xs, ys, zs = verts[0::3], verts[1::3], verts[2::3]
+                center = (
+                    (min(xs) + max(xs)) / 2,
+                    (min(ys) + max(ys)) / 2,
+                    (min(zs) + max(zs)) / 2,
+                )
+                cx, cy, cz = center
+                radius = sqrt(
+                    max(
+                        (x - cx) ** 2 + (y - cy) ** 2 + (z - cz) ** 2
+                        for x, y, z in zip(xs, ys, zs)
+                    )
+                )
+                self._bounding_sphere = (center, radius)
+        return self._bounding_sphere
+
+    @property
+    def edges(self) -> array:
+        """
+        The unique edges of the mesh as a flat array of vertex index pairs, an edge
+        shared by two triangles is listed once. This is calculated once on the
+        first access.
+
+        :type: :class:`array.array`
+        """
+        if self._edges is None:
+            idx = self.indices
+            unique = set()
+            for i in range(0, len(idx), 3):
+                a, b, c = idx[i], idx[i + 1], idx[i + 2]
+                unique.add((a, b) if a < b else (b, a))
+                unique.add((b, c) if b < c else (c, b))
+                unique.add((c, a) if c < a else (a, c))
+            self._edges = array(INDEX_TYPECODE, (i for edge in sorted(unique) for i in edge))
+        return self._edges
+
+    def vertex(self, index: int) -> Vertex:
+        """
+        The coordinate of a vertex at the given index.
+        """
+        i = index * 3
+        v = self.vertices
+        return v[i], v[i + 1], v[i + 2]
+
+    def triangles(self) -> Iterator[Triangle]:
+        """
+        Iterates over the coordinates of every triangle in the mesh.
+        """
+        v = self.vertices
+        points = list(zip(v[0::3], v[1::3], v[2::3]))
+        idx = self.indices
+        for i in range(0, len(idx), 3):
+            yield points[idx[i]], points[idx[i + 1]], points[idx[i + 2]]
+
+    @classmethod
+    def from_obj(cls, path: str) -> "Model":
+        """
+        Loads a mesh from a Wavefront OBJ file.
+
+        Only vertex positions and faces are read, texture coordinates and normals
+        are ignored. Faces with more than three vertices are triangulated as a fan.
+
+        :param path:
+            The path to the ``.obj`` file.
+        :type path: :class:`str`
+        """
+        vertices = array("f")
+        indices = array(INDEX_TYPECODE)
+        with open(path, "r") as f:
+            lines = f.read().splitlines()
+
+        vertex_count = 0
+        for lineno, line in enumerate(lines, 1):
+            # records are separated by any whitespace, tabs included
+            parts = line.split()
+            if not parts:
+                continue
+            if parts[0] == "v":
+                vertices.extend((float(parts[1]), float(parts[2]), float(parts[3])))
+                vertex_count += 1
+            elif parts[0] == "f":
+                face = []
+                for token in parts[1:]:
+                    i = int(token.split("/", 1)[0])
+                    # obj indices are 1 based, negative indices are relative to the end
+                    face.append(i - 1 if i > 0 else vertex_count + i)
+                if len(face) < 3:
+                    raise ValueError(f"{path}:{lineno} face has less than three vertices")
+                first = face[0]
+                for j in range(1, len(face) - 1):
+                    indices.extend((first, face[j], face[j + 1]))
+        return cls(vertices, indices)
+
+    @classmethod
+    def load(cls, path: str) -> "Model":
+        """
+        Loads a mesh from a binary cache file written by :meth:`Model.save`.
+
+        :param path:
+            The path to the cache file.
+        :type path: :class:`str`
+        """
+        with open(path, "rb") as f:
+            data = f.read()
+
+        header_size = cls.CACHE_HEADER.size
+        magic, version, n_verts, n_indices = cls.CACHE_HEADER.unpack_from(data)
+        if magic != cls.CACHE_MAGIC:
+            raise ValueError(f"{path} is not a model cache file")
+        if version != cls.CACHE_VERSION:
+            raise ValueError(f"{path} has an unsupported cache version {version}")
+
+        vertices = array("f")
+        indices = array(INDEX_TYPECODE)
+        vert_end = header_size + n_verts * vertices.itemsize
+        idx_end = vert_end + n_indices * indices.itemsize
+        if len(data) != idx_end:
+            raise ValueError(f"{path} is truncated or corrupted")
+
+        view = memoryview(data)
+        vertices.frombytes(view[header_size:vert_end])
+        indices.frombytes(view[vert_end:idx_end])
+        if sys.byteorder == "big":
+            vertices.byteswap()
+            indices.byteswap()
+        return cls(vertices, indices)
+
+    def save(self, path: str):
+        """
+        Writes the mesh into a compact binary cache file that can be read back
+        with :meth:`Model.load`.
+
+        :param path:
+            The path to the cache file.
+        :type path: :class:`str`
+        """
+        vertices, indices = self.vertices, self.indices
+        if sys.byteorder == "big":
+            vertices, indices = array("f", vertices), array(INDEX_TYPECODE, indices)
+            vertices.byteswap()
+            indices.byteswap()
+
+        with open(path, "wb") as f:
+            f.write(
+                self.CACHE_HEADER.pack(
+                    self.CACHE_MAGIC, self.CACHE_VERSION, len(vertices), len(indices)
+                )
+            )
+            vertices.tofile(f)
+            indices.tofile(f)
+
+    @classmethod
+    def from_cached_obj(cls, path: str, cache_path: Optional[str] = None) -> "Model":
+        """
+        Loads a Wavefront OBJ file through a binary cache. The cache is rewritten
+        whenever it is missing or older than the OBJ file.
+
+        :param path:
+            The path to the ``.obj`` file.
+        :type path: :class:`str`
+        :param cache_path:
+            The path to the cache file. Defaults to the OBJ path with an ``.amdl`` suffix.
+        :type cache_path: Optional[:class:`str`]
+        """
+        if cache_path is None:
+            cache_path = os.path.splitext(path)[0] + ".amdl"
+
+        try:
+            if os.path.getmtime(cache_path) >= os.path.getmtime(path):
+                return cls.load(cache_path)
+        except (OSError, ValueError):
+            pass
+
+        model = cls.from_obj(path)
+        try:
+            model.save(cache_path)
+        except OSError:
+            pass
+        return model
+
+
+class Cube(Model):
+    """
+    A cube mesh of eight shared vertices and twelve triangles.
+
+    :param length:
+        The length of each side.
+    :type length: :class:`float`
+    :param coordinate:
+        The corner of the cube with the smallest coordinates.
+    :type coordinate: Tuple[:class:`float`, :class:`float`, :class:`float`]
+    """
+
+    # corners of a unit cube, indexed by the bits x | y << 1 | z << 2
+    CORNERS = tuple((i & 1, (i >> 1) & 1, (i >> 2) & 1) for i in range(8))
+    FACES = (
+        0, 2, 3, 0, 3, 1,  # front
+        1, 3, 7, 1, 7, 5,  # right
+        5, 7, 6, 5, 6, 4,  # back
+        4, 6, 2, 4, 2, 0,  # left
+        2, 6, 7, 2, 7, 3,  # top
+        5, 4, 0, 5, 0, 1,  # bottom
+    )
+
+    __slots__ = ("length",)
+
+    def __init__(self, length: float = 1.0, coordinate: Vertex = (0.0, 0.0, 0.0)):
+        self.length = length
+        ox, oy, oz = coordinate
+        super().__init__(
+            (
+                c
+                for x, y, z in self.CORNERS
+                for c in (ox + x * length, oy + y * length, oz + z * length)
+            ),
+            self.FACES,
+        )
+
+
+class Instances:
+    """
+    Many copies of one shared :class:`Model`, each placed by its own 4x4 transformation.
+
+    The transformations are kept in one flat contiguous array of sixteen floats per
+    instance so a :class:`~Asciinpy._3D.camera.Camera` can cull and project every
+    instance in a single batch with :meth:`~Asciinpy._3D.camera.Camera.render_instances`.
+
+    .. code:: py
+
+       cubes = Instances(Cube(), [translation(x * 2, 0, z * 2) for x in range(20) for z in range(20)])
+       camera.render_instances(screen, cubes)
+
+    :param model:
+        The mesh shared by all instances.
+    :type model: :class:`Model`
+    :param transforms:
+        An ``(N, 4, 4)`` nested sequence of row-major transformations, or the same
+        values flattened into ``16 * N`` floats.
+    :type transforms: Union[Sequence[Sequence[float]], Iterable[:class:`float`]]
+    """
+
+    __slots__ = ("model", "transforms")
+
+    def __init__(
+        self,
+        model: Model,
+        transforms: Union[Sequence[Sequence[float]], Iterable[float]] = (),
+    ):
+        self.model = model
+        if isinstance(transforms, array):
+            flat = transforms if transforms.typecode == "d" else array("d", transforms)
+        else:
+            flat = array("d")
+            for item in transforms:
+                if isinstance(item, (int, float)):
+                    flat.append(item)
+                else:
+                    for row in item:
+                        if isinstance(row, (int, float)):
+                            flat.append(row)
+                        else:
+                            flat.extend(row)
+        if len(flat) % 16 != 0:
+            raise ValueError("transforms must be made of 4x4 matrices")
+        self.transforms = flat
+
+    def __len__(self) -> int:
+        return len(self.transforms) // 16
 
+    def __getitem__(self, index: int) -> Tuple[float, ...]:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("instance index out of range")
+        return tuple(self.transforms[index * 16 : index * 16 + 16])
 
-class Cube:
-    pass
+    def __setitem__(self, index: int, transform: Union[Sequence[float], Sequence[Sequence[float]]]):
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("instance index out of range")
+        self.transforms[index * 16 : index * 16 + 16] = self._flatten(transform)
 
+    def append(self, transform: Union[Sequence[float], Sequence[Sequence[float]]]):
+        """
+        Adds another instance placed by the given transformation, either sixteen floats
+        as made by :mod:`~Asciinpy._3D.transforms` or four rows of four.
+        """
+        self.transforms.extend(self._flatten(transform))
 
+    @staticmethod
+    def _flatten(transform: Union[Sequence[float], Sequence[Sequence[float]]]) -> array:
+        if len(transform) == 4:
+            flat = array("d")
+            for row in transform:
+                flat.extend(row)  # type: ignore
+        else:
+            flat = array("d", transform)  # type: ignore
+        if len(flat) != 16:
+            raise ValueError("transform must be a 4x4 matrix")
+        return flat
@@ -0,0 +1,136 @@
+"""
+4x4 affine transformations for 3D models.
+
+Matrices are flat row-major tuples of sixteen floats and points are
+treated as row vectors, ``[x, y, z, 1] * M``, the translation lives in the
+last row.
+"""
+
+from math import cos, sin, sqrt
+from typing import Tuple
+
+__all__ = [
+    "IDENTITY",
+    "multiply",
+    "compose",
+    "translation",
+    "scaling",
+    "rotation_x",
+    "rotation_y",
+    "rotation_z",
+    "transform_point",
+    "max_scale",
+]
+
+Matrix4 = Tuple[float, ...]
+
+IDENTITY: Matrix4 = (
+    1.0, 0.0, 0.0, 0.0,
+    0.0, 1.0, 0.0, 0.0,
+    0.0, 0.0, 1.0, 0.0,
+    0.0, 0.0, 0.0, 1.0,
+)
+
+
+def multiply(a: Matrix4, b: Matrix4) -> Matrix4:
+    """
+    The product ``a * b``, applying ``a`` first and ``b`` after.
+    """
+    b0, b1, b2, b3, b4, b5, b6, b7, b8, b9, b10, b11, b12, b13, b14, b15 = b
+    out = []
+    for r in range(0, 16, 4):
+        a0, a1, a2, a3 = a[r], a[r + 1], a[r + 2], a[r + 3]
+        out.append(a0 * b0 + a1 * b4 + a2 * b8 + a3 * b12)
+        out.append(a0 * b1 + a1 * b5 + a2 * b9 + a3 * b13)
+        out.append(a0 * b2 + a1 * b6 + a2 * b10 + a3 * b14)
+        out.append(a0 * b3 + a1 * b7 + a2 * b11 + a3 * b15)
+    return tuple(out)
+
+
+def compose(*matrices: Matrix4) -> Matrix4:
+    """
+    Chains the transformations in the order they are given.
+    """
+    result = IDENTITY
+    for m in matrices:
+        result = multiply(result, m)
+    return result
+
+
+def translation(x: float, y: float, z: float) -> Matrix4:
+    return (
+        1.0, 0.0, 0.0, 0.0,
+        0.0, 1.0, 0.0, 0.0,
+        0.0, 0.0, 1.0, 0.0,
+        x, y, z, 1.0,
+    )
+
+
+def scaling(x: float, y: float = None, z: float = None) -> Matrix4:  # type: ignore
+    """
+    A scale on each axis, a single argument scales uniformly.
+    """
+    y = x if y is None else y
+    z = x if z is None else z
+    return (
+        x, 0.0, 0.0, 0.0,
+        0.0, y, 0.0, 0.0,
+        0.0, 0.0, z, 0.0,
+        0.0, 0.0, 0.0, 1.0,
+    )
+
+
+def rotation_x(theta: float) -> Matrix4:
+    c, s = cos(theta), sin(theta)
+    return (
+        1.0, 0.0, 0.0, 0.0,
+        0.0, c, s, 0.0,
+        0.0, -s, c, 0.0,
+        0.0, 0.0, 0.0, 1.0,
+    )
+
+
+def rotation_y(theta: float) -> Matrix4:
+    c, s = cos(theta), sin(theta)
+    return (
+        c, 0.0, -s, 0.0,
+        0.0, 1.0, 0.0, 0.0,
+        s, 0.0, c, 0.0,
+        0.0, 0.0, 0.0, 1.0,
+    )
+
+
+def rotation_z(theta: float) -> Matrix4:
+    c, s = cos(theta), sin(theta)
+    return (
+        c, s, 0.0, 0.0,
+        -s, c, 0.0, 0.0,
+        0.0, 0.0, 1.0, 0.0,
+        0.0, 0.0, 0.0, 1.0,
+    )
+
+
+def transform_point(m: Matrix4, x: float, y: float, z: float) -> Tuple[float, float, float, float]:
+    """
+    The homogeneous coordinate of ``[x, y, z, 1] * m``.
+    """
+    return (
+        x * m[0] + y * m[4] + z * m[8] + m[12],
+        x * m[1] + y * m[5] + z * m[9] + m[13],
+        x * m[2] + y * m[6] + z * m[10] + m[14],
+        x * m[3] + y * m[7] + z * m[11] + m[15],
+    )
+
+
+def max_scale(m: Matrix4) -> float:
+    """
+    The largest factor the transformation stretches a length by, used to grow
+    bounding spheres.
+    """
+    return sqrt(
+        max(
+            m[0] * m[0] + m[1] * m[1] + m[2] * m[2],
+            m[4] * m[4] + m[5] * m[5] + m[6] * m[6],
+            m[8] * m[8] + m[9] * m[9] + m[10] * m[10],
+        )
+    )
@@ -30,11 +30,57 @@ TODO: Support enlargement in Planes
 
 __version__ = "0.2.0"
 
-from .devices import *
-from .events import *
-from .geometry import *
-from .globals import *
-from .objects import *
-from .screen import *
-from .types import *
-from .values import *
+from importlib import import_module
+
+# the public names of each submodule, they are imported on first access so that
+# importing the package alone stays cheap and free of side effects
+_EXPORTS = {
+    "clock": ("Clock", "VirtualClock"),
+    "devices": ("Keyboard", "KeyReader", "KeyParser", "Microphone", "Audio", "Mouse"),
+    "events": (
+        "Event",
+        "EventListener",
+        "Dispatcher",
+        "EventQueue",
+        "EventStream",
+        "Backpressure",
+        "Throttle",
+        "LatestPerFrame",
+        "RateLimit",
+        "ON_TERMINATE",
+        "ON_START",
+        "ON_RESIZE",
+        "ON_KEY_PRESS",
+        "ON_KEY_RELEASE",
+        "ON_MOUSE_CLICK",
+    ),
+    "geometry": ("Line", "rotate"),
+    "globals": ("Platform",),
+    "objects": ("Blitable", "Pixel"),
+    "screen": ("Window", "Screen", "AsyncConsoleInterface"),
+    "shading": ("Shader",),
+    "types": ("AnyInt", "T", "Coordinate", "IntCoordinate", "AnyIntCoordinate"),
+    "values": ("ColorLayer", "ColorDepth", "Color", "WINDOW_COLOR_HEXES", "Characters", "Resolutions", "ANSI"),
+}
+_LOCATIONS = {name: module for module, names in _EXPORTS.items() for name in names}
+
+__all__ = list(_LOCATIONS)
+
+# the submodule Asciinpy.globals shadows the builtin once it is imported
+_namespace = globals()
+
+
+def __getattr__(name: str):
+    module = _LOCATIONS.get(name)
+    if module is None:
+        if name in _EXPORTS or name in ("utils", "tools", "_2D", "_3D"):
+            return import_module(f".{name}", __name__)
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{module}", __name__), name)
+    # cached so the next access skips this hook
+    _namespace[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(_namespace) | set(_LOCATIONS))
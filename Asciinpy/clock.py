@@ -0,0 +1,106 @@
+"""
+The clocks a screen reads the time from and paces its frames with.
+"""
+
+from time import monotonic, perf_counter_ns, sleep, time
+
+
+__all__ = ["Clock", "VirtualClock"]
+
+
+class Clock:
+    """
+    The wall clock, the default clock of a :class:`~Asciinpy.screen.Screen`.
+
+    A screen reads the fps, ticks, timers and its forcestop off its clock and
+    sleeps on it to honour ``max_fps``. Give a :class:`VirtualClock` to a
+    :class:`~Asciinpy.screen.Window` to run its loop without wall clock time.
+    """
+
+    __slots__ = ()
+
+    def time(self) -> float:
+        """
+        The current time in seconds.
+        """
+        return time()
+
+    def perf_counter_ns(self) -> int:
+        """
+        A monotonic reading in nanoseconds that frames are timed with.
+        """
+        return perf_counter_ns()
+
+    def monotonic(self) -> float:
+        """
+        A monotonic reading in seconds that event throttles and key timeouts are timed with,
+        the same as :func:`time.monotonic` they fall back to without a clock.
+        """
+        return monotonic()
+
+    def sleep(self, seconds: float):
+        sleep(seconds)
+
+    async def sleep_async(self, seconds: float):
+        import asyncio
+
+        await asyncio.sleep(seconds)
+
+    def advance(self):
+        """
+        Called by the screen every time a frame has been written out.
+        """
+
+
+class VirtualClock(Clock):
+    """
+    A clock that only moves forward by a fixed step per frame, and by whatever it is
+    asked to sleep for, without ever waiting.
+
+    The client loop runs as fast as it can while every frame lasts exactly one step
+    to the screen, so a run is reproduced frame for frame along with its fps,
+    timers and frame metrics.
+
+    .. code:: py
+
+       window = Window(Resolutions.Basic, clock=VirtualClock(1 / 60))
+
+    :param step:
+        The seconds every frame lasts.
+    :type step: :class:`float`
+    :param start:
+        The time in seconds the clock starts at.
+    :type start: :class:`float`
+    """
+
+    __slots__ = ("step", "_now")
+
+    def __init__(self, step: float = 1 / 60, start: float = 0.0):
+        if step <= 0:
+            raise ValueError("step must be positive")
+        # kept in whole nanoseconds so the time adds up the same on every run
+        self.step = round(step * 1e9)
+        self._now = round(start * 1e9)
+
+    def time(self) -> float:
+        return self._now / 1e9
+
+    def perf_counter_ns(self) -> int:
+        return self._now
+
+    def monotonic(self) -> float:
+        return self._now / 1e9
+
+    def sleep(self, seconds: float):
+        if seconds > 0:
+            self._now += round(seconds * 1e9)
+
+    async def sleep_async(self, seconds: float):
+        import asyncio
+
+        self.sleep(seconds)
+        # still lets the other tasks of the event loop run
+        await asyncio.sleep(0)
+
+    def advance(self):
+        self._now += self.step
@@ -1,18 +1,18 @@
+import atexit
+import os
 import sys
 
-from io import BytesIO
-from typing import Callable, Optional
+from time import monotonic, perf_counter_ns
+from typing import Dict, List, Optional
 from enum import Enum
 
 from Asciinpy.globals import Platform
 
-from .utils import praised
+from .utils import Tracer, praised
 from .events import ON_KEY_PRESS, ON_KEY_RELEASE
 from .values import ANSI
 
-__all__ = ["Keyboard", "Microphone", "Audio", "Mouse"]
-
-CharacterGetter = Callable[[], Optional[bytes]]
+__all__ = ["Keyboard", "KeyReader", "KeyParser", "Microphone", "Audio", "Mouse"]
 
 
 @praised("0.4.0")
@@ -20,121 +20,68 @@ class RawMouseInput:
     pass
 
 
-class RawKeyInput:
-    """
-    A raw key buffer before it gets filtered into the main keyboard class.
-    """
-
-    cmd_buffer: Optional[BytesIO] = None  # keeps track of any escape sequences
-    line_buffer: Optional[
-        BytesIO
-    ] = None  # keeps track of a record until return is pressed
-
-
-def is_alphanumeric(bytes):
-    denary_val = int.from_bytes(bytes, byteorder=sys.byteorder)
-    if (denary_val < 32 or denary_val > 126) and denary_val != 10:
-        return False
-    return True
-
-
-def get_getch() -> CharacterGetter:
-    """
-    Getch gets us a key press focused in the console, since python doesn't have a default method for that
-    nor an OS independent one for that matter, we will have to make the getch method based on the OS.
-    """
-    if Platform.is_window:
-        # Windows machine
-        import msvcrt
-
-        def _win_getch():
-            key = None
-            if msvcrt.kbhit():
-                key = msvcrt.getch()
-            return key
-
-        return _win_getch
-    else:
-        import termios
-        import tty
-
-        def _unix_getch():
-            fd = sys.stdin.fileno()
-            old_settings = termios.tcgetattr(fd)  # type: ignore
-            try:
-                tty.setraw(fd)  # type: ignore
-                ch = sys.stdin.read(1)
-            finally:
-                termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)  # type: ignore
-            return ch.encode()
-
-        return _unix_getch
-
-
-def warp_buffer_getch(getch_method: Callable):
-    """
-    Wraps the getch method with necessary buffering
-    """
-    def wrapped(*args, **kwargs) -> Optional[bytes]:
-        ch = getch_method(*args, **kwargs)
-        if ch is None:
-            return
-
-        if ch == ANSI.WIN_INTERUPT.encode():
-            raise KeyboardInterrupt
-
-        if RawKeyInput.cmd_buffer is not None:
-            past = RawKeyInput.cmd_buffer.getvalue()
-            RawKeyInput.cmd_buffer = None
-            try:
-                return past+ch
-            except:
-                raise RuntimeError(past + ch)
-        elif not is_alphanumeric(ch):
-            if RawKeyInput.cmd_buffer is None:
-                RawKeyInput.cmd_buffer = BytesIO()
-                RawKeyInput.cmd_buffer.write(ch)
-            return
-
-        if RawKeyInput.line_buffer is not None:
-            past = RawKeyInput.line_buffer.getvalue()
-            RawKeyInput.line_buffer.write(ch)
-            if ch in b"\n\r":
-                l_buf = RawKeyInput.line_buffer.getvalue()
-                RawKeyInput.line_buffer = None
-                return l_buf
-        elif RawKeyInput.line_buffer is None:  # start a line buffer
-            RawKeyInput.line_buffer = BytesIO()
-            RawKeyInput.line_buffer.write(ch)
-
-        return ch
-
-    return wrapped
-
-
 class Keyboard:
     # is_pressed and is_released are universal flags under `Keyboard` but they exist as a flag
     # under each `Key`
     is_pressed = False
     pressed = None
     _thread = None
-    _getch = warp_buffer_getch(get_getch())
+    _reader: Optional["KeyReader"] = None
 
     @staticmethod
-    def getch(*args, **kwargs):
-        ch = Keyboard._getch(*args, **kwargs)
+    def reader() -> "KeyReader":
+        """
+        The reader of the console keyboard, made on first use.
+        """
+        if Keyboard._reader is None:
+            Keyboard._reader = KeyReader()
+        return Keyboard._reader
 
-        if ch is not None:
-            Keyboard.pressed = Keyboard.Keys._value2member_map_.get(ch, Keyboard.Keys.NullByte)
-            Keyboard.is_pressed = True
-            ON_KEY_PRESS.emit(Keyboard.pressed)
+    @staticmethod
+    def getch(*args, now: Optional[float] = None, **kwargs):
+        """
+        Presses every key that was typed since the last call, or releases the held key
+        when there were none. This never waits for input.
+
+        :param now:
+            The time in seconds a lone escape is timed out against, see :meth:`KeyReader.poll`.
+        :type now: Optional[:class:`float`]
+        """
+        keys = Keyboard.reader().poll(now)
+        if keys:
+            Keyboard.press(*keys)
         else:
-            if Keyboard.is_pressed:
-                ON_KEY_RELEASE.emit(Keyboard.pressed)
-            Keyboard.pressed = None
-            Keyboard.is_pressed = False
+            Keyboard.release()
         return Keyboard.pressed
 
+    @staticmethod
+    def feed(data: bytes, now: Optional[float] = None):
+        """
+        Resolves raw input bytes that were read elsewhere, e.g. by an asyncio reader,
+        into key presses.
+        """
+        Keyboard.press(*Keyboard.reader().parser.feed(data, now))
+
+    @staticmethod
+    def press(*keys: "Keyboard.Keys"):
+        """
+        Presses the keys in order, the last one is left held.
+        """
+        for key in keys:
+            Keyboard.pressed = key
+            Keyboard.is_pressed = True
+            ON_KEY_PRESS.emit(key)
+
+    @staticmethod
+    def release():
+        """
+        Releases the key currently held, if any.
+        """
+        if Keyboard.is_pressed:
+            ON_KEY_RELEASE.emit(Keyboard.pressed)
+        Keyboard.pressed = None
+        Keyboard.is_pressed = False
+
     class Keys(Enum):
         # the general byte representation of each keys
         A = b"a"
@@ -227,10 +174,354 @@ class Keyboard:
         Backspace = b"\x08"
         Insert = TTF + b"R"
         Delete = TTF + b"S"
+        Escape = b"\x1b"
         PrtScr = "UNDEFINED-1"
         Break = "UNDEFINED-2"
 
 
+class ByteRing:
+    """
+    A fixed capacity ring buffer of bytes, the oldest bytes are overwritten when
+    it overflows.
+    """
+
+    __slots__ = ("_buffer", "_start", "_size", "dropped")
+
+    def __init__(self, capacity: int = 4096):
+        self._buffer = bytearray(capacity)
+        self._start = 0
+        self._size = 0
+        self.dropped = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def capacity(self) -> int:
+        return len(self._buffer)
+
+    def write(self, data: bytes):
+        capacity = len(self._buffer)
+        if len(data) >= capacity:
+            self.dropped += self._size + len(data) - capacity
+            self._buffer[:] = data[-capacity:]
+            self._start, self._size = 0, capacity
+            return
+
+        overflow = self._size + len(data) - capacity
+        if overflow > 0:
+            self.dropped += overflow
+            self._start = (self._start + overflow) % capacity
+            self._size -= overflow
+
+        end = (self._start + self._size) % capacity
+        first = min(len(data), capacity - end)
+        self._buffer[end : end + first] = data[:first]
+        self._buffer[: len(data) - first] = data[first:]
+        self._size += len(data)
+
+    def read(self) -> bytes:
+        """
+        Takes every byte out of the buffer.
+        """
+        start, end = self._start, self._start + self._size
+        if end <= len(self._buffer):
+            data = bytes(self._buffer[start:end])
+        else:
+            data = bytes(self._buffer[start:]) + bytes(self._buffer[: end - len(self._buffer)])
+        self._start, self._size = 0, 0
+        return data
+
+
+class KeyParser:
+    """
+    An incremental state machine that turns terminal input bytes into
+    :class:`Keyboard.Keys`.
+
+    Bytes can arrive in any chunking, an escape sequence split over several reads is
+    resumed where it was left. A lone escape is only reported once no sequence has
+    followed it for :attr:`ESCAPE_TIMEOUT` seconds, see :meth:`KeyParser.flush`.
+
+    :param windows:
+        Whether the bytes come from the Windows console, which prefixes special keys
+        with ``\\x00`` or ``\\xe0`` instead of using escape sequences.
+    :type windows: :class:`bool`
+    """
+
+    GROUND, ESCAPE, CSI, SS3, PREFIX = range(5)
+    ESCAPE_TIMEOUT = 0.05
+
+    _single: Dict[int, "Keyboard.Keys"] = {}
+    _csi: Dict[bytes, "Keyboard.Keys"] = {}
+    _tilde: Dict[bytes, "Keyboard.Keys"] = {}
+
+    __slots__ = ("windows", "state", "_params", "_escaped_at")
+
+    def __init__(self, windows: bool = Platform.is_window):
+        if not KeyParser._single:
+            KeyParser._build_tables()
+        self.windows = windows
+        self.state = self.GROUND
+        self._params = bytearray()
+        self._escaped_at = 0.0
+
+    @staticmethod
+    def _build_tables():
+        keys = Keyboard.Keys
+        single = {
+            member.value[0]: member
+            for member in keys
+            if isinstance(member.value, bytes) and len(member.value) == 1
+        }
+        for c in range(ord("A"), ord("Z") + 1):
+            single[c] = single[c + 32]
+        single[ord(" ")] = keys.Space
+        single[ord("\r")] = single[ord("\n")] = keys.Return
+        single[0x7F] = keys.Backspace
+        del single[keys.Escape.value[0]]
+        del single[keys.NullByte.value[0]]
+        del single[keys.TTF.value[0]]
+        KeyParser._single = single
+
+        KeyParser._csi = {
+            b"A": keys.UpArrow,
+            b"B": keys.DownArrow,
+            b"C": keys.RightArrow,
+            b"D": keys.LeftArrow,
+            b"H": keys.Home,
+            b"F": keys.End,
+            b"P": keys.F1,
+            b"Q": keys.F2,
+            b"R": keys.F3,
+            b"S": keys.F4,
+        }
+        KeyParser._tilde = {
+            b"1": keys.Home,
+            b"2": keys.Insert,
+            b"3": keys.Delete,
+            b"4": keys.End,
+            b"5": keys.PageUp,
+            b"6": keys.PageDown,
+            b"7": keys.Home,
+            b"8": keys.End,
+            b"15": keys.F5,
+            b"17": keys.F6,
+            b"18": keys.F7,
+            b"19": keys.F8,
+            b"20": keys.F9,
+            b"21": keys.F10,
+            b"23": keys.F11,
+            b"24": keys.F12,
+        }
+
+    def feed(self, data: bytes, now: Optional[float] = None) -> List["Keyboard.Keys"]:
+        """
+        Parses the next chunk of input.
+
+        :returns: (List[:class:`Keyboard.Keys`]) The keys completed by this chunk.
+        """
+        keys = []
+        single = self._single
+        state = self.state
+        if state == self.ESCAPE and data:
+            if now is None:
+                now = monotonic()
+            if now - self._escaped_at >= self.ESCAPE_TIMEOUT:
+                # the escape timed out before this chunk came, it was pressed on its own
+                keys.append(Keyboard.Keys.Escape)
+                state = self.GROUND
+        for byte in data:
+            if state == self.GROUND:
+                if byte == 0x1B:
+                    state = self.ESCAPE
+                    self._escaped_at = monotonic() if now is None else now
+                elif byte == 0x03:
+                    self.state = state
+                    raise KeyboardInterrupt
+                elif self.windows and byte in (0x00, 0xE0):
+                    self._params = bytearray((byte,))
+                    state = self.PREFIX
+                else:
+                    key = single.get(byte)
+                    if key is not None:
+                        keys.append(key)
+            elif state == self.ESCAPE:
+                if byte == 0x5B:  # [
+                    self._params = bytearray()
+                    state = self.CSI
+                elif byte == 0x4F:  # O
+                    state = self.SS3
+                elif byte == 0x1B:
+                    keys.append(Keyboard.Keys.Escape)
+                    self._escaped_at = monotonic() if now is None else now
+                else:
+                    # alt modified keys come through as escape and the key
+                    state = self.GROUND
+                    key = single.get(byte)
+                    if key is not None:
+                        keys.append(key)
+            elif state == self.CSI:
+                if 0x40 <= byte <= 0x7E:
+                    state = self.GROUND
+                    if byte == 0x7E:  # ~
+                        key = self._tilde.get(bytes(self._params.split(b";")[0]))
+                    else:
+                        key = self._csi.get(bytes((byte,)))
+                    if key is not None:
+                        keys.append(key)
+                elif len(self._params) < 16:
+                    self._params.append(byte)
+                else:
+                    # runaway sequence, give up on it
+                    state = self.GROUND
+            elif state == self.SS3:
+                state = self.GROUND
+                key = self._csi.get(bytes((byte,)))
+                if key is not None:
+                    keys.append(key)
+            elif state == self.PREFIX:
+                state = self.GROUND
+                self._params.append(byte)
+                key = Keyboard.Keys._value2member_map_.get(bytes(self._params))
+                if key is not None:
+                    keys.append(key)
+        self.state = state
+        return keys
+
+    def flush(self, now: Optional[float] = None) -> List["Keyboard.Keys"]:
+        """
+        Resolves a lone escape once it has waited out :attr:`ESCAPE_TIMEOUT`.
+        """
+        if self.state == self.ESCAPE:
+            now = monotonic() if now is None else now
+            if now - self._escaped_at >= self.ESCAPE_TIMEOUT:
+                self.state = self.GROUND
+                return [Keyboard.Keys.Escape]
+        return []
+
+
+class KeyReader:
+    """
+    A persistent non-blocking reader of the console keyboard.
+
+    :meth:`KeyReader.open` puts the terminal into cbreak mode once, for as long as the
+    window runs, instead of switching modes around every key. :meth:`KeyReader.poll`
+    takes every byte that is already available in bulk into a :class:`ByteRing`,
+    checking with ``select`` first so a frame never waits on input, and parses them
+    with a :class:`KeyParser`.
+    """
+
+    READ_SIZE = 1024
+
+    __slots__ = ("fd", "ring", "parser", "eof", "_tty_attrs")
+
+    def __init__(self, fd: Optional[int] = None, capacity: int = 4096):
+        if fd is None:
+            try:
+                fd = sys.stdin.fileno()
+            except (AttributeError, ValueError, OSError):
+                fd = -1
+        self.fd = fd
+        self.ring = ByteRing(capacity)
+        self.parser = KeyParser()
+        self.eof = False
+        self._tty_attrs = None
+
+    @property
+    def is_open(self) -> bool:
+        return self._tty_attrs is not None
+
+    def open(self):
+        """
+        Switches the terminal into cbreak mode until :meth:`KeyReader.close`, this is a
+        no-op on Windows and when stdin isn't a terminal.
+        """
+        if Platform.is_window or self._tty_attrs is not None:
+            return
+        if self.fd < 0 or not os.isatty(self.fd):
+            return
+
+        import termios
+        import tty
+
+        self._tty_attrs = termios.tcgetattr(self.fd)
+        tty.setcbreak(self.fd, termios.TCSANOW)
+        atexit.register(self.close)
+
+    def close(self):
+        """
+        Restores the terminal to the mode it was in before :meth:`KeyReader.open`.
+        """
+        if self._tty_attrs is None:
+            return
+
+        import termios
+
+        termios.tcsetattr(self.fd, termios.TCSADRAIN, self._tty_attrs)
+        self._tty_attrs = None
+        atexit.unregister(self.close)
+
+    def fill(self) -> int:
+        """
+        Moves every byte that can be read without blocking into the ring buffer.
+
+        :returns: (:class:`int`) The amount of bytes read.
+        """
+        read = 0
+        if Platform.is_window:
+            import msvcrt
+
+            while msvcrt.kbhit():  # type: ignore
+                ch = msvcrt.getch()  # type: ignore
+                self.ring.write(ch)
+                read += len(ch)
+            return read
+
+        if self.fd < 0 or self.eof:
+            return 0
+
+        from select import select
+
+        while select((self.fd,), (), (), 0)[0]:
+            data = os.read(self.fd, self.READ_SIZE)
+            if not data:
+                self.eof = True
+                break
+            self.ring.write(data)
+            read += len(data)
+            if len(data) < self.READ_SIZE:
+                break
+        return read
+
+    def poll(self, now: Optional[float] = None) -> List["Keyboard.Keys"]:
+        """
+        Reads and parses whatever input is available right now.
+
+        :param now:
+            The time in seconds, a screen passes the reading of its clock. The monotonic
+            clock is read when None.
+        :type now: Optional[:class:`float`]
+
+        :returns: (List[:class:`Keyboard.Keys`]) The keys typed since the last poll.
+        """
+        tracer = Tracer.active
+        start = perf_counter_ns() if tracer is not None else 0
+        read = self.fill()
+        if now is None:
+            now = monotonic()
+        keys = self.parser.feed(self.ring.read(), now) if len(self.ring) else []
+        keys.extend(self.parser.flush(now))
+        if tracer is not None and (read or keys):
+            tracer.span(
+                "keyboard",
+                "input",
+                start,
+                perf_counter_ns(),
+                {"bytes": read, "keys": [key.name for key in keys]},
+            )
+        return keys
+
+
 @praised("0.4.0")
 class Microphone:
     pass
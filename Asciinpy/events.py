@@ -1,16 +1,28 @@
 import signal
 
-from threading import Thread
-from typing import Any, Callable, Protocol, List
+from abc import ABCMeta, abstractmethod
+from collections import deque
+from enum import Enum
+from time import monotonic, perf_counter_ns
+from threading import Condition, Lock, RLock, Thread, current_thread, get_ident
+from traceback import print_exception
+from typing import Any, Callable, Deque, Dict, Optional, Protocol, List, Tuple
 from functools import partial
+from weakref import WeakMethod
 
-from Asciinpy.globals import Platform
-
-from .utils import isinstancemethod
+from .clock import Clock
+from .utils import Tracer, isinstancemethod
 
 __all__ = [
     "Event",
     "EventListener",
+    "Dispatcher",
+    "EventQueue",
+    "EventStream",
+    "Backpressure",
+    "Throttle",
+    "LatestPerFrame",
+    "RateLimit",
     "ON_TERMINATE",
     "ON_START",
     "ON_RESIZE",
@@ -21,66 +33,701 @@ __all__ = [
 
 Consumer = Callable[[Any], None]
 BoundConsumer = Callable[[object], None]
+Delivery = Tuple[tuple, dict]
 
 
 class ListeningFunc(Protocol):
     __threaded__: bool
+    __deferred__: bool
+    __batched__: bool
     __subscribes_to__: "Event"
     __call__: Callable[[Any], Any]
     __name__: str
 
 
+class WeakSubscriber:
+    """
+    A subscription of a bound method that doesn't keep its instance alive.
+
+    The subscription removes itself from the event once the instance is collected,
+    a delivery that was already queued for it is dropped.
+    """
+
+    __slots__ = ("method", "event", "__threaded__", "__deferred__", "__batched__", "__weakref__")
+
+    def __init__(self, method: Any, event: "Event"):
+        func = method.__func__
+        self.event = event
+        self.method = WeakMethod(method, self._unsubscribe)
+        self.__threaded__ = func.__threaded__
+        self.__deferred__ = func.__deferred__
+        self.__batched__ = func.__batched__
+
+    @property
+    def __name__(self) -> str:
+        return self.method.__func__.__name__  # type: ignore
+
+    def __call__(self, *args, **kwargs):
+        method = self.method()
+        if method is not None:
+            return method(*args, **kwargs)
+
+    def _unsubscribe(self, _):
+        event = self.event
+        # removed in place, a subscription made meanwhile on another thread is kept
+        with event._lock:
+            if self in event.subscribers:
+                event.subscribers.remove(self)  # type: ignore
+            event._mailboxes.pop(self, None)
+
+
 class EventListener:
+    """
+    A class whose methods can subscribe to events with :obj:`Event.listen`, every
+    instance subscribes its own bound methods when it is made.
+
+    The subscriber methods of a class are only looked up once, through the ``__dict__``
+    of each class in its MRO, and the subscriptions are weak so they are removed when
+    the instance is collected.
+    """
+
+    _subscriptions: Dict[type, Tuple[Tuple[str, "Event"], ...]] = {}
+
     def __new__(cls, *args, **kwargs):
         """
-        Filters callables that are marked a subscriber of an event to be registered as the callback.
+        Subscribes the methods that are marked a subscriber of an event.
         """
         obj = super().__new__(cls)
 
-        for item_name in dir(obj):
-            item = getattr(obj, item_name, None)
-            if callable(item):
-                is_subscriber = getattr(item, "__subscribes_to__", False)
-                if is_subscriber is not False:
-                    # the event itself is attached to __subscribes_to__ so we actually only
-                    # subscribes to the event on class __new__
-                    item.__subscribes_to__.subscribers.append(item)
+        subscriptions = EventListener._subscriptions.get(cls)
+        if subscriptions is None:
+            subscriptions = EventListener._subscriptions[cls] = cls._find_subscriptions()
+        for name, event in subscriptions:
+            event.subscribers.append(WeakSubscriber(getattr(obj, name), event))  # type: ignore
         return obj
 
+    @classmethod
+    def _find_subscriptions(cls) -> Tuple[Tuple[str, "Event"], ...]:
+        found: Dict[str, Optional["Event"]] = {}
+        for klass in cls.__mro__:
+            for name, item in vars(klass).items():
+                if name in found:
+                    # overridden by a subclass
+                    continue
+                # the event itself is attached to __subscribes_to__ by Event.listen
+                found[name] = getattr(item, "__subscribes_to__", None) if callable(item) else None
+        return tuple((name, event) for name, event in found.items() if event is not None)
+
+
+def _subscriber_name(cb: Any) -> str:
+    return getattr(cb, "__name__", type(cb).__name__)
+
+
+class Backpressure(Enum):
+    """
+    What an event does with a threaded delivery when the queue of a subscriber is full.
+
+    Members:
+        **DropOldest** - the oldest queued delivery is discarded to make room
+
+        **Block** - the emitter waits until the subscriber has caught up
+
+        **Coalesce** - the queue never grows past one pending delivery, a new one
+        replaces it
+    """
+
+    DropOldest = 0
+    Block = 1
+    Coalesce = 2
+
+
+class Throttle(metaclass=ABCMeta):
+    """
+    The base of the policies that merge the emissions of an event before they are
+    dispatched, see :attr:`Event.throttle`.
+
+    Held emissions are released when :attr:`Event.queue` is drained at the end of a
+    frame. Emissions that are held under the same ``key`` replace each other, only the
+    latest one is dispatched and :attr:`merged` counts the rest. A throttle keeps state
+    and must not be shared between events.
+
+    :param key:
+        Called with the arguments of an emission, emissions are only merged with those
+        of the same key. All emissions of the event are merged when None.
+    :type key: Optional[Callable[..., Hashable]]
+    """
+
+    __slots__ = ("key", "merged", "_held", "_lock")
+
+    def __init__(self, key: Optional[Callable[..., Any]] = None):
+        self.key = key
+        self.merged = 0
+        self._held: Dict[Any, Delivery] = {}
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._held)
+
+    @abstractmethod
+    def offer(self, args: tuple, kwargs: dict, now: float) -> bool:
+        """
+        Decides on an emission.
+
+        :returns: (:class:`bool`) True when it is to be dispatched right away, otherwise
+            it is held.
+        """
+
+    @abstractmethod
+    def take(self, now: float) -> List[Delivery]:
+        """
+        Releases the held emissions that are due.
+        """
+
+    def _hold(self, args: tuple, kwargs: dict):
+        key = None if self.key is None else self.key(*args, **kwargs)
+        with self._lock:
+            if key in self._held:
+                self.merged += 1
+            self._held[key] = (args, kwargs)
+
+    def _release(self) -> List[Delivery]:
+        with self._lock:
+            if not self._held:
+                return []
+            held, self._held = self._held, {}
+        return list(held.values())
+
+
+class LatestPerFrame(Throttle):
+    """
+    Holds every emission until the end of the frame, subscribers are then called once
+    with the latest arguments of each key.
+
+    .. code:: py
+
+       # key repeats of the same key are merged, distinct keys are all delivered
+       ON_KEY_PRESS.throttle = LatestPerFrame(key=lambda key: key)
+    """
+
+    __slots__ = ()
+
+    def offer(self, args: tuple, kwargs: dict, now: float) -> bool:
+        self._hold(args, kwargs)
+        return False
+
+    def take(self, now: float) -> List[Delivery]:
+        return self._release()
+
+
+class RateLimit(Throttle):
+    """
+    Dispatches at most ``per_second`` emissions a second. An emission that comes too
+    early is held, and merged with the ones after it, until the first frame end where
+    the event is allowed through again. The latest state is never lost.
+
+    :param per_second:
+        The maximum rate of dispatches.
+    :type per_second: :class:`float`
+    """
+
+    __slots__ = ("interval", "_next_at")
+
+    def __init__(self, per_second: float, key: Optional[Callable[..., Any]] = None):
+        if per_second <= 0:
+            raise ValueError("per_second must be positive")
+        super().__init__(key)
+        self.interval = 1 / per_second
+        self._next_at = 0.0
+
+    def offer(self, args: tuple, kwargs: dict, now: float) -> bool:
+        with self._lock:
+            if now >= self._next_at and not self._held:
+                self._next_at = now + self.interval
+                return True
+        self._hold(args, kwargs)
+        return False
+
+    def take(self, now: float) -> List[Delivery]:
+        with self._lock:
+            if not self._held or now < self._next_at:
+                return []
+            self._next_at = now + self.interval
+        return self._release()
+
+
+class Mailbox:
+    """
+    The ordered queue of deliveries of an event to one threaded subscriber.
+
+    A mailbox is handed to at most one worker of the :class:`Dispatcher` at a time,
+    which is what keeps the deliveries of a subscriber in the order they were emitted.
+    """
+
+    # deliveries ran before a busy mailbox yields its worker to the others
+    BATCH = 16
+
+    __slots__ = ("event", "callback", "queue", "scheduled", "owner", "_cond")
+
+    def __init__(self, event: "Event", callback: "ListeningFunc"):
+        self.event = event
+        self.callback = callback
+        self.queue: Deque[Delivery] = deque()
+        self.scheduled = False
+        self.owner: Optional[Thread] = None
+        self._cond = Condition(Lock())
+
+    def put(self, delivery: Delivery):
+        event = self.event
+        with self._cond:
+            queue = self.queue
+            if event.backpressure is Backpressure.Coalesce:
+                if queue:
+                    queue.clear()
+                    event.dropped += 1
+            elif len(queue) >= event.maxsize:
+                if event.backpressure is Backpressure.Block and self.owner is not current_thread():
+                    while len(queue) >= event.maxsize:
+                        self._cond.wait()
+                else:
+                    queue.popleft()
+                    event.dropped += 1
+            queue.append(delivery)
+            if self.scheduled:
+                return
+            self.scheduled = True
+        event.dispatcher.schedule(self)
+
+    def run(self):
+        """
+        Delivers queued events until the mailbox is empty or its batch is used up,
+        in which case it is rescheduled behind the other mailboxes.
+        """
+        self.owner = current_thread()
+        for _ in range(self.BATCH):
+            with self._cond:
+                if not self.queue:
+                    self.owner = None
+                    self.scheduled = False
+                    self._cond.notify_all()
+                    return
+                args, kwargs = self.queue.popleft()
+                self._cond.notify_all()
+            tracer = Tracer.active
+            start = perf_counter_ns() if tracer is not None else 0
+            try:
+                self.callback(*args, **kwargs)
+            except Exception as e:
+                print_exception(e.__class__, e, e.__traceback__)
+            except BaseException:
+                # the worker exits with it, the deliveries left are handed to another
+                self._release()
+                raise
+            if tracer is not None:
+                tracer.span(
+                    f"deliver {self.event.name}",
+                    "event",
+                    start,
+                    perf_counter_ns(),
+                    {"subscriber": _subscriber_name(self.callback)},
+                )
+        self.owner = None
+        self.event.dispatcher.schedule(self)
+
+    def _release(self):
+        with self._cond:
+            self.owner = None
+            pending = bool(self.queue)
+            if not pending:
+                self.scheduled = False
+                self._cond.notify_all()
+        if pending:
+            self.event.dispatcher.schedule(self)
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Blocks until every queued delivery has been made.
+        """
+        with self._cond:
+            return self._cond.wait_for(lambda: not self.scheduled, timeout)
+
+
+class Dispatcher:
+    """
+    A bounded pool of worker threads that threaded event subscribers are called on.
+
+    Workers are started lazily, up to ``workers`` of them, and are daemonic so they
+    never hold the process open.
+
+    :param workers:
+        The maximum number of worker threads.
+    :type workers: :class:`int`
+    """
+
+    __slots__ = ("workers", "_ready", "_cond", "_threads", "_idle")
+
+    def __init__(self, workers: int = 4):
+        if workers < 1:
+            raise ValueError("a dispatcher needs at least one worker")
+        self.workers = workers
+        self._ready: Deque[Mailbox] = deque()
+        self._cond = Condition(Lock())
+        self._threads: List[Thread] = []
+        self._idle = 0
+
+    def schedule(self, mailbox: Mailbox):
+        with self._cond:
+            self._ready.append(mailbox)
+            if self._idle == 0 and len(self._threads) < self.workers:
+                self._spawn()
+            else:
+                self._cond.notify()
+
+    def _spawn(self):
+        thread = Thread(
+            target=self._work,
+            name=f"Asciinpy-Dispatcher-{len(self._threads)}",
+            daemon=True,
+        )
+        self._threads.append(thread)
+        thread.start()
+
+    def _work(self):
+        try:
+            while True:
+                with self._cond:
+                    while not self._ready:
+                        self._idle += 1
+                        self._cond.wait()
+                        self._idle -= 1
+                    mailbox = self._ready.popleft()
+                mailbox.run()
+        finally:
+            # a subscriber raised SystemExit or alike, another worker takes this one's place
+            with self._cond:
+                self._threads.remove(current_thread())
+                if self._ready and self._idle == 0:
+                    self._spawn()
+
+
+class EventQueue:
+    """
+    A queue of deliveries to deferred subscribers that is drained on the main thread.
+
+    :meth:`Screen.refresh <Asciinpy.screen.Screen.refresh>` drains :attr:`Event.queue`
+    once per frame, so deferred subscribers run in emission order between frames and
+    never concurrently with the client loop. A batched subscriber is called once per
+    drain with the arguments of every delivery it had queued.
+
+    Emissions held back by an :attr:`Event.throttle` are released by the drain too,
+    before the deferred deliveries are made.
+    """
+
+    __slots__ = ("_pending", "_held", "_lock")
+
+    def __init__(self):
+        self._pending: Deque[Tuple["ListeningFunc", tuple, dict]] = deque()
+        self._held: Dict["Event", None] = {}
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def post(self, cb: "ListeningFunc", args: tuple, kwargs: dict):
+        with self._lock:
+            self._pending.append((cb, args, kwargs))
+
+    def hold(self, event: "Event"):
+        """
+        Marks a throttled event as having emissions to release on the next drain.
+        """
+        with self._lock:
+            self._held[event] = None
+
+    def _release(self):
+        with self._lock:
+            if not self._held:
+                return
+            held, self._held = self._held, {}
+
+        now = Event.now()
+        for event in held:
+            throttle = event.throttle
+            if throttle is None:
+                continue
+            for args, kwargs in throttle.take(now):
+                event._dispatch(args, kwargs)
+            if len(throttle):
+                # not due yet, checked again on the next drain
+                self.hold(event)
+
+    def drain(self) -> int:
+        """
+        Releases the throttled emissions that are due and makes every delivery queued
+        so far, deliveries queued by the subscribers themselves wait for the next drain.
+
+        :returns: (:class:`int`) The amount of deferred deliveries made.
+        """
+        self._release()
+        with self._lock:
+            if not self._pending:
+                return 0
+            pending, self._pending = self._pending, deque()
+
+        calls: List[Tuple["ListeningFunc", Any, dict]] = []
+        batches: Dict[Any, List[tuple]] = {}
+        for cb, args, kwargs in pending:
+            if cb.__batched__:
+                batch = batches.get(cb)
+                if batch is None:
+                    # batched subscribers run at the position of their first delivery
+                    batch = batches[cb] = []
+                    calls.append((cb, (batch,), {}))
+                batch.append(args)
+            else:
+                calls.append((cb, args, kwargs))
+
+        tracer = Tracer.active
+        for cb, args, kwargs in calls:
+            start = perf_counter_ns() if tracer is not None else 0
+            try:
+                cb(*args, **kwargs)
+            except Exception as e:
+                # like on the workers, a failing subscriber doesn't cost the others theirs
+                print_exception(e.__class__, e, e.__traceback__)
+            if tracer is not None:
+                tracer.span(
+                    "deferred", "event", start, perf_counter_ns(), {"subscriber": _subscriber_name(cb)}
+                )
+        return len(pending)
+
+
+class EventStream:
+    """
+    An asynchronous iterator over the emissions of an event, made with :meth:`Event.stream`.
+
+    Each emission is yielded as its only argument, or a tuple of them when there are
+    several. Emissions from other threads are handed over to the event loop the stream
+    was made on.
+
+    .. code:: py
+
+       async with ON_KEY_PRESS.stream() as keys:
+           async for key in keys:
+               ...
+    """
+
+    # read by Event.emit, a stream is its own subscriber and is always called inline
+    __threaded__ = False
+    __deferred__ = False
+    __batched__ = False
+
+    __slots__ = ("event", "_queue", "_loop", "_thread", "_closed")
+
+    _CLOSED = object()
+
+    def __init__(self, event: "Event", maxsize: int = 0):
+        import asyncio
+
+        self.event = event
+        self._loop = asyncio.get_running_loop()
+        self._thread = get_ident()
+        self._queue: Any = asyncio.Queue(maxsize)
+        self._closed = False
+        event.subscribers.append(self)  # type: ignore
+
+    def __call__(self, *args):
+        item = args[0] if len(args) == 1 else args
+        if get_ident() == self._thread:
+            self._push(item)
+        else:
+            self._loop.call_soon_threadsafe(self._push, item)
+
+    def _push(self, item: Any):
+        queue = self._queue
+        if queue.full():
+            # a bounded stream keeps the newest emissions
+            queue.get_nowait()
+        queue.put_nowait(item)
+
+    def close(self):
+        """
+        Unsubscribes the stream, iteration stops once the queued emissions are read.
+        """
+        if not self._closed:
+            self._closed = True
+            if self in self.event.subscribers:
+                self.event.subscribers.remove(self)  # type: ignore
+            self._push(self._CLOSED)
+
+    def __aiter__(self) -> "EventStream":
+        return self
+
+    async def __anext__(self) -> Any:
+        if self._closed and self._queue.empty():
+            raise StopAsyncIteration
+        item = await self._queue.get()
+        if item is self._CLOSED:
+            raise StopAsyncIteration
+        return item
+
+    async def __aenter__(self) -> "EventStream":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        self.close()
+
 
 class Event:
-    __slots__ = ("subscribers", "name", "threadable")
+    __slots__ = (
+        "subscribers",
+        "name",
+        "threadable",
+        "maxsize",
+        "backpressure",
+        "dropped",
+        "throttle",
+        "_mailboxes",
+        "_lock",
+    )
 
-    def __init__(self, name: str, threadable: bool = True):
+    dispatcher = Dispatcher()
+    queue = EventQueue()
+    # the clock throttles are timed on, a window sets the clock of its screen while it runs
+    clock: Optional[Clock] = None
+
+    def __init__(
+        self,
+        name: str,
+        threadable: bool = True,
+        maxsize: int = 64,
+        backpressure: Backpressure = Backpressure.DropOldest,
+        throttle: Optional[Throttle] = None,
+    ):
         """
         An Event Aggregator that allows observers to listen to certain events and observers in
         this specific case are callables.
+
+        Threaded subscribers are called on the shared :attr:`Event.dispatcher` pool, each
+        with its own queue of at most ``maxsize`` deliveries that are made in order.
+        ``backpressure`` decides what happens when a subscriber falls behind, the amount of
+        discarded deliveries is counted in :attr:`Event.dropped`. Deferred subscribers are
+        queued onto :attr:`Event.queue` instead.
+
+        A ``throttle`` such as :class:`LatestPerFrame` or :class:`RateLimit` is applied to
+        every emission before it is dispatched at all, so high frequency events call their
+        subscribers once per frame with the latest state.
         """
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least one")
         self.name = name
         self.threadable = threadable
+        self.maxsize = maxsize
+        self.backpressure = backpressure
+        self.dropped = 0
+        self.throttle = throttle
         self.subscribers: List[ListeningFunc] = []
+        self._mailboxes: Dict[Any, Mailbox] = {}
+        # reentrant, a collection under it may unsubscribe a weak subscriber
+        self._lock = RLock()
+
+    @property
+    def merged(self) -> int:
+        """
+        The amount of emissions merged into a later one by the throttle.
+        """
+        return 0 if self.throttle is None else self.throttle.merged
+
+    @staticmethod
+    def now() -> float:
+        """
+        The time in seconds on :attr:`Event.clock`, or on the monotonic clock without one.
+        """
+        clock = Event.clock
+        return monotonic() if clock is None else clock.monotonic()
 
     def emit(self, *args, **kwargs):
+        throttle = self.throttle
+        if throttle is not None and not throttle.offer(args, kwargs, Event.now()):
+            self.queue.hold(self)
+            return
+        self._dispatch(args, kwargs)
+
+    def _dispatch(self, args: tuple, kwargs: dict):
+        tracer = Tracer.active
+        start = perf_counter_ns() if tracer is not None else 0
         if len(self.subscribers) != 0:
-            for cb in self.subscribers:
-                if cb.__threaded__ and self.threadable:
-                    Thread(target=cb, args=args, kwargs=kwargs).start()
+            # a weak subscriber may be removed by a collection during the emission
+            for cb in tuple(self.subscribers):
+                if cb.__deferred__:
+                    self.queue.post(cb, args, kwargs)
+                elif cb.__threaded__ and self.threadable:
+                    self._post(cb, (args, kwargs))
                 else:
-                    cb(*args, *kwargs)
+                    cb(*args, **kwargs)
+        if tracer is not None:
+            tracer.span(
+                f"emit {self.name}",
+                "event",
+                start,
+                perf_counter_ns(),
+                {"subscribers": len(self.subscribers)},
+            )
+
+    def _post(self, cb: "ListeningFunc", delivery: Delivery):
+        mailbox = self._mailboxes.get(cb)
+        if mailbox is None:
+            with self._lock:
+                mailbox = self._mailboxes.setdefault(cb, Mailbox(self, cb))
+        mailbox.put(delivery)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Waits for every threaded delivery of this event to be made.
+
+        :returns: (:class:`bool`) False if the timeout ran out first.
+        """
+        for mailbox in list(self._mailboxes.values()):
+            if mailbox.owner is current_thread():
+                continue
+            if not mailbox.wait(timeout):
+                return False
+        return True
+
+    def stream(self, maxsize: int = 0) -> EventStream:
+        """
+        Subscribes an :class:`EventStream` to the event, this must be called from
+        within a running asyncio event loop.
+
+        :param maxsize:
+            The amount of unread emissions kept, the oldest are dropped past it. Zero
+            keeps every emission.
+        :type maxsize: :class:`int`
+        """
+        return EventStream(self, maxsize)
 
     @staticmethod
-    def listen(event: "Event", threaded: bool = True):
+    def listen(
+        event: "Event", threaded: bool = True, deferred: bool = False, batched: bool = False
+    ):
         """
         Decorated function can be of any type with the only exception that bound methods must
         subclass under :class:`EventListener`.
+
+        A ``deferred`` subscriber is not called by the emitter, its deliveries wait on
+        :attr:`Event.queue` until the next frame drains it on the main thread. When it is
+        also ``batched``, it is called once per drain with a list of the argument tuples
+        of every delivery instead.
         """
+        if batched and not deferred:
+            raise ValueError("only deferred subscribers can be batched")
 
         def wrapped(func: Any) -> ListeningFunc:
+            func.__threaded__ = threaded
+            func.__deferred__ = deferred
+            func.__batched__ = batched
             if isinstancemethod(func):
                 func.__subscribes_to__ = event
-                func.__threaded__ = threaded
             else:
-                func.__threaded__ = threaded
                 event.subscribers.append(func)
 
             return func
@@ -89,8 +736,25 @@ class Event:
 
 
 class ON_TERMINATE_EVENT(Event):
+    # how long the process waits on threaded subscribers to clean up
+    FLUSH_TIMEOUT = 1.0
+
+    _installed = False
+
+    def install(self):
+        """
+        Makes SIGINT and SIGTERM terminate through this event, this is done when a
+        window starts rather than on import.
+        """
+        if self._installed:
+            return
+        ON_TERMINATE_EVENT._installed = True
+        signal.signal(signal.SIGINT, partial(self.emit, signal.SIGINT.value))
+        signal.signal(signal.SIGTERM, partial(self.emit, signal.SIGTERM.value))
+
     def emit(self, *args, **kwargs):
         super().emit(args[0], **kwargs)
+        self.flush(self.FLUSH_TIMEOUT)
         exit(args[0])
 
 
@@ -100,11 +764,3 @@ ON_RESIZE = Event("ON_RESIZE")
 ON_KEY_PRESS = Event("ON_KEY_PRESS")
 ON_KEY_RELEASE = Event("ON_KEY_RELEASE")
 ON_MOUSE_CLICK = Event("ON_MOUSE_CLICK")
-
-
-# Sigint and sigterm signals will start a system termination call
-signal.signal(signal.SIGINT, partial(ON_TERMINATE.emit, signal.SIGINT.value))
-signal.signal(signal.SIGTERM, partial(ON_TERMINATE.emit, signal.SIGTERM.value))
-
-if not Platform.is_window:
-    signal.signal(signal.SIGWINCH, partial(ON_TERMINATE.emit, signal.SIGWINCH.value))  # type: ignore
@@ -1,21 +1,28 @@
 import os
+import signal
 import sys
 
 from itertools import chain
-from time import sleep, time
+from time import perf_counter_ns
 from traceback import print_exception
 from abc import ABCMeta, abstractmethod
-from typing import Callable, Literal, Tuple, Union, Optional, List
+from typing import Callable, Iterable, Literal, Tuple, Union, Optional, List
 
 from .objects import Blitable
-from .values import WINDOW_COLOR_HEXES, Color, Characters, Resolutions, ANSI
-from .devices import Keyboard
-from .events import ON_START, ON_TERMINATE, Event, EventListener
+from .values import WINDOW_COLOR_HEXES, Color, ColorDepth, Characters, Resolutions, ANSI
+try:
+    from .devices import Keyboard
+except ImportError:
+    # bundled without input devices by Asciinpy.tools.condense
+    Keyboard = None  # type: ignore
+from .events import ON_RESIZE, ON_START, ON_TERMINATE, Event, EventListener
 from .globals import Platform
 from .types import AnyInt, IntCoordinate
+from .clock import Clock
+from .utils import FrameMetrics, FrameProfiler, GCPolicy
 
 
-__all__ = ["Window", "Screen"]
+__all__ = ["Window", "Screen", "AsyncConsoleInterface"]
 
 Displayer = Callable[["Screen"], None]
 DisplayerWrapper = Callable[[Displayer], Displayer]
@@ -40,10 +47,22 @@ class Screen(metaclass=ABCMeta):
             A boolean flag on whether visualization of the rendering is enabled.
         debug: :class:`bool`
             A boolean flag whether debug mode is turned on.
+        profiler: Optional[:class:`~Asciinpy.utils.FrameProfiler`]
+            Times the phases of every frame while set.
+        metrics: :class:`~Asciinpy.utils.FrameMetrics`
+            The frame times of the last frames, shown by the debug menu along with the fps.
+            Allocations and collections are instrumented per frame once a
+            :class:`~Asciinpy.utils.MemoryProfiler` is set as its ``memory``.
+        clock: :class:`~Asciinpy.clock.Clock`
+            The clock the screen reads the time from and sleeps on.
+        collector: Optional[:class:`~Asciinpy.utils.GCPolicy`]
+            Collects garbage in the time left before the next frame is due while set.
     """
 
     palette = Characters.some
     TPS = 25
+    # seconds the terminal size has to settle before the screen follows it
+    RESIZE_DEBOUNCE = 0.1
 
     __slots__ = (
         "resolution",
@@ -56,17 +75,27 @@ class Screen(metaclass=ABCMeta):
         "timer",
         "sysdout",
         "debug",
+        "profiler",
+        "metrics",
+        "clock",
+        "collector",
+        "color_depth",
         "_infotext",
+        "_metrics_width",
         "_fov",
         "_frame",
+        "_attrs",
+        "_sgr",
         "_last_frame",
         "_records",
-        "_fps",
-        "_average_fps",
         "_frames_displayed",
         "_stops_at",
         "_started_at",
-        "_last_fps_measure",
+        "_frame_started",
+        "_presented_at",
+        "_next_frame_at",
+        "_resize_requested_at",
+        "_repaint",
         "_stdout",
     )
 
@@ -79,6 +108,8 @@ class Screen(metaclass=ABCMeta):
         show_fps: bool,
         sysdout: bool,
         timer: bool,
+        clock: Optional[Clock] = None,
+        color_depth: ColorDepth = ColorDepth.TrueColor,
     ):
         self.resolution: Resolutions = resolution
         self.width, self.height = resolution.value
@@ -89,44 +120,123 @@ class Screen(metaclass=ABCMeta):
         self.timer = timer
         self.sysdout = sysdout
         self.debug = debug
+        self.profiler: Optional[FrameProfiler] = None
+        self.metrics = FrameMetrics()
+        self.clock = clock or Clock()
+        self.collector: Optional[GCPolicy] = None
+        self.color_depth = color_depth
 
         self._frame = self.get_emptyframe()
+        # the colour of every cell, only allocated once a frame draws in colour
+        self._attrs: Optional[List[List[Optional[Color]]]] = None
+        # the colour the terminal is left in by the last frame written
+        self._sgr: Optional[Color] = None
         self._last_frame = self.get_emptyframe()
         self._records = []
 
-        self._fps = 0
-        self._average_fps = 0
         self._frames_displayed = 0
 
-        self._started_at = time()
+        self._started_at = self.clock.time()
         self._stops_at = forcestop
-        self._last_fps_measure = time()
+        self._frame_started = self._presented_at = self.clock.perf_counter_ns()
+        self._next_frame_at = self._started_at
+        self._resize_requested_at: Optional[float] = None
+        self._repaint = False
+        self._stdout = sys.stdout
+        self._prerender()
+
+    def _prerender(self):
+        """
+        Renders the parts of the debug menu that stay the same between frames.
+        """
+        width = self.resolution.width
+        fields = []
+        # the width every value is formatted to
+        sizes = []
+        if self.show_fps is True:
+            fields.append(r"FPS: [%s]")
+            sizes.append(5)
+        if self.timer is True:
+            fields.append(r"StopWatch: %s")
+            sizes.append(8)
+        body = " " + "  ".join(fields)
+        shown = len(body) - 2 * len(sizes) + sum(sizes)
+
+        # the frame times take whatever is left of the top bar
+        self._metrics_width = 0
+        if self.show_fps is True and width - 2 - shown > 2:
+            self._metrics_width = width - 2 - shown - 2
+            body += "  %s"
+            shown += 2 + self._metrics_width
 
-        # pre-rendered
         self._infotext = (
             self.palette[2]
-            + (r" " * (resolution.width - 2))
+            + body
+            + (r" " * (width - 2 - shown))
             + self.palette[2]
             + self.palette[2]
-            + (self.palette[2] * (resolution.width - 2))
+            + (self.palette[2] * (width - 2))
             + self.palette[2]
         )
-        self._stdout = sys.stdout
 
-        fps_size = 0
-        if show_fps is True:
-            inf = r"FPS: [%s]"
-            fps_size = len(inf) + 3
-            self._infotext = self._infotext[:3] + inf + self._infotext[3 + fps_size :]
-
-        if timer is True:
-            watch = r"StopWatch: %s  "
-            offs = 5
-            self._infotext = (
-                self._infotext[: 3 + fps_size + offs]
-                + watch
-                + self._infotext[3 + fps_size + offs + len(watch) :]
-            )
+    def resize(self, width: int, height: int):
+        """
+        Changes the resolution of the screen in place, the frame being drawn is
+        discarded and the next one is painted over a cleared terminal.
+        """
+        self.resolution = Resolutions.custom((width, height))
+        self.width, self.height = width, height
+        self.aspect_ratio = height / width
+        self._invalidate()
+        self._frame = self.get_emptyframe()
+        self._attrs = None
+
+    def request_resize(self):
+        """
+        Notes that the size of the terminal changed. The screen follows it once it has
+        not changed again for :attr:`RESIZE_DEBOUNCE` seconds, so a window being dragged
+        is only resized once.
+        """
+        self._resize_requested_at = self.clock.time()
+
+    def _terminal_size(self) -> Optional[Tuple[int, int]]:
+        """
+        The size of the terminal the screen is shown on, if any.
+        """
+        return None
+
+    def _follow_resize(self) -> bool:
+        """
+        Resizes the screen to the terminal once a requested resize has settled.
+
+        :returns: (:class:`bool`) Whether the screen was resized.
+        """
+        if self._resize_requested_at is None:
+            return False
+        if self.clock.time() - self._resize_requested_at < self.RESIZE_DEBOUNCE:
+            return False
+        self._resize_requested_at = None
+
+        size = self._terminal_size()
+        if size is None:
+            return False
+        if size == (self.width, self.height):
+            # the terminal may have been redrawn meanwhile, nothing was written to it
+            self._invalidate()
+            return False
+        self.resize(*size)
+        ON_RESIZE.emit(*size)
+        return True
+
+    def _invalidate(self):
+        """
+        Drops everything rendered at the previous resolution and schedules a full repaint.
+        """
+        self._prerender()
+        self._last_frame = None
+        self._repaint = True
+        # the repaint starts over from the default colours
+        self._sgr = None
 
     def get_emptyframe(self) -> List[List[str]]:
         return [[" "] * (self.resolution.width) for _ in range(self.resolution.height)]
@@ -136,35 +246,82 @@ class Screen(metaclass=ABCMeta):
         """
         The current frame rendered.
         """
-        return "".join(chain.from_iterable(self._frame))
+        return self._compose()[0]
+
+    def _compose(self) -> Tuple[str, Optional[Color]]:
+        """
+        Joins the frame, the colour of a cell is only set where it differs from the
+        colour the terminal is left in, so runs of a colour cost one sequence. Colours
+        are written in :attr:`color_depth`, neighbours that fall on the same colour of
+        a palette are one run.
+
+        :returns: (Tuple[:class:`str`, Optional[:class:`~Asciinpy.values.Color`]]) The
+            frame and the colour the terminal is left in after it.
+        """
+        attrs = self._attrs
+        state = self._sgr
+        depth = self.color_depth
+        if attrs is None:
+            body = "".join(chain.from_iterable(self._frame))
+            return (body, None) if state is None else (ANSI.RESET + body, None)
+
+        parts: List[str] = []
+        append = parts.append
+        for row, colors in zip(self._frame, attrs):
+            if state is None and not any(colors):
+                append("".join(row))
+                continue
+            start = 0
+            for i, color in enumerate(colors):
+                if color is state:
+                    continue
+                if color is None:
+                    sgr = ANSI.RESET
+                else:
+                    sgr = color.ansi(depth)
+                    if state is not None and state.layer is not color.layer:
+                        sgr = ANSI.RESET + sgr
+                    elif state is not None and sgr == state.ansi(depth):
+                        # a colour of the same layer overrides the last one, unless
+                        # both are written out the same
+                        continue
+                if i > start:
+                    append("".join(row[start:i]))
+                append(sgr)
+                state = color
+                start = i
+            append("".join(row[start:]))
+        return "".join(parts), state
 
     @property
     def fps(self) -> int:
         """
-        The amount of frames rendered per the second passed.
+        The amount of frames rendered per second over the frames kept by :attr:`metrics`.
         """
-        now = time()
-        duration = now - self._last_fps_measure
-        if duration >= 1:
-            self._average_fps += self._frames_displayed
-            self._fps = self._frames_displayed
-            self._frames_displayed = 0
-            self._last_fps_measure = now
-        return self._fps
+        return round(self.metrics.fps)
 
     @property
     def average_fps(self) -> float:
         """
         The amount of frames rendered on average from start to present.
         """
-        return self._average_fps / (time() - self._started_at)
+        elapsed = self.elapsed
+        # no time passes on a virtual clock until the first frame
+        return self._frames_displayed / elapsed if elapsed else 0.0
+
+    @property
+    def elapsed(self) -> float:
+        """
+        The seconds passed on :attr:`clock` since the screen was created.
+        """
+        return self.clock.time() - self._started_at
 
     @property
     def tick(self) -> int:
         """
         Internal ticks, from 0 to 25 for timing certain things.
         """
-        return round(time() - self._started_at) % self.TPS
+        return round(self.elapsed) % self.TPS
 
     def _infograph(self):
         """
@@ -173,10 +330,32 @@ class Screen(metaclass=ABCMeta):
         This menu is pre-rendered before-hand and the values are formatted
         in to maintain a max slice-fit of one per render.
         """
+        if not (self.show_fps or self.timer):
+            return
+        values = []
         if self.show_fps:
-            text = self._infotext % str(self.fps).rjust(5)
-            self._frame[0] = text[: self.width - 1]
-            self._frame[1] = text[self.width - 1 :]
+            values.append(str(self.fps).rjust(5))
+        if self.timer:
+            values.append(f"{self.elapsed:.1f}s".rjust(8))
+        if self._metrics_width:
+            values.append(self._metrics_text()[: self._metrics_width].ljust(self._metrics_width))
+        text = self._infotext % tuple(values)
+        self._frame[0] = text[: self.width]
+        self._frame[1] = text[self.width :]
+        if self._attrs is not None:
+            self._attrs[0] = [None] * self.width
+            self._attrs[1] = [None] * self.width
+
+    def _metrics_text(self) -> str:
+        metrics = self.metrics
+        p50, p95, p99 = metrics.percentiles(50, 95, 99)
+        render, output = metrics.render_times(), metrics.output_times()
+        kept = len(render) or 1
+        return (
+            f"ms p50 {p50 / 1e6:.1f} p95 {p95 / 1e6:.1f} p99 {p99 / 1e6:.1f} "
+            f"jit {metrics.jitter / 1e6:.1f} miss {metrics.missed} "
+            f"render {sum(render) / kept / 1e6:.1f} out {sum(output) / kept / 1e6:.1f}"
+        )
 
     def blit(self, *objects: Blitable, **kwargs):
         """
@@ -187,46 +366,148 @@ class Screen(metaclass=ABCMeta):
             Any number of models to be blitted onto screen.
         :type object: :class:`~Asciinpy.objects.Blitable`
         """
+        profiler = self.profiler
+        memory = self.metrics.memory
+        if profiler is None and memory is None:
+            for obj in objects:
+                obj.blit(self, **kwargs)
+            return
+
+        start = perf_counter_ns()
         for obj in objects:
-           obj.blit(self, **kwargs)
+            if memory is not None:
+                # collections are blamed on the blitable that triggered them
+                memory.phase = type(obj).__name__
+            obj.blit(self, **kwargs)
+        if memory is not None:
+            memory.phase = "loop"
+        if profiler is not None:
+            profiler.record(FrameProfiler.BLIT, start, perf_counter_ns())
 
     def refresh(self, log_frames=False):
         """
         Empties the current frame. If sysdout is enabled, it is printed onto the window.
 
+        When :attr:`max_fps` is set, this sleeps until the next frame is due. Deferred
+        event subscribers queued during the frame are called afterwards, see
+        :attr:`Event.queue <Asciinpy.events.Event.queue>`.
+
         :param log_frames:
             Whether to keep track of the amount of frames displayed throughout the session.
         :type log_frames: :class:`bool`
         """
-        if self._stops_at is not None and time() - self._started_at >= self._stops_at:
+        self._present(log_frames)
+        delay = self._collect(self._frame_delay())
+        if delay > 0:
+            self.clock.sleep(delay)
+        Event.queue.drain()
+        self._frame_started = self.clock.perf_counter_ns()
+        if self.profiler is not None:
+            self.profiler.start_frame(perf_counter_ns())
+
+    def _present(self, log_frames: bool):
+        """
+        Writes out the current frame and starts an empty one.
+        """
+        if self._stops_at is not None and self.elapsed >= self._stops_at:
             raise RuntimeError("Times up! Program has been force stopped.")
 
-        self._infograph()
-        current_frame = self.frame
-        if self.sysdout:
+        presented = self.clock.perf_counter_ns()
+        memory = self.metrics.memory
+        if memory is not None:
+            memory.phase = "present"
+        profiler = self.profiler
+        if profiler is None:
+            self._infograph()
+            current_frame, sgr = self._compose()
+        else:
+            start = perf_counter_ns()
+            self._infograph()
+            joining = perf_counter_ns()
+            current_frame, sgr = self._compose()
+            joined = perf_counter_ns()
+            profiler.record(FrameProfiler.INFOGRAPH, start, joining)
+            profiler.record(FrameProfiler.JOIN, joining, joined)
+        # a frame drawn for the old size would be garbled while a resize settles
+        if self.sysdout and self._resize_requested_at is None:
             self._update(current_frame)
+            self._sgr = sgr
+        if profiler is not None:
+            profiler.end_frame(perf_counter_ns())
+        written = self.clock.perf_counter_ns()
+        self.metrics.record(
+            presented - self._presented_at,
+            presented - self._frame_started,
+            written - presented,
+            1_000_000_000 // self.max_fps if self.max_fps else 0,
+        )
+        self._presented_at = presented
+        if memory is not None:
+            memory.end_frame()
+            memory.phase = "loop"
+        self.clock.advance()
         if log_frames and self._last_frame != current_frame:
             self._records.append(current_frame)
             self._last_frame = current_frame
 
         self._frames_displayed += 1
-        self._frame = self.get_emptyframe()
+        if not self._follow_resize():
+            self._frame = self.get_emptyframe()
+            self._attrs = None
+
+    def _collect(self, delay: float) -> float:
+        """
+        Lets the collector run in the time left before the next frame.
+
+        :returns: (:class:`float`) The seconds still left.
+        """
+        if self.collector is None:
+            return delay
+        memory = self.metrics.memory
+        if memory is not None:
+            memory.phase = "collect"
+        due = self.clock.time() + delay
+        self.collector.collect(delay)
+        if memory is not None:
+            memory.phase = "loop"
+        return due - self.clock.time()
+
+    def _frame_delay(self) -> float:
+        """
+        The seconds left until the next frame is due under :attr:`max_fps`, the frame
+        after it is scheduled one period later. A late frame does not make the following
+        frames hurry to catch up.
+        """
+        if not self.max_fps:
+            return 0.0
+        now = self.clock.time()
+        delay = self._next_frame_at - now
+        self._next_frame_at = max(self._next_frame_at, now) + 1 / self.max_fps
+        return max(delay, 0.0)
 
     def events(self):
         """
         Generally, the client does not capture user events
         this method must be called in order to gather them.
         """
-        Keyboard.getch()
+        if Keyboard is not None:
+            Keyboard.getch(now=self.clock.monotonic())
 
-    def draw(self, point: IntCoordinate, char: str):
+    def draw(self, point: IntCoordinate, char: str, color: Optional[Color] = None):
         """
-        Paints a specific point on the cavas with the character.
+        Paints a specific point on the cavas with the character, in a colour when given.
         """
         try:
             self._frame[point[1]][point[0]] = char
         except IndexError:
-            pass
+            return
+        attrs = self._attrs
+        if color is not None:
+            if attrs is None:
+                attrs = self._attrs = [[None] * self.width for _ in range(self.height)]
+            attrs[point[1]][point[0]] = color
+        elif attrs is not None:
+            attrs[point[1]][point[0]] = None
 
     def _resize(self):
         """
@@ -254,12 +535,15 @@ class ConsoleInterface(EventListener, Screen):
         show_fps: bool,
         sysdout: bool,
         timer: bool,
+        clock: Optional[Clock] = None,
+        color_depth: ColorDepth = ColorDepth.TrueColor,
     ):
         super().__init__(
-            resolution, max_fps, forcestop, debug, show_fps, sysdout, timer
+            resolution, max_fps, forcestop, debug, show_fps, sysdout, timer, clock, color_depth
         )
         self.stdout = sys.stdout
         self.cout = self.stdout.fileno()
+        self._winch_handler = None
 
     def _resize(self):
         if Platform.is_window:
@@ -309,7 +593,15 @@ class ConsoleInterface(EventListener, Screen):
         """
         Writes onto sys stdout directly with the encoding.
         """
-        os.write(self.cout, "".join(sequence).encode())
+        self._write("".join(sequence).encode())
+
+    def _write(self, data: bytes):
+        """
+        Writes all of the bytes, a terminal may take a large frame in several writes.
+        """
+        view = memoryview(data)
+        while view:
+            view = view[os.write(self.cout, view) :]
 
     def _slice_fit(self, coordinate: Tuple[int, int], *body: str):
         """
@@ -327,7 +619,9 @@ class ConsoleInterface(EventListener, Screen):
         """
         Clears the current visible terminal
         """
-        self._puts(ANSI.CSI, "2J")
+        # a background colour left set would fill the cleared terminal
+        self._puts(ANSI.RESET, ANSI.CSI, "2J")
+        self._sgr = None
 
     def _cursor(self, goto: Optional[Tuple[AnyInt, AnyInt]] = None, visibility: Optional[bool] = None):
         if goto is not None:
@@ -338,9 +632,28 @@ class ConsoleInterface(EventListener, Screen):
             else:
                 self._puts(ANSI.CSI, "?25l")
 
+    def _terminal_size(self) -> Optional[Tuple[int, int]]:
+        try:
+            return tuple(os.get_terminal_size(self.cout))  # type: ignore
+        except OSError:
+            return None
+
     def _update(self, frame: str):
-        self._cursor((0, 0))
-        self._puts(frame)
+        if self._repaint:
+            self._repaint = False
+            self._clear()
+        # the cursor is homed in the same write as the frame
+        profiler = self.profiler
+        if profiler is None:
+            self._write((ANSI.CSI + "0;0H" + frame).encode())
+            return
+
+        start = perf_counter_ns()
+        data = (ANSI.CSI + "0;0H" + frame).encode()
+        encoded = perf_counter_ns()
+        self._write(data)
+        profiler.record(FrameProfiler.ENCODE, start, encoded)
+        profiler.record(FrameProfiler.WRITE, encoded, perf_counter_ns())
 
     def _enable_VT100(self):
         """
@@ -352,19 +665,110 @@ class ConsoleInterface(EventListener, Screen):
     @Event.listen(ON_START)
     def _start(self):
         self._enable_VT100()
+        if Keyboard is not None:
+            Keyboard.reader().open()
         if self.sysdout is True:
             self._resize()
             self._clear()
             self._cursor(visibility=False)
+            if not Platform.is_window:
+                previous = signal.signal(
+                    signal.SIGWINCH, lambda *_: self.request_resize()  # type: ignore
+                )
+                self._winch_handler = signal.SIG_DFL if previous is None else previous
 
-    @Event.listen(ON_TERMINATE)
+    # restores signal handlers, which only the main thread can do
+    @Event.listen(ON_TERMINATE, threaded=False)
     def _terminate(self, exit_code: int):
+        if Keyboard is not None:
+            Keyboard.reader().close()
+        if self._winch_handler is not None:
+            signal.signal(signal.SIGWINCH, self._winch_handler)  # type: ignore
+            self._winch_handler = None
         if self.sysdout is True:
+            if self._sgr is not None:
+                self._puts(ANSI.RESET)
+                self._sgr = None
             self._cursor(visibility=True)
             if exit_code != -1:
                 self._clear()
 
 
+class AsyncConsoleInterface(ConsoleInterface):
+    """
+    A console screen for :meth:`Window.run_async`, its :meth:`refresh` is awaited and
+    paces the frames without blocking the event loop.
+
+    On Unix, stdin is watched with :meth:`asyncio.loop.add_reader` and keys are pressed
+    on :class:`~Asciinpy.devices.Keyboard` as they arrive instead of once per frame.
+    """
+
+    def __init__(
+        self,
+        resolution: Resolutions,
+        max_fps: Optional[int],
+        forcestop: Optional[int],
+        debug: bool,
+        show_fps: bool,
+        sysdout: bool,
+        timer: bool,
+        clock: Optional[Clock] = None,
+        color_depth: ColorDepth = ColorDepth.TrueColor,
+    ):
+        super().__init__(
+            resolution, max_fps, forcestop, debug, show_fps, sysdout, timer, clock, color_depth
+        )
+        self._reader_fd: Optional[int] = None
+        self._has_input = False
+
+    async def refresh(self, log_frames=False):  # type: ignore
+        """
+        Same as :meth:`Screen.refresh` but yields to the event loop for the time left
+        until the next frame, or at least once when the fps is uncapped.
+        """
+        self._present(log_frames)
+        if not self._has_input:
+            # also resolves a lone escape that no sequence has followed
+            self.events()
+        self._has_input = False
+        await self.clock.sleep_async(self._collect(self._frame_delay()))
+        Event.queue.drain()
+        self._frame_started = self.clock.perf_counter_ns()
+        if self.profiler is not None:
+            self.profiler.start_frame(perf_counter_ns())
+
+    def _attach_input(self, loop):
+        if Platform.is_window or Keyboard is None:
+            # the console can't be watched by the event loop, it is polled per frame
+            return
+        reader = Keyboard.reader()
+        if reader.fd < 0:
+            return
+        reader.open()
+        loop.add_reader(reader.fd, self._read_input)
+        self._reader_fd = reader.fd
+
+    def _detach_input(self, loop):
+        if self._reader_fd is None:
+            return
+        loop.remove_reader(self._reader_fd)
+        Keyboard.reader().close()
+        self._reader_fd = None
+
+    def _read_input(self):
+        import asyncio
+
+        reader = Keyboard.reader()
+        keys = reader.poll(self.clock.monotonic())
+        if keys:
+            self._has_input = True
+            Keyboard.press(*keys)
+        if reader.eof:
+            # end of file, stdin stays readable forever after
+            asyncio.get_running_loop().remove_reader(self._reader_fd)
+            self._reader_fd = None
+
+
 class Window(EventListener):
     """
     An abstract representation of a window, the class handles the internal loops.
@@ -381,6 +785,14 @@ class Window(EventListener):
             The fov of the screen relevant for 3D rendering.
         screen: Optional[:class:`~Asciinpy.screen.Screen`]
             A screen object instantiated when run.
+        clock: Optional[:class:`~Asciinpy.clock.Clock`]
+            The clock given to the screen, the wall clock when None. A
+            :class:`~Asciinpy.clock.VirtualClock` reproduces a run frame for frame.
+        gc_policy: Optional[:class:`~Asciinpy.utils.GCPolicy`]
+            Schedules garbage collections in between frames while the client loop runs.
+        color_depth: Optional[:class:`~Asciinpy.values.ColorDepth`]
+            The colours written out, detected from the terminal when the window starts
+            if None.
     """
 
     PNAME = "ASCIINPY_PROCESS"
@@ -390,6 +802,9 @@ class Window(EventListener):
         "max_fps",
         "fov",
         "screen",
+        "clock",
+        "gc_policy",
+        "color_depth",
         "_game_loop",
         "_title",
         "_foreground_color",
@@ -404,6 +819,9 @@ class Window(EventListener):
         self,
         resolution: Union[Resolutions, Tuple[int, int]],
         max_fps: Optional[int] = None,
+        clock: Optional[Clock] = None,
+        gc_policy: Optional[GCPolicy] = None,
+        color_depth: Optional[ColorDepth] = None,
     ):
         if isinstance(resolution, Resolutions):
             self.resolution = resolution
@@ -411,12 +829,16 @@ class Window(EventListener):
             self.resolution = Resolutions.custom(resolution)
 
         self.max_fps = max_fps
+        self.clock = clock
+        self.gc_policy = gc_policy
+        self.color_depth = color_depth
         self._title = None
         self._debug = False
         self._debug_mode = "k"
         self._debug_origin_depth = 5
         self._foreground_color = None
         self._background_color = None
+        self._stop_time = None
         self._game_loop: Optional[Displayer] = None
 
     def enable_debug(self, mode: Optional[Literal["k", "c"]] = None, origin_depth: Optional[int] = None):
@@ -456,30 +878,39 @@ class Window(EventListener):
         self._stop_time = forcestop
         return wrapper
 
-    def replay(self, frames: List[str], fps: int = 1):
+    def replay(self, frames: Iterable[str], fps: int = 1):
         """
-        Replays a given list of frames with the specified fps limit.
+        Replays the given frames with the specified fps limit.
+
+        Frames are pulled from the iterable one at a time, so a generator such as
+        :func:`Asciinpy.tools.convert.convert` can stream them without ever holding
+        the whole replay in memory.
 
         :param frames:
-            A list of frames to play.
-        :type frames: List[:class:`str`]
+            An iterable of frames to play.
+        :type frames: Iterable[:class:`str`]
         :param fps:
             The FPS at which the replay is rendered. It is defaulted to `1`.
         :type frames: :class:`int`
         """
         self.screen = ConsoleInterface(
-            self.resolution, self.max_fps, self._stop_time, False, False, False, False
+            self.resolution,
+            self.max_fps,
+            self._stop_time,
+            False,
+            False,
+            True,
+            False,
+            self.clock,
+            self._color_depth(),
         )
-        _frames = [frame.replace("\n", "", -1) for frame in frames]
-        index = 0
+        ON_TERMINATE.install()
         ON_START.emit()
-        while True:
-            self.screen._frame = _frames[index]
-            index += 1
-            if index >= len(_frames):
-                raise RuntimeError("Replay had run out of frames..")
+        for frame in frames:
+            self.screen._frame = frame.replace("\n", "", -1)  # type: ignore
             self.screen.refresh()
-            sleep(60 / (fps * 60))
+            self.screen.clock.sleep(60 / (fps * 60))
+        raise RuntimeError("Replay had run out of frames..")
 
     def set_fov(self, fov: float):
         """
@@ -570,6 +1001,8 @@ class Window(EventListener):
             show_fps,
             sysdout,
             timer,
+            self.clock,
+            self._color_depth(),
         )
 
         if self._debug is True:
@@ -580,7 +1013,11 @@ class Window(EventListener):
             else:
                 del os.environ[self.PNAME]
 
+        ON_TERMINATE.install()
+        # throttled events are timed on the clock of the screen while it runs
+        previous, Event.clock = Event.clock, self.screen.clock
         ON_START.emit()
+        self._start_collector()
         try:
             self.loop(screen=self.screen)
         except Exception as e:
@@ -588,8 +1025,25 @@ class Window(EventListener):
             exit_code = -1
         else:
             exit_code = 0
+        self._stop_collector()
+        Event.clock = previous
         ON_TERMINATE.emit(exit_code)
 
+    def _color_depth(self) -> ColorDepth:
+        if self.color_depth is None:
+            return ColorDepth.detect()
+        return self.color_depth
+
+    def _start_collector(self):
+        if self.gc_policy is not None:
+            self.screen.collector = self.gc_policy
+            self.gc_policy.start()
+
+    def _stop_collector(self):
+        if self.gc_policy is not None:
+            self.gc_policy.stop()
+            self.screen.collector = None
+
     def run(
         self,
         show_fps: bool = False,
@@ -597,3 +1051,71 @@ class Window(EventListener):
         timer: bool = False,
     ):
         return self._run_consolas(show_fps, sysdout, timer)
+
+    async def run_async(
+        self,
+        show_fps: bool = False,
+        sysdout: bool = True,
+        timer: bool = False,
+    ) -> int:
+        """
+        Runs an asynchronous client loop on the running asyncio event loop, so the window
+        can share a thread with other coroutines such as network services.
+
+        The client loop is registered with :meth:`Window.loop` like a synchronous one but
+        must be a coroutine function that awaits
+        :meth:`AsyncConsoleInterface.refresh` every frame.
+
+        .. code:: py
+
+           @window.loop()
+           async def my_loop(screen):
+               async with ON_KEY_PRESS.stream() as keys:
+                   while True:
+                       screen.blit(text)
+                       await screen.refresh()
+
+           asyncio.run(window.run_async())
+
+        Unlike :meth:`Window.run`, the process is not exited when the loop ends.
+
+        :returns: (:class:`int`) The exit code, -1 when the client loop raised.
+        """
+        import asyncio
+        from inspect import iscoroutinefunction
+
+        if self._game_loop is None or not iscoroutinefunction(self._game_loop):
+            raise TypeError("run_async requires the client loop to be a coroutine function")
+
+        self.screen = AsyncConsoleInterface(
+            self.resolution,
+            self.max_fps,
+            self._stop_time,
+            self._debug,
+            show_fps,
+            sysdout,
+            timer,
+            self.clock,
+            self._color_depth(),
+        )
+        loop = asyncio.get_running_loop()
+        self.screen._attach_input(loop)
+
+        ON_TERMINATE.install()
+        previous, Event.clock = Event.clock, self.screen.clock
+        ON_START.emit()
+        self._start_collector()
+        exit_code = 0
+        try:
+            await self._game_loop(self.screen)  # type: ignore
+        except Exception as e:
+            print_exception(e.__class__, e, e.__traceback__)
+            exit_code = -1
+        finally:
+            self._stop_collector()
+            Event.clock = previous
+            self.screen._detach_input(loop)
+            # skips the process exit of ON_TERMINATE
+            Event.emit(ON_TERMINATE, exit_code)
+            ON_TERMINATE.flush(ON_TERMINATE.FLUSH_TIMEOUT)
+        return exit_code
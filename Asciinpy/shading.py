@@ -0,0 +1,139 @@
+from functools import lru_cache
+from typing import Iterable, List, Optional, Union
+
+from .values import Characters
+
+__all__ = ["Shader"]
+
+Intensities = Union[bytes, bytearray, memoryview, Iterable[float]]
+
+# 4x4 ordered dither (Bayer) thresholds, row-major
+BAYER_4X4 = (0, 8, 2, 10, 12, 4, 14, 6, 3, 11, 1, 9, 15, 7, 13, 5)
+
+
+class Shader:
+    """
+    A precomputed intensity to glyph lookup table built over a brightness ramp
+    such as :attr:`~Asciinpy.values.Characters.some`.
+
+    Ramps are ordered from the densest glyph to the sparsest, a full intensity
+    maps onto the first glyph and zero maps onto the last.
+
+    Every possible byte of intensity is resolved to a glyph when the shader is
+    made, so shading a ``bytes`` buffer is a single :meth:`bytes.translate` call
+    and a sequence of floats only costs the quantization to bytes on top.
+
+    .. code:: py
+
+       shader = Shader.get(Characters.all, gamma=2.2, dither=True)
+       rows = shader.shade_rows(luminance, screen.width)
+
+    :param palette:
+        The brightness ramp, dense to sparse, of at most 256 glyphs.
+    :type palette: :class:`str`
+    :param gamma:
+        Intensities are raised to this power before they are mapped.
+    :type gamma: :class:`float`
+    :param dither:
+        Whether 4x4 ordered dither offsets are applied, this needs the width of the
+        shaded rows to be known.
+    :type dither: :class:`bool`
+    """
+
+    __slots__ = ("palette", "gamma", "dither", "_tables", "_glyphs", "_is_ascii")
+
+    def __init__(self, palette: str = Characters.some, gamma: float = 1.0, dither: bool = False):
+        if not 0 < len(palette) <= 256:
+            raise ValueError("palette must have between 1 and 256 glyphs")
+        if gamma <= 0:
+            raise ValueError(f"gamma {gamma} must be positive")
+
+        self.palette = palette
+        self.gamma = gamma
+        self.dither = dither
+        self._is_ascii = palette.isascii()
+        # glyphs ordered by their level, level 0 is the sparsest
+        self._glyphs = tuple(reversed(palette))
+
+        steps = len(palette) - 1
+        levels = [((i / 255) ** gamma) * steps for i in range(256)]
+        offsets = [(t + 0.5) / 16 - 0.5 for t in BAYER_4X4] if dither else [0.0]
+        self._tables: List[bytes] = []
+        for offset in offsets:
+            table = bytes(min(steps, max(0, round(level + offset))) for level in levels)
+            if self._is_ascii:
+                # resolve straight to the glyph bytes to skip the second lookup
+                table = table.translate(palette[::-1].encode().ljust(256, b" "))
+            self._tables.append(table)
+
+    def __repr__(self) -> str:
+        return f"<Shader palette={self.palette!r} gamma={self.gamma} dither={self.dither}>"
+
+    @staticmethod
+    @lru_cache(maxsize=16)
+    def get(palette: str = Characters.some, gamma: float = 1.0, dither: bool = False) -> "Shader":
+        """
+        A shared shader for the given configuration, the table is only built once.
+        """
+        return Shader(palette, gamma, dither)
+
+    @staticmethod
+    def quantize(intensities: Iterable[float]) -> bytes:
+        """
+        Converts intensities from 0 to 1 into bytes from 0 to 255, clamping anything
+        out of range.
+        """
+        return bytes([0 if v <= 0 else 255 if v >= 1 else int(v * 255 + 0.5) for v in intensities])
+
+    def glyph(self, intensity: Union[int, float]) -> str:
+        """
+        The glyph of a single intensity, a :class:`float` from 0 to 1 or an :class:`int`
+        from 0 to 255.
+        """
+        if isinstance(intensity, float):
+            intensity = self.quantize((intensity,))[0]
+        level = self._tables[0][intensity]
+        return chr(level) if self._is_ascii else self._glyphs[level]
+
+    def shade(self, intensities: Intensities, width: Optional[int] = None) -> str:
+        """
+        Maps a flat buffer of intensities onto a string of glyphs of the same length.
+
+        :param intensities:
+            Bytes from 0 to 255 or any other iterable of floats from 0 to 1.
+        :type intensities: Union[:class:`bytes`, Iterable[:class:`float`]]
+        :param width:
+            The length of a row, only required when dithering.
+        :type width: Optional[:class:`int`]
+        """
+        if not isinstance(intensities, (bytes, bytearray, memoryview)):
+            intensities = self.quantize(intensities)
+        data = bytes(intensities)
+
+        if not self.dither:
+            levels = data.translate(self._tables[0])
+        else:
+            if width is None:
+                raise ValueError("the width of a row is required to dither")
+            out = bytearray(len(data))
+            tables = self._tables
+            for y, start in enumerate(range(0, len(data), width)):
+                row = data[start : start + width]
+                base = (y & 3) * 4
+                for phase in range(min(4, len(row))):
+                    # every fourth cell of a row shares a dither threshold
+                    out[start + phase : start + len(row) : 4] = row[phase::4].translate(
+                        tables[base + phase]
+                    )
+            levels = bytes(out)
+
+        if self._is_ascii:
+            return levels.decode("ascii")
+        return levels.decode("latin-1").translate(self._glyphs)
+
+    def shade_rows(self, intensities: Intensities, width: int) -> List[str]:
+        """
+        Same as :meth:`Shader.shade` but split into rows of the given width.
+        """
+        glyphs = self.shade(intensities, width)
+        return [glyphs[i : i + width] for i in range(0, len(glyphs), width)]
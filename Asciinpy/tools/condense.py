@@ -1,97 +1,363 @@
-import re
-import os
-
 """
-This is a simple code condenser, goes through all the directories to create a single script with resolved
-dependencies.
+A bundler that packs a game and the parts of Asciinpy it uses into a single
+zipapp of precompiled bytecode.
+
+Imports are read from the syntax tree of every module, relative imports are
+resolved against their package and the lazy exports of ``Asciinpy/__init__.py``
+are followed to the submodule that defines them. Only the modules reachable
+from the entry script are packed, an import guarded by ``except ImportError`` is
+an optional dependency and doesn't pull its module in on its own.
+
+Modules are compiled ahead of time and stored without their source, so the
+archive is only runnable by the Python version that built it. Modules of the
+game other than the entry script are not packed.
+
+.. code:: sh
 
-Although it will eradicate the usage of all submodule imports.
+   python -m Asciinpy.tools.condense game.py -o game.pyz --exclude _3D
+   python game.pyz
 """
 
-re_relative_imports = re.compile(r"(?:from [.]+(.*)) import (.*)")
-re_general_imports = re.compile(r"(?:from (.*) )?import (.*)")
-re_indentation = re.compile(r"([ ]+)\w+")
+import ast
+import importlib.util
+import io
+import marshal
+import os
+import zipfile
 
-includes = ["Asciinpy", "Asciinpy/_2D", "Asciinpy/_3D"]
-outputs = "Asciinpy.py"
-tab = "    "
+from argparse import ArgumentParser
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
 
-code = []
-imported = []
+__all__ = ["Module", "find_modules", "scan_imports", "shake", "bundle"]
 
-general_imports = []
-future_imports = []
+PACKAGE = "Asciinpy"
+PACKAGE_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+ENTRY = "__main__"
 
 
-def put_at_top(lines):
-    global code
+class Module(NamedTuple):
+    """
+    A module of the package, or the entry script, along with what it imports.
+    """
 
-    for line in lines:
-        code[0] = line + ("\n" if not line.endswith("\n") else "") + code[0]
+    name: str
+    path: str
+    is_package: bool
+    tree: ast.Module
+    # modules of the package imported unconditionally and those imported under
+    # an ImportError guard
+    requires: Set[str]
+    optional: Set[str]
 
 
-def is_indented(line):
-    match = re_indentation.match(line)
-    if match:
-        return len(match.group(1))
-    return False
+def _read(path: str) -> ast.Module:
+    with open(path, "rb") as f:
+        return ast.parse(f.read(), path)
 
 
-def is_weird(line):
-    if line.strip() == "" or line == "\n":
-        return True
+def find_modules(root: str = PACKAGE_ROOT) -> Dict[str, str]:
+    """
+    Maps the dotted name of every module of the package to its path.
+    """
+    modules = {}
+    base = os.path.join(root, PACKAGE)
+    for dirpath, dirnames, filenames in os.walk(base):
+        if "__init__.py" not in filenames:
+            dirnames.clear()
+            continue
+        dirnames[:] = sorted(d for d in dirnames if d != "__pycache__")
+        package = os.path.relpath(dirpath, root).replace(os.sep, ".")
+        for filename in sorted(filenames):
+            if not filename.endswith(".py"):
+                continue
+            stem = filename[:-3]
+            name = package if stem == "__init__" else f"{package}.{stem}"
+            modules[name] = os.path.join(dirpath, filename)
+    return modules
 
 
-def imports(root, file):
-    global imported, general_imports, future_imports
+def _lazy_exports(tree: ast.Module) -> Dict[str, str]:
+    """
+    Reads the name to submodule table that ``Asciinpy/__init__.py`` loads lazily from.
+    """
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and any(
+            isinstance(t, ast.Name) and t.id == "_EXPORTS" for t in node.targets
+        ):
+            table = ast.literal_eval(node.value)
+            return {
+                name: f"{PACKAGE}.{module}" for module, names in table.items() for name in names
+            }
+    return {}
 
-    if file in imported:
-        return []
 
-    imported.append(file)
-    code = []
-    ignores_flag = False
-    with open(root + "/" + file, "r") as py:
-        for line in py.readlines():
-            if ignores_flag and is_indented(line) or is_weird(line):
-                continue
-            elif ignores_flag and not is_indented(line) or is_weird(line):
-                ignores_flag = False
+def _guards_import_error(handler: ast.ExceptHandler) -> bool:
+    # a bare or a broad except may be guarding anything, only an ImportError marks
+    # the import as optional
+    kinds = handler.type
+    if kinds is None:
+        return False
+    names = kinds.elts if isinstance(kinds, ast.Tuple) else [kinds]
+    return any(
+        isinstance(n, ast.Name) and n.id in ("ImportError", "ModuleNotFoundError")
+        for n in names
+    )
+
+
+def _imports(node: ast.AST, optional: bool = False) -> Iterable[Tuple[ast.stmt, bool]]:
+    """
+    Yields every import statement under the node and whether an ImportError
+    guard surrounds it.
+    """
+    if isinstance(node, (ast.Import, ast.ImportFrom)):
+        yield node, optional
+        return
+    if isinstance(node, ast.Try):
+        guarded = optional or any(_guards_import_error(h) for h in node.handlers)
+        for child in node.body:
+            yield from _imports(child, guarded)
+        for child in node.handlers + node.orelse + node.finalbody:
+            yield from _imports(child, optional)
+        return
+    for child in ast.iter_child_nodes(node):
+        yield from _imports(child, optional)
 
-            relative_import = re_relative_imports.match(line)
-            general_import = re_general_imports.match(line)
-            if relative_import:
-                if file.startswith("__"):
+
+def scan_imports(
+    name: str,
+    tree: ast.Module,
+    is_package: bool,
+    modules: Dict[str, str],
+    exports: Dict[str, str],
+) -> Tuple[Set[str], Set[str]]:
+    """
+    Resolves the modules of the package a module imports, anywhere in its body.
+
+    :returns: (Tuple[Set[:class:`str`], Set[:class:`str`]]) The required and the
+        optional imports.
+    """
+    required: Set[str] = set()
+    optional: Set[str] = set()
+    package = name if is_package else name.rpartition(".")[0]
+
+    # names bound to the package itself, to follow attribute access through them
+    aliases: Set[str] = set()
+
+    for node, guarded in _imports(tree):
+        found: Set[str] = set()
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                if alias.name.split(".")[0] != PACKAGE:
                     continue
-                else:
-                    code.extend(
-                        imports(
-                            root, relative_import.group(1).replace(".", "/", -1) + ".py"
-                        )
-                    )
-            elif general_import:
-                if general_import.group(0).startswith("from __"):
-                    future_imports.append(line)
-                else:
-                    general_imports.append(line)
-            elif line.startswith("if __name__"):
-                ignores_flag = True
+                found.add(alias.name)
+                if alias.asname is None:
+                    aliases.add(PACKAGE)
+                elif alias.name == PACKAGE:
+                    aliases.add(alias.asname)
+        elif isinstance(node, ast.ImportFrom):
+            if node.level:
+                parts = package.split(".")
+                if node.level > 1:
+                    parts = parts[: -(node.level - 1)]
+                base = ".".join(parts + ([node.module] if node.module else []))
+            else:
+                base = node.module or ""
+            if base.split(".")[0] != PACKAGE:
                 continue
+            found.add(base)
+            for alias in node.names:
+                if alias.name == "*" and base == PACKAGE:
+                    found.update(exports.values())
+                elif f"{base}.{alias.name}" in modules:
+                    found.add(f"{base}.{alias.name}")
+                elif base == PACKAGE and alias.name in exports:
+                    found.add(exports[alias.name])
+        (optional if guarded else required).update(found)
+
+    if aliases:
+        for node in ast.walk(tree):
+            if (
+                isinstance(node, ast.Attribute)
+                and isinstance(node.value, ast.Name)
+                and node.value.id in aliases
+            ):
+                attr = node.attr
+                if f"{PACKAGE}.{attr}" in modules:
+                    required.add(f"{PACKAGE}.{attr}")
+                elif attr in exports:
+                    required.add(exports[attr])
+
+    # drops attributes that were imported from a module, only modules are kept
+    required &= modules.keys()
+    optional &= modules.keys()
+    return required, optional - required
+
+
+def load(entry: Optional[str] = None, root: str = PACKAGE_ROOT) -> Dict[str, Module]:
+    """
+    Parses every module of the package, and the entry script when given, and
+    resolves their imports.
+    """
+    paths = find_modules(root)
+    trees = {name: _read(path) for name, path in paths.items()}
+    if entry is not None:
+        trees[ENTRY] = _read(entry)
+    exports = _lazy_exports(trees[PACKAGE])
+
+    modules = {}
+    for name, tree in trees.items():
+        path = entry if name == ENTRY else paths[name]
+        is_package = os.path.basename(path) == "__init__.py"  # type: ignore
+        requires, optional = scan_imports(name, tree, is_package, paths, exports)
+        modules[name] = Module(name, path, is_package, tree, requires, optional)  # type: ignore
+    return modules
+
+
+def _parents(name: str) -> List[str]:
+    parts = name.split(".")
+    return [".".join(parts[:i]) for i in range(1, len(parts))]
+
+
+def _is_excluded(name: str, exclude: Set[str]) -> bool:
+    return any(name == e or name.startswith(e + ".") for e in exclude)
+
+
+def shake(
+    modules: Dict[str, Module], roots: Iterable[str], exclude: Iterable[str] = ()
+) -> List[str]:
+    """
+    The modules reachable from the roots, importing a module also runs the
+    ``__init__`` of every package above it.
+
+    :param exclude:
+        Modules or packages to leave out, relative to the package, e.g. ``_3D``.
+        Leaving out a module that is imported without an ImportError guard is an error.
+    :type exclude: Iterable[:class:`str`]
+    """
+    excluded = {f"{PACKAGE}.{e}" if not e.startswith(PACKAGE) else e for e in exclude}
+    for name in excluded:
+        if name not in modules:
+            raise ValueError(f"there is no module {name} to exclude")
+
+    kept: Set[str] = set()
+    stack = list(roots)
+    while stack:
+        name = stack.pop()
+        if name in kept:
+            continue
+        kept.add(name)
+        module = modules[name]
+        for dep in sorted(module.requires) + _parents(name):
+            if _is_excluded(dep, excluded):
+                raise ValueError(
+                    f"{dep} is excluded but {name} imports it without an ImportError guard"
+                )
+            stack.append(dep)
+        for dep in module.optional:
+            if not _is_excluded(dep, excluded):
+                stack.append(dep)
+    return sorted(kept)
+
+
+def _pyc(code) -> bytes:
+    # an unchecked hash based pyc, there is no source in the archive to check against
+    return importlib.util.MAGIC_NUMBER + (0b01).to_bytes(4, "little") + bytes(8) + marshal.dumps(code)
+
+
+def bundle(
+    output: str,
+    entry: Optional[str] = None,
+    exclude: Iterable[str] = (),
+    optimize: int = 2,
+    interpreter: Optional[str] = "/usr/bin/env python3",
+    compress: bool = True,
+    root: str = PACKAGE_ROOT,
+) -> List[str]:
+    """
+    Writes a zipapp of the entry script and the modules of the package it uses,
+    without an entry the whole package is packed as an importable archive.
+
+    :param output:
+        The path of the ``.pyz`` archive.
+    :type output: :class:`str`
+    :param entry:
+        The script ran when the archive is executed.
+    :type entry: Optional[:class:`str`]
+    :param exclude:
+        Modules or packages to leave out, e.g. ``("_3D", "devices")``.
+    :type exclude: Iterable[:class:`str`]
+    :param optimize:
+        The optimization level the modules are compiled with, 2 also drops docstrings.
+    :type optimize: :class:`int`
+    :param interpreter:
+        The shebang line of the archive, none is written when None.
+    :type interpreter: Optional[:class:`str`]
+
+    :returns: (List[:class:`str`]) The names of the packed modules.
+    """
+    modules = load(entry, root)
+    if entry is not None:
+        roots = [ENTRY]
+    else:
+        roots = [name for name in modules if not name.startswith(f"{PACKAGE}.tools")]
+        excluded = {f"{PACKAGE}.{e}" for e in exclude}
+        roots = [name for name in roots if not _is_excluded(name, excluded)]
+    names = shake(modules, roots, exclude)
+
+    buffer = io.BytesIO()
+    method = zipfile.ZIP_DEFLATED if compress else zipfile.ZIP_STORED
+    with zipfile.ZipFile(buffer, "w", method) as archive:
+        for name in names:
+            module = modules[name]
+            if name == ENTRY:
+                arcname = "__main__.pyc"
             else:
-                code.append(line)
-    code.append('\n')
-    return code
+                arcname = name.replace(".", "/") + ("/__init__.pyc" if module.is_package else ".pyc")
+            code = compile(module.tree, module.path, "exec", optimize=optimize, dont_inherit=True)
+            info = zipfile.ZipInfo(arcname, (1980, 1, 1, 0, 0, 0))
+            info.compress_type = method
+            archive.writestr(info, _pyc(code))
 
+    with open(output, "wb") as f:
+        if interpreter:
+            f.write(b"#!" + interpreter.encode() + b"\n")
+        f.write(buffer.getvalue())
+    if interpreter and os.name != "nt":
+        os.chmod(output, 0o755)
+    return names
 
-if __name__ == "__main__":
-    for path in includes:
-        for file in os.listdir(path):
-            if file.endswith(".py") and file != "__init__.py":
-                code.extend(imports(path, file))
 
-    put_at_top(imports("Asciinpy", "__init__.py")[::-1])
-    put_at_top(general_imports)
-    put_at_top(future_imports)
+def main(argv=None):
+    parser = ArgumentParser(
+        prog="python -m Asciinpy.tools.condense",
+        description="Packs a game and the parts of Asciinpy it uses into a zipapp.",
+    )
+    parser.add_argument("entry", nargs="?", help="the game script, the whole package is packed without one")
+    parser.add_argument("-o", "--output", default=None, help="defaults to the entry with a .pyz suffix")
+    parser.add_argument(
+        "--exclude",
+        action="append",
+        default=[],
+        metavar="MODULE",
+        help="leave out a module or package of Asciinpy, e.g. _3D or devices",
+    )
+    parser.add_argument("--optimize", type=int, choices=(0, 1, 2), default=2)
+    parser.add_argument("--python", default="/usr/bin/env python3", help="the shebang interpreter")
+    parser.add_argument("--store", action="store_true", help="don't compress the archive")
+    args = parser.parse_args(argv)
+
+    output = args.output
+    if output is None:
+        output = os.path.splitext(args.entry)[0] + ".pyz" if args.entry else f"{PACKAGE}.pyz"
+
+    try:
+        names = bundle(output, args.entry, args.exclude, args.optimize, args.python, not args.store)
+    except ValueError as e:
+        parser.error(str(e))
+    print(f"packed {len(names)} modules into {output} ({os.path.getsize(output)} bytes)")
+    for name in names:
+        print(f"  {name}")
 
-    with open(outputs, "w") as py:
-        py.write("".join(code))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,297 @@
+"""
+A streaming image and video to ascii converter.
+
+Frames are read lazily from PGM/PPM files, a stream of concatenated PNM images
+or a raw RGB byte stream, area averaged down to the screen resolution and shaded
+with a :class:`~Asciinpy.values.Characters` ramp. Conversion can be spread over
+a process pool that works a bounded number of frames ahead of playback.
+
+.. code:: sh
+
+   ffmpeg -i clip.mp4 -f rawvideo -pix_fmt rgb24 -s 320x240 - | \\
+       python -m Asciinpy.tools.convert --raw 320x240 --size 100x50 --fps 24 -
+"""
+
+import sys
+
+from argparse import ArgumentParser
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import BinaryIO, Deque, Iterable, Iterator, NamedTuple, Optional, Tuple, Union
+
+from ..shading import Shader
+from ..values import Characters, Resolutions
+
+__all__ = [
+    "Image",
+    "read_pnm",
+    "read_pnm_stream",
+    "read_raw_stream",
+    "read_paths",
+    "downsample",
+    "convert_image",
+    "convert",
+]
+
+Size = Tuple[int, int]
+
+# ITU-R BT.601 luma weights
+LUMA_WEIGHTS = (0.299, 0.587, 0.114)
+PNM_WHITESPACE = b" \t\r\n\x0b\x0c"
+
+
+class Image(NamedTuple):
+    """
+    A decoded frame of 8 bit samples, row-major with interleaved channels.
+    """
+
+    width: int
+    height: int
+    channels: int
+    data: bytes
+
+
+def _read_token(stream: BinaryIO) -> bytes:
+    token = b""
+    while True:
+        ch = stream.read(1)
+        if not ch:
+            return token
+        if ch == b"#" and not token:
+            # comments run until the end of the line
+            while ch not in (b"\n", b"\r", b""):
+                ch = stream.read(1)
+            continue
+        if ch in PNM_WHITESPACE:
+            if token:
+                return token
+            continue
+        token += ch
+
+
+def read_pnm(stream: BinaryIO) -> Optional[Image]:
+    """
+    Reads one binary PGM (P5) or PPM (P6) image from the stream.
+
+    :returns: (Optional[:class:`Image`]) The image or None when the stream is exhausted.
+    """
+    magic = _read_token(stream)
+    if not magic:
+        return None
+    if magic not in (b"P5", b"P6"):
+        raise ValueError(f"unsupported netpbm format {magic!r}, only P5 and P6 are")
+
+    try:
+        width, height, maxval = (int(_read_token(stream)) for _ in range(3))
+    except ValueError:
+        raise ValueError("malformed netpbm header") from None
+    channels = 3 if magic == b"P6" else 1
+    sample_size = 1 if maxval < 256 else 2
+
+    size = width * height * channels * sample_size
+    data = stream.read(size)
+    if len(data) != size:
+        raise ValueError(f"netpbm image is truncated, expected {size} bytes and got {len(data)}")
+
+    if sample_size == 2:
+        # keep the most significant byte of big endian samples
+        data = data[0::2]
+        maxval >>= 8
+    if maxval != 255:
+        data = bytes(min(255, (v * 255) // maxval) for v in data)
+    return Image(width, height, channels, data)
+
+
+def read_pnm_stream(stream: BinaryIO) -> Iterator[Image]:
+    """
+    Lazily reads back to back PNM images, the format ``ffmpeg -f image2pipe -c:v ppm`` writes.
+    """
+    while True:
+        image = read_pnm(stream)
+        if image is None:
+            return
+        yield image
+
+
+def read_raw_stream(stream: BinaryIO, size: Size, channels: int = 3) -> Iterator[Image]:
+    """
+    Lazily reads raw frames of the given size, ``rgb24`` by default, until the stream
+    runs out. A trailing partial frame is dropped.
+    """
+    width, height = size
+    frame_size = width * height * channels
+    while True:
+        data = stream.read(frame_size)
+        if len(data) != frame_size:
+            return
+        yield Image(width, height, channels, data)
+
+
+def read_paths(paths: Iterable[str]) -> Iterator[Image]:
+    """
+    Lazily reads every image of every PNM file, a file may hold several images.
+    """
+    for path in paths:
+        if path == "-":
+            yield from read_pnm_stream(sys.stdin.buffer)
+        else:
+            with open(path, "rb") as f:
+                yield from read_pnm_stream(f)
+
+
+def _bounds(source: int, target: int):
+    edges = [(i * source) // target for i in range(target + 1)]
+    return [(edges[i], max(edges[i + 1], edges[i] + 1)) for i in range(target)]
+
+
+def downsample(image: Image, size: Size) -> bytes:
+    """
+    Area averages an image down to the given size and returns its luminance,
+    one byte per cell.
+
+    Each cell is the mean of the box of source pixels it covers, the boxes are
+    summed a source row and a channel at a time with slices so the work stays
+    inside the interpreter's C loops.
+    """
+    width, height = size
+    channels = image.channels
+    row_len = image.width * channels
+    data = image.data
+    columns = _bounds(image.width, width)
+    weights = LUMA_WEIGHTS if channels == 3 else (1.0,) + (0.0,) * (channels - 1)
+
+    out = bytearray(width * height)
+    for j, (y0, y1) in enumerate(_bounds(image.height, height)):
+        sums = [0.0] * width
+        for y in range(y0, y1):
+            row = data[y * row_len : (y + 1) * row_len]
+            for c, weight in enumerate(weights):
+                if not weight:
+                    continue
+                channel = row[c::channels]
+                for i, (x0, x1) in enumerate(columns):
+                    sums[i] += weight * sum(channel[x0:x1])
+
+        rows = y1 - y0
+        base = j * width
+        for i, (x0, x1) in enumerate(columns):
+            out[base + i] = min(255, int(sums[i] / ((x1 - x0) * rows) + 0.5))
+    return bytes(out)
+
+
+def convert_image(
+    image: Image,
+    size: Size,
+    palette: str = Characters.some,
+    gamma: float = 1.0,
+    dither: bool = False,
+) -> str:
+    """
+    Converts an image into a frame of the given size.
+
+    :returns: (:class:`str`) The frame as one line of ``width * height`` glyphs, the
+        same layout as :attr:`Asciinpy.screen.Screen.frame`.
+    """
+    return Shader.get(palette, gamma, dither).shade(downsample(image, size), size[0])
+
+
+def convert(
+    images: Iterable[Image],
+    resolution: Union[Resolutions, Size],
+    palette: str = Characters.some,
+    gamma: float = 1.0,
+    dither: bool = False,
+    workers: Optional[int] = None,
+    prefetch: int = 8,
+) -> Iterator[str]:
+    """
+    Lazily converts images into frames for :meth:`Asciinpy.screen.Window.replay`.
+
+    With ``workers``, frames are converted in a process pool which is kept at most
+    ``prefetch`` frames ahead of the consumer, images are only read from the source
+    as pool slots free up.
+
+    :param images:
+        The source of the images, e.g. :func:`read_raw_stream`.
+    :type images: Iterable[:class:`Image`]
+    :param resolution:
+        The resolution of the frames.
+    :type resolution: Union[:class:`~Asciinpy.values.Resolutions`, Tuple[:class:`int`, :class:`int`]]
+    :param workers:
+        The number of worker processes, conversion happens inline when None.
+    :type workers: Optional[:class:`int`]
+    :param prefetch:
+        The number of frames converted ahead of playback.
+    :type prefetch: :class:`int`
+    """
+    if isinstance(resolution, Resolutions):
+        size = (resolution.width, resolution.height)
+    else:
+        size = tuple(resolution)
+
+    if workers is None:
+        for image in images:
+            yield convert_image(image, size, palette, gamma, dither)  # type: ignore
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending: Deque = deque()
+        source = iter(images)
+        for image in source:
+            pending.append(pool.submit(convert_image, image, size, palette, gamma, dither))
+            if len(pending) >= prefetch:
+                break
+        while pending:
+            frame = pending.popleft().result()
+            image = next(source, None)
+            if image is not None:
+                pending.append(pool.submit(convert_image, image, size, palette, gamma, dither))
+            yield frame
+
+
+def _size(value: str) -> Size:
+    width, _, height = value.lower().partition("x")
+    return int(width), int(height)
+
+
+def main(argv=None):
+    parser = ArgumentParser(
+        prog="python -m Asciinpy.tools.convert",
+        description="Plays PGM/PPM images or raw RGB video as ascii frames.",
+    )
+    parser.add_argument("inputs", nargs="+", help="PNM files, '-' reads stdin")
+    parser.add_argument("--raw", type=_size, metavar="WxH", help="read stdin as raw rgb24 frames of this size")
+    parser.add_argument("--size", type=_size, metavar="WxH", default=Resolutions.Large.value)
+    parser.add_argument("--palette", choices=("some", "all"), default="some")
+    parser.add_argument("--gamma", type=float, default=1.0)
+    parser.add_argument("--dither", action="store_true")
+    parser.add_argument("--fps", type=int, default=24)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--prefetch", type=int, default=8)
+    args = parser.parse_args(argv)
+
+    from ..screen import Window
+
+    if args.raw is not None:
+        images = read_raw_stream(sys.stdin.buffer, args.raw)
+    else:
+        images = read_paths(args.inputs)
+
+    window = Window(resolution=args.size)
+    frames = convert(
+        images,
+        args.size,
+        getattr(Characters, args.palette),
+        args.gamma,
+        args.dither,
+        args.workers,
+        args.prefetch,
+    )
+    try:
+        window.replay(frames, args.fps)
+    except RuntimeError:
+        pass
+
+
+if __name__ == "__main__":
+    main()
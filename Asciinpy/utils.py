@@ -1,10 +1,16 @@
-import inspect
+import gc
+import json
+import os
+import sys
 
+from array import array
+from collections import deque
 from functools import wraps
+from math import ceil
 from io import StringIO
-from cProfile import Profile
-from pstats import Stats
-from typing import Iterable, Literal, Tuple, List, Union, Callable
+from threading import Lock, current_thread, get_ident
+from time import perf_counter_ns
+from typing import Dict, Iterable, Literal, Optional, Sequence, Set, Tuple, List, Union, Callable
 
 from .globals import CWD
 from .types import AnyInt, AnyIntCoordinate
@@ -44,6 +50,8 @@ class Profiler:
         """
         Starts gathering statistics.
         """
+        from cProfile import Profile
+
         self.cpf = Profile()
         self.cpf.enable()
 
@@ -51,6 +59,8 @@ class Profiler:
         """
         Stop gathering statistics.
         """
+        from pstats import Stats
+
         self.cpf.disable()
         redirect = StringIO()
         Stats(self.cpf, stream=redirect).sort_stats("time").print_stats()
@@ -58,6 +68,746 @@ class Profiler:
             f.write(redirect.getvalue().replace(CWD, "", -1))
 
 
+def percentile(ordered: Sequence[float], q: float) -> float:
+    """
+    The nearest-rank percentile of an already sorted sequence, 0 when it is empty.
+    """
+    if not ordered:
+        return 0.0
+    rank = max(0, min(len(ordered) - 1, ceil(q / 100 * len(ordered)) - 1))
+    return ordered[rank]
+
+
+def _unroll(ring: array, count: int) -> List[int]:
+    """
+    The values of a ring buffer that ``count`` values were written into, oldest first.
+    """
+    if count <= len(ring):
+        return ring[:count].tolist()
+    start = count % len(ring)
+    return (ring[start:] + ring[:start]).tolist()
+
+
+def _describe(values: Iterable[float], percentiles: Iterable[float], scale: float = 1) -> Dict[str, float]:
+    """
+    The percentiles and mean of the values divided by scale, keyed ``p50`` .. ``mean``.
+    """
+    ordered = sorted(values)
+    stats = {f"p{q:g}": percentile(ordered, q) / scale for q in percentiles}
+    stats["mean"] = sum(ordered) / len(ordered) / scale if ordered else 0.0
+    return stats
+
+
+class FrameProfiler:
+    """
+    A low overhead per-frame profiler of the phases of :meth:`Screen.refresh
+    <Asciinpy.screen.Screen.refresh>`.
+
+    Unlike :class:`Profiler` this doesn't hook every function call, the screen takes
+    a :func:`time.perf_counter_ns` reading at the edge of each phase and the
+    nanoseconds spent are kept for the last ``frames`` frames in a ring buffer, so it
+    can be left on.
+
+    .. code:: py
+
+       @window.loop()
+       def loop(screen):
+           screen.profiler = FrameProfiler()
+           ...
+           print(screen.profiler.summary()["write"])
+
+    Phases:
+        **loop** - the client loop between two refreshes, without the blits
+
+        **blit** - :meth:`Screen.blit <Asciinpy.screen.Screen.blit>` calls
+
+        **infograph** - the debug menu
+
+        **join** - joining the frame into a string
+
+        **encode** - encoding the frame to bytes
+
+        **write** - writing it out to the terminal
+
+    :param frames:
+        The number of most recent frames kept.
+    :type frames: :class:`int`
+    """
+
+    PHASES = ("loop", "blit", "infograph", "join", "encode", "write")
+    LOOP, BLIT, INFOGRAPH, JOIN, ENCODE, WRITE = range(6)
+
+    __slots__ = ("frames", "count", "_samples", "_current", "_frame_started")
+
+    def __init__(self, frames: int = 240):
+        if frames < 1:
+            raise ValueError("frames must be at least one")
+        self.frames = frames
+        self.count = 0
+        self._samples = array("q", bytes(8 * frames * len(self.PHASES)))
+        self._current = [0] * len(self.PHASES)
+        self._frame_started = perf_counter_ns()
+
+    def record(self, phase: int, start: int, end: int):
+        """
+        Adds the nanoseconds from start to end to a phase of the current frame.
+        """
+        self._current[phase] += end - start
+
+    def start_frame(self, start: int):
+        """
+        Marks where the client loop of the next frame starts, after frame pacing.
+        """
+        self._frame_started = start
+
+    def end_frame(self, end: int):
+        """
+        Stores the current frame in the ring buffer, the time since the frame started
+        that no other phase accounts for is the client loop.
+        """
+        current = self._current
+        current[self.LOOP] += end - self._frame_started - sum(current)
+        offset = (self.count % self.frames) * len(current)
+        self._samples[offset : offset + len(current)] = array("q", current)
+        self.count += 1
+        self._current = [0] * len(current)
+
+    def samples(self, phase: str) -> List[int]:
+        """
+        The nanoseconds spent in a phase by each kept frame, oldest first.
+        """
+        i = self.PHASES.index(phase)
+        return _unroll(self._samples[i :: len(self.PHASES)], self.count)
+
+    def summary(self, percentiles: Iterable[float] = (50, 95, 99)) -> Dict[str, Dict[str, float]]:
+        """
+        The percentiles and mean of each phase in milliseconds, e.g.
+        ``{"write": {"p50": 0.21, "p95": 0.4, "p99": 0.9, "mean": 0.25}}``.
+        """
+        percentiles = tuple(percentiles)
+        return {phase: _describe(self.samples(phase), percentiles, 1e6) for phase in self.PHASES}
+
+    def dump(self, path: str):
+        """
+        Writes the summary and the kept samples as JSON.
+        """
+        with open(path, "w") as f:
+            json.dump(
+                {
+                    "frames": min(self.count, self.frames),
+                    "summary": self.summary(),
+                    "samples": {phase: self.samples(phase) for phase in self.PHASES},
+                },
+                f,
+            )
+
+
+class FrameMetrics:
+    """
+    The frame times of a screen, kept for the last ``frames`` frames in a ring buffer.
+
+    Every :class:`~Asciinpy.screen.Screen` keeps one on :attr:`Screen.metrics
+    <Asciinpy.screen.Screen.metrics>`. A frame lasts from one refresh to the next,
+    the time the client loop spent rendering it and the time spent writing it out
+    are kept apart. Tail latency tells more than averages do, so the frame times are
+    reported as percentiles.
+
+    .. code:: py
+
+       summary = screen.metrics.summary()
+       print(summary["frame"]["p99"], summary["jitter"], summary["missed"])
+
+    :param frames:
+        The number of most recent frames kept.
+    :type frames: :class:`int`
+    """
+
+    __slots__ = ("frames", "count", "missed", "memory", "_durations", "_render", "_output")
+
+    def __init__(self, frames: int = 240):
+        if frames < 1:
+            raise ValueError("frames must be at least one")
+        self.frames = frames
+        self.count = 0
+        # frames whose render and output took longer than the frame budget of max_fps
+        self.missed = 0
+        # allocations and collections, instrumented when a MemoryProfiler is set
+        self.memory: Optional[MemoryProfiler] = None
+        self._durations = array("q", bytes(8 * frames))
+        self._render = array("q", bytes(8 * frames))
+        self._output = array("q", bytes(8 * frames))
+
+    def record(self, duration: int, render: int, output: int, budget: int = 0):
+        """
+        Stores the nanoseconds a frame lasted and spent rendering and writing out.
+
+        :param budget:
+            The nanoseconds a frame has under the fps cap, 0 when uncapped.
+        :type budget: :class:`int`
+        """
+        i = self.count % self.frames
+        self._durations[i] = duration
+        self._render[i] = render
+        self._output[i] = output
+        self.count += 1
+        if budget and render + output > budget:
+            self.missed += 1
+
+    def durations(self) -> List[int]:
+        """
+        The nanoseconds each kept frame lasted, oldest first.
+        """
+        return _unroll(self._durations, self.count)
+
+    def render_times(self) -> List[int]:
+        """
+        The nanoseconds the client loop spent on each kept frame, oldest first.
+        """
+        return _unroll(self._render, self.count)
+
+    def output_times(self) -> List[int]:
+        """
+        The nanoseconds each kept frame took to be written out, oldest first.
+        """
+        return _unroll(self._output, self.count)
+
+    @property
+    def fps(self) -> float:
+        """
+        The frames per second over the kept frames.
+        """
+        total = sum(self._durations[: min(self.count, self.frames)])
+        return min(self.count, self.frames) * 1e9 / total if total else 0.0
+
+    @property
+    def jitter(self) -> float:
+        """
+        The mean difference in nanoseconds between the durations of consecutive frames.
+        """
+        durations = self.durations()
+        if len(durations) < 2:
+            return 0.0
+        return sum(abs(b - a) for a, b in zip(durations, durations[1:])) / (len(durations) - 1)
+
+    def percentiles(self, *qs: float) -> List[float]:
+        """
+        Percentiles of the frame durations in nanoseconds.
+        """
+        ordered = sorted(self.durations())
+        return [percentile(ordered, q) for q in qs]
+
+    def summary(self, percentiles: Iterable[float] = (50, 95, 99)) -> Dict[str, object]:
+        """
+        The percentiles and mean of the frame, render and output times in milliseconds
+        along with the jitter in milliseconds, the missed deadlines and the fps.
+        """
+        percentiles = tuple(percentiles)
+        result: Dict[str, object] = {}
+        for name, values in (
+            ("frame", self.durations()),
+            ("render", self.render_times()),
+            ("output", self.output_times()),
+        ):
+            result[name] = _describe(values, percentiles, 1e6)
+        result["jitter"] = self.jitter / 1e6
+        result["missed"] = self.missed
+        result["fps"] = self.fps
+        if self.memory is not None:
+            result["memory"] = self.memory.summary()
+        return result
+
+    def dump(self, path: str):
+        """
+        Writes the summary and the kept frame times as JSON, along with the
+        collections and snapshots of :attr:`memory` when it's set.
+        """
+        data = {
+            "frames": min(self.count, self.frames),
+            "summary": self.summary(),
+            "samples": {
+                "frame": self.durations(),
+                "render": self.render_times(),
+                "output": self.output_times(),
+            },
+        }
+        if self.memory is not None:
+            data["memory"] = self.memory.report()
+        with open(path, "w") as f:
+            json.dump(data, f)
+
+
+class MemoryProfiler:
+    """
+    An opt-in per-frame instrumentation of allocations and garbage collections,
+    set on :attr:`FrameMetrics.memory` to be reported along with the frame times.
+
+    Every frame it keeps the net number of objects tracked by the garbage collector
+    that were allocated, the net number of memory blocks allocated and the time the
+    collector paused the program for. Collections are timed through
+    :data:`gc.callbacks` and noted with the frame they overlapped and what the screen
+    was doing, the name of the :class:`~Asciinpy.objects.Blitable` being blitted,
+    ``present`` while the frame is written out or ``loop`` for the client loop.
+
+    Every ``snapshot_every`` frames a :mod:`tracemalloc` snapshot is compared to the
+    previous one and the lines that allocated the most in between are kept,
+    tracemalloc slows every allocation down so snapshots are off unless asked for.
+
+    .. code:: py
+
+       with MemoryProfiler(snapshot_every=120) as memory:
+           screen.metrics.memory = memory
+           ...
+           screen.metrics.dump("frames.json")
+
+    :param frames:
+        The number of most recent frames kept.
+    :type frames: :class:`int`
+    :param snapshot_every:
+        The frames between tracemalloc snapshots, 0 to never take one.
+    :type snapshot_every: :class:`int`
+    :param top:
+        The number of lines kept of every snapshot comparison.
+    :type top: :class:`int`
+    """
+
+    __slots__ = (
+        "frames",
+        "count",
+        "phase",
+        "snapshot_every",
+        "top",
+        "collections",
+        "snapshots",
+        "_allocated",
+        "_blocks",
+        "_pauses",
+        "_gen0",
+        "_carried",
+        "_block_count",
+        "_paused",
+        "_collecting",
+        "_snapshot",
+        "_tracing",
+    )
+
+    def __init__(self, frames: int = 240, snapshot_every: int = 0, top: int = 10):
+        if frames < 1:
+            raise ValueError("frames must be at least one")
+        self.frames = frames
+        self.count = 0
+        self.phase = "loop"
+        self.snapshot_every = snapshot_every
+        self.top = top
+        # (frame, phase, generation, milliseconds, collected) of the latest collections
+        self.collections = deque(maxlen=frames)
+        # (frame, [(line, size difference, count difference)]) of the latest snapshots
+        self.snapshots = deque(maxlen=16)
+        self._allocated = array("q", bytes(8 * frames))
+        self._blocks = array("q", bytes(8 * frames))
+        self._pauses = array("q", bytes(8 * frames))
+        self._gen0 = 0
+        self._carried = 0
+        self._block_count = 0
+        self._paused = 0
+        self._collecting = 0
+        self._snapshot = None
+        self._tracing = False
+
+    def __enter__(self) -> "MemoryProfiler":
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def start(self):
+        """
+        Hooks into the garbage collector and starts tracemalloc when snapshots are taken.
+        """
+        if self._on_gc not in gc.callbacks:
+            gc.callbacks.append(self._on_gc)
+        if self.snapshot_every:
+            import tracemalloc
+
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._tracing = True
+            self._snapshot = tracemalloc.take_snapshot()
+        self._gen0 = gc.get_count()[0]
+        self._block_count = sys.getallocatedblocks()
+
+    def stop(self):
+        if self._on_gc in gc.callbacks:
+            gc.callbacks.remove(self._on_gc)
+        if self._tracing:
+            import tracemalloc
+
+            tracemalloc.stop()
+            self._tracing = False
+        self._snapshot = None
+
+    def _on_gc(self, phase: str, info: dict):
+        if phase == "start":
+            # the young generation is emptied by the collection, what was allocated
+            # into it so far is carried over to the end of the frame
+            self._carried += gc.get_count()[0]
+            self._collecting = perf_counter_ns()
+            return
+        if not self._collecting:
+            return
+        end = perf_counter_ns()
+        elapsed = end - self._collecting
+        self._paused += elapsed
+        self.collections.append(
+            (self.count, self.phase, info["generation"], elapsed / 1e6, info["collected"])
+        )
+        tracer = Tracer.active
+        if tracer is not None:
+            tracer.span(
+                f"gc gen{info['generation']}", "gc", self._collecting, end, {"phase": self.phase}
+            )
+        self._collecting = 0
+
+    def end_frame(self):
+        """
+        Stores the allocations and collector pauses of the current frame.
+        """
+        gen0 = gc.get_count()[0]
+        blocks = sys.getallocatedblocks()
+        i = self.count % self.frames
+        self._allocated[i] = self._carried + gen0 - self._gen0
+        self._blocks[i] = blocks - self._block_count
+        self._pauses[i] = self._paused
+        self._gen0, self._block_count = gen0, blocks
+        self._carried = self._paused = 0
+        self.count += 1
+
+        if self._snapshot is not None and self.count % self.snapshot_every == 0:
+            import tracemalloc
+
+            snapshot = tracemalloc.take_snapshot().filter_traces(
+                (tracemalloc.Filter(False, tracemalloc.__file__),)
+            )
+            stats = snapshot.compare_to(self._snapshot, "lineno")[: self.top]
+            self.snapshots.append(
+                (self.count, [(str(s.traceback), s.size_diff, s.count_diff) for s in stats])
+            )
+            self._snapshot = snapshot
+
+    def allocations(self) -> List[int]:
+        """
+        The net objects tracked by the garbage collector allocated by each kept frame,
+        oldest first.
+        """
+        return _unroll(self._allocated, self.count)
+
+    def blocks(self) -> List[int]:
+        """
+        The net memory blocks allocated by each kept frame, oldest first.
+        """
+        return _unroll(self._blocks, self.count)
+
+    def pauses(self) -> List[int]:
+        """
+        The nanoseconds each kept frame was paused by collections, oldest first.
+        """
+        return _unroll(self._pauses, self.count)
+
+    def summary(self, percentiles: Iterable[float] = (50, 95, 99)) -> Dict[str, object]:
+        """
+        The percentiles and mean of the allocations, blocks and pauses in milliseconds
+        per frame, along with the milliseconds collections took during each phase.
+        """
+        percentiles = tuple(percentiles)
+        result: Dict[str, object] = {}
+        for name, values, scale in (
+            ("allocated", self.allocations(), 1),
+            ("blocks", self.blocks(), 1),
+            ("gc", self.pauses(), 1e6),
+        ):
+            result[name] = _describe(values, percentiles, scale)
+        phases: Dict[str, float] = {}
+        for _, phase, _, elapsed, _ in self.collections:
+            phases[phase] = phases.get(phase, 0.0) + elapsed
+        result["collections"] = len(self.collections)
+        result["phases"] = phases
+        return result
+
+    def report(self) -> Dict[str, object]:
+        """
+        Everything kept, as written out by :meth:`FrameMetrics.dump`.
+        """
+        return {
+            "summary": self.summary(),
+            "allocated": self.allocations(),
+            "blocks": self.blocks(),
+            "gc": self.pauses(),
+            "collections": [
+                dict(zip(("frame", "phase", "generation", "ms", "collected"), c))
+                for c in self.collections
+            ],
+            "snapshots": [{"frame": frame, "top": top} for frame, top in self.snapshots],
+        }
+
+
+class GCPolicy:
+    """
+    A frame aware garbage collection policy, automatic collections are disabled
+    while it runs and the collector is only ran in the time a frame has left before
+    the next one is due.
+
+    The young, middle and old generations are collected incrementally, the oldest
+    generation that is due and whose collection fits in the slack left by the fps
+    pacing is collected. The cost of each generation is the worst of its recent
+    collections. When a frame never has enough slack, as when the fps is uncapped,
+    a collection is forced once ``force_after`` objects were allocated into the
+    young generation or an old generation collection is overdue by ``overdue``
+    frames.
+
+    Give it to a :class:`~Asciinpy.screen.Window` to have it started and stopped
+    along with the client loop.
+
+    .. code:: py
+
+       window = Window(Resolutions.Basic, max_fps=60, gc_policy=GCPolicy())
+
+    :param force_after:
+        The young objects allocated after which a collection is forced.
+    :type force_after: :class:`int`
+    :param overdue:
+        The frames an old generation collection can wait for slack.
+    :type overdue: :class:`int`
+    :param freeze:
+        Whether everything alive when started, such as what imports made, is moved
+        out of the collector's sight with :func:`gc.freeze`.
+    :type freeze: :class:`bool`
+    """
+
+    __slots__ = (
+        "force_after",
+        "overdue",
+        "freeze",
+        "collections",
+        "forced",
+        "spent",
+        "_cost",
+        "_waiting",
+        "_was_enabled",
+    )
+
+    def __init__(self, force_after: int = 50_000, overdue: int = 300, freeze: bool = True):
+        self.force_after = force_after
+        self.overdue = overdue
+        self.freeze = freeze
+        # the collections ran of every generation, how many were forced and the
+        # nanoseconds they took
+        self.collections = [0, 0, 0]
+        self.forced = 0
+        self.spent = 0
+        self._cost = [0, 0, 0]
+        self._waiting = 0
+        self._was_enabled: Optional[bool] = None
+
+    def start(self):
+        """
+        Disables automatic collections.
+        """
+        if self._was_enabled is None:
+            self._was_enabled = gc.isenabled()
+        gc.disable()
+        if self.freeze:
+            gc.freeze()
+
+    def stop(self):
+        """
+        Restores automatic collections if they were enabled before.
+        """
+        if self.freeze:
+            gc.unfreeze()
+        if self._was_enabled:
+            gc.enable()
+        self._was_enabled = None
+
+    def collect(self, slack: float) -> int:
+        """
+        Collects the oldest due generation that fits in the slack or is forced.
+
+        :param slack:
+            The seconds left until the next frame is due.
+        :type slack: :class:`float`
+
+        :returns: (:class:`int`) The generation collected, -1 when none was.
+        """
+        counts = gc.get_count()
+        thresholds = gc.get_threshold()
+        due = -1
+        for generation in range(3):
+            if counts[generation] >= thresholds[generation]:
+                due = generation
+        if due < 0:
+            return -1
+        if due == 2:
+            self._waiting += 1
+
+        budget = slack * 1e9
+        for generation in range(due, -1, -1):
+            if self._cost[generation] <= budget:
+                return self._run(generation)
+        if counts[0] >= self.force_after or self._waiting > self.overdue:
+            self.forced += 1
+            return self._run(due)
+        return -1
+
+    def _run(self, generation: int) -> int:
+        start = perf_counter_ns()
+        gc.collect(generation)
+        elapsed = perf_counter_ns() - start
+        # a worst case that slowly forgets, so one slow collection isn't held forever
+        self._cost[generation] = max(elapsed, self._cost[generation] * 7 // 8)
+        self.collections[generation] += 1
+        self.spent += elapsed
+        if generation == 2:
+            self._waiting = 0
+        return generation
+
+
+class Tracer:
+    """
+    Streams a timeline of the frames, event dispatches and keyboard reads as Chrome
+    trace-event JSON that ``chrome://tracing`` and Perfetto open.
+
+    Set it as :attr:`Screen.profiler <Asciinpy.screen.Screen.profiler>` to trace the
+    phases of every refresh, events and the keyboard are traced from every thread
+    for as long as the tracer is started. Events are buffered and written out in
+    chunks of ``chunk`` events so memory stays bounded on long runs.
+
+    .. code:: py
+
+       with Tracer("trace.json") as tracer:
+           screen.profiler = tracer
+           ...
+
+    :param path:
+        The JSON file written to.
+    :type path: :class:`str`
+    :param chunk:
+        The number of events buffered before they are written out.
+    :type chunk: :class:`int`
+    :param profiler:
+        A frame profiler the phases are also recorded on.
+    :type profiler: Optional[:class:`FrameProfiler`]
+    """
+
+    # the started tracer, read by the instrumented modules
+    active: Optional["Tracer"] = None
+
+    __slots__ = (
+        "path",
+        "chunk",
+        "profiler",
+        "_file",
+        "_buffer",
+        "_lock",
+        "_origin",
+        "_pid",
+        "_threads",
+        "_frame_started",
+        "_written",
+    )
+
+    def __init__(self, path: str, chunk: int = 1024, profiler: Optional[FrameProfiler] = None):
+        self.path = path
+        self.chunk = chunk
+        self.profiler = profiler
+        self._file = None
+        self._buffer: List[str] = []
+        self._lock = Lock()
+        self._origin = perf_counter_ns()
+        self._pid = os.getpid()
+        self._threads: Set[int] = set()
+        self._frame_started = self._origin
+        self._written = 0
+
+    def __enter__(self) -> "Tracer":
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def start(self):
+        """
+        Opens the trace file and makes this the active tracer.
+        """
+        if self._file is None:
+            self._file = open(self.path, "w")
+            self._file.write("[\n")
+        Tracer.active = self
+
+    def stop(self):
+        """
+        Writes out the buffered events and closes the trace file.
+        """
+        if Tracer.active is self:
+            Tracer.active = None
+        with self._lock:
+            if self._file is None:
+                return
+            self._flush()
+            self._file.write("\n]\n")
+            self._file.close()
+            self._file = None
+
+    def span(self, name: str, category: str, start: int, end: int, args: Optional[dict] = None):
+        """
+        Adds a complete event from start to end, :func:`time.perf_counter_ns` readings,
+        on the calling thread.
+        """
+        tid = get_ident()
+        event = (
+            f'{{"name":{json.dumps(name)},"cat":"{category}","ph":"X","pid":{self._pid},'
+            f'"tid":{tid},"ts":{(start - self._origin) / 1000:.3f},"dur":{(end - start) / 1000:.3f}'
+        )
+        if args:
+            event += f',"args":{json.dumps(args, default=str)}'
+        event += "}"
+
+        with self._lock:
+            if tid not in self._threads:
+                self._threads.add(tid)
+                self._buffer.append(
+                    f'{{"name":"thread_name","ph":"M","pid":{self._pid},"tid":{tid},'
+                    f'"args":{{"name":{json.dumps(current_thread().name)}}}}}'
+                )
+            self._buffer.append(event)
+            if len(self._buffer) >= self.chunk:
+                self._flush()
+
+    def _flush(self):
+        if not self._buffer or self._file is None:
+            return
+        if self._written:
+            self._file.write(",\n")
+        self._file.write(",\n".join(self._buffer))
+        self._written += len(self._buffer)
+        self._buffer.clear()
+
+    def record(self, phase: int, start: int, end: int):
+        self.span(FrameProfiler.PHASES[phase], "frame", start, end)
+        if self.profiler is not None:
+            self.profiler.record(phase, start, end)
+
+    def start_frame(self, start: int):
+        self._frame_started = start
+        if self.profiler is not None:
+            self.profiler.start_frame(start)
+
+    def end_frame(self, end: int):
+        self.span("frame", "frame", self._frame_started, end)
+        if self.profiler is not None:
+            self.profiler.end_frame(end)
+
+
 def get_floor(_2d_coords: Iterable[AnyIntCoordinate]) -> List[AnyInt]:
     """
     Takes in a 2d array of coordinates and returns the floor coordinate.
@@ -230,4 +980,7 @@ def isinstancemethod(func: Callable) -> bool:
     """
     Returns whether if a given function is a staticmethod or an instancemethod/classmethod.
     """
-    return "self" in inspect.getfullargspec(func)[0]
+    code = getattr(func, "__code__", None)
+    if code is None:
+        return False
+    return "self" in code.co_varnames[: code.co_argcount]
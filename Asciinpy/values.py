@@ -1,6 +1,8 @@
+import os
+
 from enum import Enum
 from random import randint
-from typing import Tuple, Union
+from typing import Dict, Mapping, Optional, Tuple, Union
 
 
 class ColorLayer(Enum):
@@ -9,20 +11,111 @@ class ColorLayer(Enum):
     Unknown = 2
 
 
+class ColorDepth(Enum):
+    """
+    The colours a terminal can show, a colour is written out as the nearest colour
+    of the palette the terminal has.
+
+    Members:
+        **TrueColor** = 24 bit colours as they are.
+
+        **Palette256** = The 6x6x6 colour cube and the grey ramp of xterm.
+
+        **Palette16** = The 16 standard colours.
+    """
+
+    TrueColor = 24
+    Palette256 = 8
+    Palette16 = 4
+
+    @staticmethod
+    def detect(environ: Optional[Mapping[str, str]] = None) -> "ColorDepth":
+        """
+        Guesses the colours the terminal supports from ``COLORTERM`` and ``TERM``.
+
+        :param environ:
+            The environment variables, those of the process when None.
+        :type environ: Optional[Mapping[:class:`str`, :class:`str`]]
+        """
+        if environ is None:
+            environ = os.environ
+        if environ.get("COLORTERM", "").lower() in ("truecolor", "24bit"):
+            return ColorDepth.TrueColor
+        term = environ.get("TERM", "").lower()
+        if "truecolor" in term or "24bit" in term or "direct" in term:
+            return ColorDepth.TrueColor
+        if "256" in term:
+            return ColorDepth.Palette256
+        if not term and os.name == "nt":
+            # the console of windows 10 and the windows terminal take 24 bit colours
+            return ColorDepth.TrueColor
+        return ColorDepth.Palette16
+
+
 class Color:
-    __slots__ = ("rgb", "layer")
+    """
+    A colour of a layer, colours are immutable and compare equal by their value.
+
+    Its SGR sequence is encoded once when it is created rather than every time the
+    colour is written out, the sequences of the palettes once they are first asked for.
+    """
+
+    __slots__ = ("rgb", "layer", "_sgr", "_sgr256", "_sgr16")
 
     def __init__(self, r: int, g: int, b: int, layer: ColorLayer=ColorLayer.Unknown) -> None:
         self.rgb = r, g, b
         self.layer = layer
-
-    def ansi(self):
-        if self.layer is ColorLayer.Foreground:
-            return ANSI.CSI + "38;2;{};{};{}m".format(*self.rgb)
-        elif self.layer is ColorLayer.Background:
-            return ANSI.CSI + "48;2;{};{};{}m".format(*self.rgb)
+        if layer is ColorLayer.Foreground:
+            self._sgr: Optional[str] = ANSI.CSI + "38;2;{};{};{}m".format(r, g, b)
+        elif layer is ColorLayer.Background:
+            self._sgr = ANSI.CSI + "48;2;{};{};{}m".format(r, g, b)
         else:
+            self._sgr = None
+        self._sgr256: Optional[str] = None
+        self._sgr16: Optional[str] = None
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Color):
+            return NotImplemented
+        return self.rgb == other.rgb and self.layer is other.layer
+
+    def __hash__(self) -> int:
+        return hash((self.rgb, self.layer))
+
+    def __repr__(self) -> str:
+        return f"Color({self.rgb[0]}, {self.rgb[1]}, {self.rgb[2]}, {self.layer})"
+
+    def ansi(self, depth: ColorDepth = ColorDepth.TrueColor) -> str:
+        """
+        The SGR sequence that sets the colour on a terminal of the given colour depth.
+        """
+        if self._sgr is None:
             raise TypeError(f"color layer {self.layer} is invalid")
+        if depth is ColorDepth.TrueColor:
+            return self._sgr
+        if depth is ColorDepth.Palette256:
+            if self._sgr256 is None:
+                base = 38 if self.layer is ColorLayer.Foreground else 48
+                self._sgr256 = ANSI.CSI + "{};5;{}m".format(base, self.palette_index(depth))
+            return self._sgr256
+        if self._sgr16 is None:
+            index = self.palette_index(depth)
+            base = 30 if self.layer is ColorLayer.Foreground else 40
+            # the bright colours have codes of their own
+            code = base + index if index < 8 else base + 60 + index - 8
+            self._sgr16 = ANSI.CSI + "{}m".format(code)
+        return self._sgr16
+
+    def palette_index(self, depth: ColorDepth) -> int:
+        """
+        The index of the nearest colour in the palette of a colour depth.
+
+        :param depth:
+            Either :attr:`ColorDepth.Palette256` or :attr:`ColorDepth.Palette16`.
+        :type depth: :class:`ColorDepth`
+        """
+        r, g, b = self.rgb
+        return palette_lut(depth)[(r >> 3) << 10 | (g >> 3) << 5 | b >> 3]
 
     def as_layer(self, layer: ColorLayer):
         if layer is ColorLayer.Unknown:
@@ -114,6 +207,98 @@ Color.White = Color.from_hex(0xF2F2F2, ColorLayer.Unknown)
 Color.BrightWhite = Color.from_hex(0xFFFFFF, ColorLayer.Unknown)
 
 
+# The channels of the 6x6x6 colour cube of xterm, the palette 256 starts with the 16
+# standard colours, then the cube from index 16 and 24 greys from index 232.
+CUBE_LEVELS = (0, 95, 135, 175, 215, 255)
+GREY_LEVELS = tuple(8 + 10 * i for i in range(24))
+# The default colours of xterm for the 16 standard colours.
+PALETTE_16 = (
+    (0, 0, 0),
+    (205, 0, 0),
+    (0, 205, 0),
+    (205, 205, 0),
+    (0, 0, 238),
+    (205, 0, 205),
+    (0, 205, 205),
+    (229, 229, 229),
+    (127, 127, 127),
+    (255, 0, 0),
+    (0, 255, 0),
+    (255, 255, 0),
+    (92, 92, 255),
+    (255, 0, 255),
+    (0, 255, 255),
+    (255, 255, 255),
+)
+
+# Colours are looked up by the top 5 bits of every channel, a table maps each of the
+# 32768 values to the nearest colour of a palette.
+_LUT_BITS = 5
+_LUTS: Dict[ColorDepth, bytes] = {}
+
+
+def _bucket_centres():
+    step = 1 << (8 - _LUT_BITS)
+    return [i * step + step // 2 for i in range(1 << _LUT_BITS)]
+
+
+def _build_lut_256() -> bytes:
+    centres = _bucket_centres()
+    # the nearest colour of the cube is the nearest level of every channel
+    levels = [min(range(6), key=lambda i: abs(CUBE_LEVELS[i] - v)) for v in centres]
+    errors = [(CUBE_LEVELS[i] - v) ** 2 for i, v in zip(levels, centres)]
+    lut = bytearray(len(centres) ** 3)
+    n = 0
+    for r, rv in enumerate(centres):
+        for g, gv in enumerate(centres):
+            rg = errors[r] + errors[g]
+            cube = 16 + 36 * levels[r] + 6 * levels[g]
+            for b, bv in enumerate(centres):
+                # and the nearest grey is the one nearest to their mean
+                grey = min(23, max(0, round(((rv + gv + bv) / 3 - 8) / 10)))
+                level = GREY_LEVELS[grey]
+                if (rv - level) ** 2 + (gv - level) ** 2 + (bv - level) ** 2 < rg + errors[b]:
+                    lut[n] = 232 + grey
+                else:
+                    lut[n] = cube + levels[b]
+                n += 1
+    return bytes(lut)
+
+
+def _build_lut_16() -> bytes:
+    centres = _bucket_centres()
+    colours = range(len(PALETTE_16))
+    # the squared error of every channel to every colour, summed per lookup
+    errors = [[[(c[channel] - v) ** 2 for c in PALETTE_16] for v in centres] for channel in range(3)]
+    lut = bytearray(len(centres) ** 3)
+    n = 0
+    for red in errors[0]:
+        for green in errors[1]:
+            rg = [x + y for x, y in zip(red, green)]
+            for blue in errors[2]:
+                distances = [x + y for x, y in zip(rg, blue)]
+                lut[n] = distances.index(min(distances))
+                n += 1
+    return bytes(lut)
+
+
+def palette_lut(depth: ColorDepth) -> bytes:
+    """
+    The table of the nearest palette colours of a colour depth, it's built the first
+    time it's asked for.
+    """
+    lut = _LUTS.get(depth)
+    if lut is None:
+        if depth is ColorDepth.Palette256:
+            lut = _build_lut_256()
+        elif depth is ColorDepth.Palette16:
+            lut = _build_lut_16()
+        else:
+            raise ValueError(f"{depth} has no palette")
+        _LUTS[depth] = lut
+    return lut
+
+
 # A mapping to "identifiers" used for command prompt
 # background/foreground color
 WINDOW_COLOR_HEXES = {
@@ -180,6 +365,7 @@ class Resolutions(Enum):
         """
         Resolutions.Custom.width = dimensions[0]
         Resolutions.Custom.height = dimensions[1]
+        Resolutions.Custom.pixels = dimensions[0] * dimensions[1]
         return Resolutions.Custom
 
 
@@ -0,0 +1,184 @@
+"""
+Benchmarks of the hot paths of Asciinpy at the preset resolutions.
+
+Every workload is timed with :mod:`timeit` at each resolution and the results
+are saved as JSON, a later run is compared against such a baseline to flag
+regressions.
+
+.. code:: sh
+
+   python -m benchmarks run -o baseline.json
+   python -m benchmarks run -o current.json
+   python -m benchmarks compare baseline.json current.json --threshold 0.1
+
+The examples are measured end to end in a pseudo-terminal by :mod:`benchmarks.e2e`.
+"""
+
+import json
+import platform
+import sys
+import time
+
+from statistics import median
+from timeit import Timer
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from Asciinpy import __version__
+from Asciinpy.values import Resolutions
+
+__all__ = [
+    "RESOLUTIONS",
+    "WORKLOADS",
+    "Result",
+    "workload",
+    "measure",
+    "run",
+    "save",
+    "load",
+    "compare",
+]
+
+RESOLUTIONS = (Resolutions.Basic, Resolutions.Large, Resolutions.HD)
+
+# a workload is given the resolution it's ran at and returns the statement that is timed
+Setup = Callable[[Resolutions], Callable[[], object]]
+WORKLOADS: Dict[str, Setup] = {}
+
+
+class Result(NamedTuple):
+    """
+    The timing of a workload at a resolution, in seconds per call.
+    """
+
+    min: float
+    median: float
+    number: int
+    repeat: int
+
+
+def workload(func: Setup) -> Setup:
+    """
+    Registers a workload under the name of its function.
+    """
+    WORKLOADS[func.__name__] = func
+    return func
+
+
+def key(name: str, resolution: Resolutions) -> str:
+    return f"{name}[{resolution.name}]"
+
+
+def measure(statement: Callable[[], object], repeat: int = 5, budget: float = 0.2) -> Result:
+    """
+    Times a statement, it's called as many times as fit in the budget for each repeat.
+    """
+    timer = Timer(statement)
+    number, elapsed = timer.autorange()
+    # autorange settles on at least 0.2s, scaled to the budget asked for
+    number = max(1, int(number * budget / max(elapsed, 1e-9)))
+    timings = [t / number for t in timer.repeat(repeat, number)]
+    return Result(min(timings), median(timings), number, repeat)
+
+
+def run(
+    names: Optional[Iterable[str]] = None,
+    resolutions: Iterable[Resolutions] = RESOLUTIONS,
+    repeat: int = 5,
+    budget: float = 0.2,
+    report: Optional[Callable[[str, Result], None]] = None,
+) -> Dict[str, Result]:
+    """
+    Runs the workloads at every resolution.
+
+    :param names:
+        The workloads to run, all of them when None.
+    :type names: Optional[Iterable[:class:`str`]]
+    :param report:
+        Called with every result as soon as it's measured.
+    :type report: Optional[Callable[[:class:`str`, :class:`Result`], None]]
+
+    :returns: (Dict[:class:`str`, :class:`Result`]) The results keyed by ``workload[Resolution]``.
+    """
+    from . import workloads  # noqa: F401 registers the workloads
+
+    names = list(WORKLOADS) if names is None else list(names)
+    for name in names:
+        if name not in WORKLOADS:
+            raise ValueError(f"there is no workload named {name}")
+
+    results = {}
+    for name in names:
+        for resolution in resolutions:
+            result = measure(WORKLOADS[name](resolution), repeat, budget)
+            results[key(name, resolution)] = result
+            if report is not None:
+                report(key(name, resolution), result)
+    return results
+
+
+def save(path: str, results: Dict[str, Result]):
+    """
+    Writes the results along with what they were measured on.
+    """
+    meta = {
+        "asciinpy": __version__,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+    with open(path, "w") as f:
+        json.dump(
+            {"meta": meta, "results": {k: r._asdict() for k, r in results.items()}},
+            f,
+            indent=2,
+        )
+
+
+def load(path: str) -> Tuple[dict, Dict[str, Result]]:
+    """
+    Reads the meta and the results saved by :func:`save`.
+    """
+    with open(path) as f:
+        data = json.load(f)
+    return data["meta"], {k: Result(**r) for k, r in data["results"].items()}
+
+
+def compare(
+    base: Dict[str, Result], new: Dict[str, Result], threshold: float = 0.1
+) -> List[Tuple[str, float, float, float, bool]]:
+    """
+    Compares the best timings of the results measured by both runs.
+
+    :param threshold:
+        How much slower, as a fraction, a workload can get before it's a regression.
+    :type threshold: :class:`float`
+
+    :returns: (List[Tuple[:class:`str`, :class:`float`, :class:`float`, :class:`float`, :class:`bool`]])
+        The name, the base and the new timings, the change and whether it regressed.
+    """
+    rows = []
+    for name in base:
+        if name not in new:
+            continue
+        before, after = base[name].min, new[name].min
+        change = after / before - 1
+        rows.append((name, before, after, change, change > threshold))
+    return rows
+
+
+def format_time(seconds: float) -> str:
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.2f}{unit}"
+    return f"{seconds / 1e-9:.0f}ns"
+
+
+def print_table(rows: List[Tuple[str, ...]], file=sys.stdout):
+    widths = [max(len(row[i]) for row in rows) for i in range(len(rows[0]))]
+    for row in rows:
+        print(
+            "  ".join(cell.ljust(w) if i == 0 else cell.rjust(w) for i, (cell, w) in enumerate(zip(row, widths))),
+            file=file,
+        )
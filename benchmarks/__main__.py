@@ -0,0 +1,68 @@
+import sys
+
+from argparse import ArgumentParser
+
+from Asciinpy.values import Resolutions
+
+from . import RESOLUTIONS, compare, format_time, load, print_table, run, save
+
+
+def main(argv=None) -> int:
+    parser = ArgumentParser(prog="python -m benchmarks", description="Benchmarks Asciinpy.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    runner = commands.add_parser("run", help="run the workloads and save the results")
+    runner.add_argument("workloads", nargs="*", help="the workloads to run, all of them by default")
+    runner.add_argument("-o", "--output", help="the JSON file the results are saved to")
+    runner.add_argument(
+        "-r",
+        "--resolution",
+        action="append",
+        choices=[r.name for r in RESOLUTIONS],
+        help="a resolution to run at, all of them by default",
+    )
+    runner.add_argument("--repeat", type=int, default=5)
+    runner.add_argument("--budget", type=float, default=0.2, help="seconds spent on every repeat")
+
+    comparer = commands.add_parser("compare", help="compare results against a baseline")
+    comparer.add_argument("base")
+    comparer.add_argument("new")
+    comparer.add_argument(
+        "--threshold", type=float, default=0.1, help="the slowdown that is a regression, 0.1 by default"
+    )
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        resolutions = [Resolutions[r] for r in args.resolution] if args.resolution else RESOLUTIONS
+        try:
+            results = run(
+                args.workloads or None,
+                resolutions,
+                args.repeat,
+                args.budget,
+                lambda name, r: print(f"{name:<36} {format_time(r.min):>10} {format_time(r.median):>10}"),
+            )
+        except ValueError as e:
+            parser.error(str(e))
+        if args.output:
+            save(args.output, results)
+        return 0
+
+    _, base = load(args.base)
+    _, new = load(args.new)
+    rows = compare(base, new, args.threshold)
+    table = [("workload", "base", "new", "change", "")]
+    for name, before, after, change, regressed in rows:
+        table.append(
+            (name, format_time(before), format_time(after), f"{change:+.1%}", "REGRESSED" if regressed else "")
+        )
+    print_table(table)
+    regressions = sum(row[-1] for row in rows)
+    if regressions:
+        print(f"\n{regressions} of {len(rows)} workloads regressed by more than {args.threshold:.0%}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,292 @@
+"""
+An end to end harness that runs the examples in a pseudo-terminal.
+
+Every script is started on the slave side of a pty of a fixed size, as if it was
+ran in a terminal, and is fed scripted keyboard input through the master side for
+a fixed duration. Everything it writes is read back to measure what reaching the
+terminal costs, no display is needed.
+
+Frames are counted by the cursor home that every refresh starts with, the input
+latency is the time from writing a key until the next frame starts and the peak
+RSS is read from the resource usage of the exited process. Only POSIX systems
+have a pty.
+
+.. code:: sh
+
+   python -m benchmarks.e2e --duration 5 --size 100x50
+   python -m benchmarks.e2e examples/screen_saver.py --keys "w a s d \\x1b[A"
+"""
+
+import codecs
+import fcntl
+import glob
+import json
+import os
+import pty
+import select
+import signal
+import struct
+import subprocess
+import sys
+import termios
+import time
+
+from argparse import ArgumentParser
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from Asciinpy.screen import Window
+from Asciinpy.utils import percentile
+from Asciinpy.values import ANSI
+
+from . import format_time, print_table
+
+__all__ = ["FRAME_MARKER", "SCRIPTS", "FrameCounter", "Report", "drive", "main"]
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SCRIPTS = sorted(glob.glob(os.path.join(ROOT, "examples", "*.py"))) + [
+    os.path.join(ROOT, "3d_square.py")
+]
+# every frame is written out in one go after homing the cursor
+FRAME_MARKER = (ANSI.CSI + "0;0H").encode()
+KEYS = (b"w", b"a", b"s", b"d", b"\x1b[A", b"\x1b[B", b" ")
+
+
+class FrameCounter:
+    """
+    Splits what a screen writes into frames by their leading cursor home, the
+    marker may be split across reads.
+    """
+
+    __slots__ = ("frames", "sizes", "total", "_last", "_tail")
+
+    def __init__(self):
+        # the time every frame started at and the bytes written for it
+        self.frames: List[float] = []
+        self.sizes: List[int] = []
+        self.total = 0
+        # the offset in the stream of the last marker
+        self._last: Optional[int] = None
+        self._tail = b""
+
+    def feed(self, data: bytes, now: float):
+        offset = self.total - len(self._tail)
+        window = self._tail + data
+        self.total += len(data)
+        start = 0
+        while True:
+            found = window.find(FRAME_MARKER, start)
+            if found < 0:
+                break
+            if self._last is not None:
+                self.sizes.append(offset + found - self._last)
+            self._last = offset + found
+            self.frames.append(now)
+            start = found + len(FRAME_MARKER)
+        self._tail = window[-(len(FRAME_MARKER) - 1) :]
+
+    def first_after(self, moment: float) -> Optional[float]:
+        for started in self.frames:
+            if started >= moment:
+                return started
+        return None
+
+
+class Report(NamedTuple):
+    script: str
+    duration: float
+    frames: int
+    total: int
+    bytes_per_frame: float
+    latencies: List[float]
+    peak_rss: int
+    exit_code: Optional[int]
+
+    @property
+    def fps(self) -> float:
+        return self.frames / self.duration
+
+    def row(self) -> Tuple[str, ...]:
+        latencies = sorted(self.latencies)
+        return (
+            os.path.relpath(self.script, ROOT),
+            str(self.frames),
+            f"{self.fps:.1f}",
+            f"{self.bytes_per_frame:.0f}",
+            f"{self.total / self.duration / 1024:.0f}",
+            format_time(percentile(latencies, 50)) if latencies else "-",
+            format_time(percentile(latencies, 95)) if latencies else "-",
+            f"{self.peak_rss / 1024 / 1024:.1f}",
+            str(self.exit_code),
+        )
+
+
+HEADER = ("script", "frames", "fps", "B/frame", "KiB/s", "latency p50", "latency p95", "RSS MiB", "exit")
+
+
+def _set_size(fd: int, columns: int, lines: int):
+    fcntl.ioctl(fd, termios.TIOCSWINSZ, struct.pack("HHHH", lines, columns, 0, 0))
+
+
+def drive(
+    script: str,
+    duration: float = 5.0,
+    size: Tuple[int, int] = (100, 50),
+    keys: Sequence[bytes] = KEYS,
+    interval: float = 0.1,
+) -> Report:
+    """
+    Runs a script in a pty and measures what it writes.
+
+    :param size:
+        The columns and lines of the pty.
+    :type size: Tuple[:class:`int`, :class:`int`]
+    :param keys:
+        Written to the script in turn, one every interval, a key is sent in a single write.
+    :type keys: Sequence[:class:`bytes`]
+    """
+    master, slave = pty.openpty()
+    _set_size(master, *size)
+    attributes = termios.tcgetattr(slave)
+    # the bytes read back are the bytes the script wrote, no newline translation
+    attributes[1] &= ~termios.OPOST
+    termios.tcsetattr(slave, termios.TCSANOW, attributes)
+
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, (ROOT, env.get("PYTHONPATH"))))
+    # runs the debug mode of the examples in place rather than in a new terminal
+    env[Window.PNAME] = "child"
+    env["COLUMNS"], env["LINES"] = map(str, size)
+
+    process = subprocess.Popen(
+        [sys.executable, script],
+        stdin=slave,
+        stdout=slave,
+        stderr=slave,
+        cwd=os.path.dirname(script),
+        env=env,
+        start_new_session=True,
+    )
+    os.close(slave)
+
+    counter = FrameCounter()
+    sent: List[float] = []
+    started = time.perf_counter()
+    deadline = started + duration
+    next_key = started + interval
+    exited = False
+    try:
+        while True:
+            now = time.perf_counter()
+            if now >= deadline:
+                break
+            if keys and now >= next_key:
+                os.write(master, keys[len(sent) % len(keys)])
+                sent.append(time.perf_counter())
+                next_key += interval
+            timeout = min(deadline, next_key if keys else deadline) - now
+            readable, _, _ = select.select([master], [], [], max(0.0, timeout))
+            if readable:
+                try:
+                    data = os.read(master, 65536)
+                except OSError:
+                    # the slave side is closed once the script exits
+                    data = b""
+                if not data:
+                    exited = True
+                    break
+                counter.feed(data, time.perf_counter())
+        elapsed = time.perf_counter() - started
+
+        if not exited:
+            os.killpg(process.pid, signal.SIGTERM)
+        # the rusage of the process is only reported by reaping it ourselves, the
+        # pty is read meanwhile so the script isn't blocked on it while it exits
+        grace = time.perf_counter() + 2
+        pid, status, usage = os.wait4(process.pid, os.WNOHANG)
+        while not pid and time.perf_counter() < grace:
+            if select.select([master], [], [], 0.05)[0]:
+                try:
+                    os.read(master, 65536)
+                except OSError:
+                    pass
+            pid, status, usage = os.wait4(process.pid, os.WNOHANG)
+        if not pid:
+            os.killpg(process.pid, signal.SIGKILL)
+            _, status, usage = os.wait4(process.pid, 0)
+    finally:
+        os.close(master)
+
+    exit_code = os.waitstatus_to_exitcode(status)
+    process.returncode = exit_code
+    peak_rss = usage.ru_maxrss
+    if sys.platform != "darwin":
+        peak_rss *= 1024
+
+    latencies = []
+    for moment in sent:
+        frame = counter.first_after(moment)
+        if frame is not None:
+            latencies.append(frame - moment)
+    sizes = counter.sizes
+    return Report(
+        script,
+        elapsed,
+        len(counter.frames),
+        counter.total,
+        sum(sizes) / len(sizes) if sizes else 0.0,
+        latencies,
+        peak_rss,
+        exit_code,
+    )
+
+
+def main(argv=None) -> int:
+    parser = ArgumentParser(
+        prog="python -m benchmarks.e2e", description="Runs the examples in a pty and measures their output."
+    )
+    parser.add_argument("scripts", nargs="*", help="the scripts to run, the examples and 3d_square.py by default")
+    parser.add_argument("--duration", type=float, default=5.0, help="seconds every script runs for")
+    parser.add_argument("--size", default="100x50", help="the columns and lines of the pty")
+    parser.add_argument(
+        "--keys",
+        default=None,
+        help="space separated keys written in turn, escapes such as \\x1b[A are allowed",
+    )
+    parser.add_argument("--interval", type=float, default=0.1, help="seconds between keys")
+    parser.add_argument("-o", "--output", help="a JSON file the results are saved to")
+    args = parser.parse_args(argv)
+
+    columns, _, lines = args.size.partition("x")
+    size = (int(columns), int(lines))
+    keys = KEYS
+    if args.keys is not None:
+        keys = tuple(
+            codecs.escape_decode(key.encode())[0] for key in args.keys.split()  # type: ignore
+        )
+
+    reports = []
+    for script in args.scripts or SCRIPTS:
+        reports.append(drive(os.path.abspath(script), args.duration, size, keys, args.interval))
+    print_table([HEADER] + [report.row() for report in reports])
+
+    if args.output:
+        results: Dict[str, dict] = {}
+        for report in reports:
+            latencies = sorted(report.latencies)
+            results[os.path.relpath(report.script, ROOT)] = {
+                "frames": report.frames,
+                "fps": report.fps,
+                "bytes": report.total,
+                "bytes_per_frame": report.bytes_per_frame,
+                "latency_p50": percentile(latencies, 50),
+                "latency_p95": percentile(latencies, 95),
+                "peak_rss": report.peak_rss,
+                "exit_code": report.exit_code,
+            }
+        with open(args.output, "w") as f:
+            json.dump({"size": size, "duration": args.duration, "results": results}, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,167 @@
+"""
+The workloads, each sized by the resolution it's ran at.
+"""
+
+import contextlib
+import itertools
+import os
+import subprocess
+import sys
+import weakref
+
+from Asciinpy._2D import Mask, Polygon, Square, Tile
+from Asciinpy._3D import Camera, Cube, Instances, translation
+from Asciinpy.geometry import Line
+from Asciinpy.screen import ConsoleInterface, Screen
+from Asciinpy.values import Color, Resolutions
+
+from . import workload
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class Canvas(Screen):
+    """
+    A screen that is only drawn onto, it's never written out.
+    """
+
+    def __init__(self, resolution: Resolutions):
+        super().__init__(resolution, None, None, False, False, False, False)
+
+    def _update(self, frame: str):
+        pass
+
+
+@workload
+def refresh(resolution: Resolutions):
+    """
+    A full frame joined and written to the null device.
+    """
+    sink = open(os.devnull, "w")
+    with contextlib.redirect_stdout(sink):
+        screen = ConsoleInterface(resolution, None, None, False, False, True, False)
+    screen.blit(Tile((0, 0), (screen.width, screen.height)))
+    frame = screen._frame
+
+    def statement():
+        # the frame is swapped back so every refresh writes a drawn frame
+        screen._frame = frame
+        screen.refresh()
+
+    # the screen writes to the null device for as long as the workload is timed
+    weakref.finalize(statement, sink.close)
+    return statement
+
+
+def cold_import(module: str):
+    # a fresh interpreter every call, nothing is imported or cached yet
+    command = [sys.executable, "-c", f"import {module}"]
+    return lambda: subprocess.run(command, cwd=ROOT, check=True)
+
+
+@workload
+def import_package(resolution: Resolutions):
+    """
+    A cold ``import Asciinpy`` in a new interpreter, the lazy package alone.
+    """
+    return cold_import("Asciinpy")
+
+
+@workload
+def import_screen(resolution: Resolutions):
+    """
+    A cold import of the screen and everything it pulls in.
+    """
+    return cold_import("Asciinpy.screen")
+
+
+@workload
+def plane_blit(resolution: Resolutions):
+    screen = Canvas(resolution)
+    tile = Tile((0, 0), (screen.width, screen.height))
+    return lambda: tile.blit(screen)
+
+
+@workload
+def mask_blit(resolution: Resolutions):
+    screen = Canvas(resolution)
+    square = Square((0, 0), min(screen.width, screen.height * 2))
+    return lambda: square.blit(screen)
+
+
+@workload
+def mask_blit_colored(resolution: Resolutions):
+    """
+    A mask in horizontal bands of colour composed into a frame.
+    """
+    screen = Canvas(resolution)
+    width, height = screen.width, screen.height
+    bands = [Color.foreground(255, 0, 0), Color.foreground(0, 255, 0), Color.foreground(0, 0, 255)]
+    mask = Mask(
+        "\n".join(["#" * width] * height),
+        (0, 0),
+        colors=[[bands[y * 3 // height]] * width for y in range(height)],
+    )
+
+    def statement():
+        mask.blit(screen)
+        screen._compose()
+
+    return statement
+
+
+@workload
+def mask_rotate(resolution: Resolutions):
+    # rotating grows with the square of the pixels, the square is kept small
+    w, h = resolution.width, resolution.height
+    square = Square((w // 2, h // 2), w // 8)
+    return lambda: square.rotate(1)
+
+
+@workload
+def line_points(resolution: Resolutions):
+    w, h = resolution.width - 1, resolution.height - 1
+    center = (w // 2, h // 2)
+    # a fan out of the center to every corner and the middle of every side
+    ends = [(x, y) for x in (0, w // 2, w) for y in (0, h // 2, h) if (x, y) != center]
+    return lambda: [Line.get_points(center, end) for end in ends]
+
+
+@workload
+def polygon_blit(resolution: Resolutions):
+    screen = Canvas(resolution)
+    w, h = resolution.width - 1, resolution.height - 1
+    polygon = Polygon([(w // 2, 0), (w, h // 3), (w * 3 // 4, h), (w // 4, h), (0, h // 3)])
+
+    def statement():
+        # the edges are cached by their coordinates, they're rasterized every call
+        Polygon.get_edges.cache_clear()
+        Polygon.get_edge_mapping.cache_clear()
+        polygon.blit(screen)
+
+    return statement
+
+
+@workload
+def collides(resolution: Resolutions):
+    w, h = resolution.width, resolution.height
+    size = max(2, w // 10)
+    # a grid of squares where the neighbours of every column overlap
+    squares = [
+        Square((x * size * 3 // 4, y * size), size)
+        for x in range(4)
+        for y in range(max(1, h // size))
+    ]
+    pairs = list(itertools.combinations(squares, 2))
+    return lambda: [a.collides_with(b) for a, b in pairs]
+
+
+@workload
+def camera_render_instances(resolution: Resolutions):
+    screen = Canvas(resolution)
+    camera = Camera(position=(0, 2, -12), aspect_ratio=screen.aspect_ratio)
+    # half of the grid is behind the camera and culled
+    cubes = Instances(
+        Cube(), [translation(x * 2, 0, z * 2) for x in range(-5, 5) for z in range(-10, 10)]
+    )
+    return lambda: camera.render_instances(screen, cubes)
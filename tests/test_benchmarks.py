@@ -0,0 +1,66 @@
+from benchmarks import WORKLOADS, Result, compare, load, measure, run, save
+from benchmarks.__main__ import main
+from benchmarks.e2e import FRAME_MARKER, FrameCounter, drive
+from Asciinpy.values import Resolutions
+
+
+def test_workloads():
+    results = run(resolutions=[Resolutions.Basic], repeat=1, budget=0.001)
+    assert set(results) == {f"{name}[Basic]" for name in WORKLOADS}
+    assert all(0 < r.min <= r.median for r in results.values())
+
+
+def test_compare(tmp_path):
+    base = {"a": Result(1.0, 1.0, 1, 1), "b": Result(1.0, 1.0, 1, 1)}
+    new = {"a": Result(1.05, 1.1, 1, 1), "b": Result(1.5, 1.5, 1, 1), "c": Result(1.0, 1.0, 1, 1)}
+    assert [(row[0], row[-1]) for row in compare(base, new, 0.1)] == [("a", False), ("b", True)]
+
+    save(str(tmp_path / "base.json"), base)
+    save(str(tmp_path / "new.json"), new)
+    meta, loaded = load(str(tmp_path / "base.json"))
+    assert loaded == base and "python" in meta
+    assert main(["compare", str(tmp_path / "base.json"), str(tmp_path / "new.json")]) == 1
+    assert main(["compare", str(tmp_path / "base.json"), str(tmp_path / "base.json")]) == 0
+
+
+def test_measure():
+    result = measure(lambda: None, repeat=3, budget=0.001)
+    assert result.repeat == 3 and result.number > 1
+
+
+def test_frame_counter():
+    counter = FrameCounter()
+    stream = FRAME_MARKER + b"a" * 10 + FRAME_MARKER + b"b" * 20 + FRAME_MARKER
+    # the markers are split across every possible read
+    for i, byte in enumerate(stream):
+        counter.feed(bytes([byte]), i)
+    assert counter.sizes == [10 + len(FRAME_MARKER), 20 + len(FRAME_MARKER)]
+    assert counter.frames == [len(FRAME_MARKER) - 1, 10 + 2 * len(FRAME_MARKER) - 1, len(stream) - 1]
+    assert counter.total == len(stream)
+
+
+SCRIPT = """
+import os, select, tty
+from Asciinpy.values import ANSI
+
+tty.setcbreak(0)
+home = (ANSI.CSI + "0;0H").encode()
+while True:
+    # a frame is drawn whenever a key arrives
+    if select.select([0], [], [], 1)[0]:
+        os.read(0, 16)
+        os.write(1, home + b"#" * 100)
+"""
+
+
+def test_drive(tmp_path):
+    script = tmp_path / "game.py"
+    script.write_text(SCRIPT)
+    report = drive(str(script), duration=1, size=(80, 24), keys=[b"w"], interval=0.1)
+
+    assert report.frames >= 5
+    assert report.bytes_per_frame == 100 + len(FRAME_MARKER)
+    # a key is answered with a frame, how fast depends on the load of the machine
+    assert len(report.latencies) >= 5 and min(report.latencies) >= 0
+    assert report.peak_rss > 0
+    assert report.exit_code == -15
@@ -0,0 +1,51 @@
+from Asciinpy._3D import Camera, Cube, Instances, translation
+
+
+def test_matrix_caching():
+    camera = Camera(position=(0, 0, -3))
+    view, projection = camera.view, camera.projection
+    assert camera.view is view
+
+    camera.position = (0, 0, -3)
+    assert camera.view is view
+
+    camera.yaw = 0.5
+    assert camera.view is not view
+    assert camera.projection is projection
+
+
+def test_frustum_culling():
+    camera = Camera(position=(0, 0, -3))
+    cube = Cube()
+
+    assert camera.is_visible(cube)
+    assert not camera.is_visible(cube, translation(0, 0, -10))
+    assert not camera.is_visible(cube, translation(100, 0, 0))
+    assert camera.project(Cube(), 50, 25, translation(0, 0, -10)) == []
+
+
+def test_near_clipping():
+    # the camera sits inside the cube so most triangles cross the near plane
+    camera = Camera()
+    polygons = camera.project(Cube(), 50, 25, translation(-0.5, -0.5, -0.5))
+
+    assert polygons
+    for polygon in polygons:
+        for x, y in polygon:
+            assert -1e-6 <= x <= 49 + 1e-6
+            assert -1e-6 <= y <= 24 + 1e-6
+
+
+def test_instance_culling():
+    camera = Camera(position=(0, 0, -3))
+    cubes = Instances(Cube(), [translation(0, 0, 0), translation(0, 0, -10), translation(100, 0, 0)])
+
+    assert len(cubes) == 3
+    assert camera.cull_instances(cubes) == [(0, True)]
+    assert cubes[1] == translation(0, 0, -10)
+
+    # four rows of four place an instance as well as the flat transformation
+    flat = translation(1, 2, 3)
+    cubes.append([flat[i : i + 4] for i in range(0, 16, 4)])
+    cubes[0] = [list(flat[i : i + 4]) for i in range(0, 16, 4)]
+    assert len(cubes) == 4 and cubes[3] == cubes[0] == flat
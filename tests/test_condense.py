@@ -0,0 +1,71 @@
+import os
+import subprocess
+import sys
+import zipfile
+
+import pytest
+
+from Asciinpy.shading import Shader
+from Asciinpy.tools.condense import bundle
+
+ENTRY = """
+from Asciinpy import Shader
+
+print(Shader().shade(bytes([0, 128, 255])))
+"""
+
+
+def write_entry(tmp_path, source: str) -> str:
+    path = tmp_path / "game.py"
+    path.write_text(source)
+    return str(path)
+
+
+def test_tree_shaking(tmp_path):
+    output = str(tmp_path / "game.pyz")
+    names = bundle(output, write_entry(tmp_path, ENTRY))
+
+    # the lazy export is followed to its module, nothing else is packed
+    assert names == ["Asciinpy", "Asciinpy.shading", "Asciinpy.values", "__main__"]
+    with zipfile.ZipFile(output) as archive:
+        assert all(name.endswith(".pyc") for name in archive.namelist())
+
+    env = dict(os.environ)
+    env.pop("PYTHONPATH", None)
+    result = subprocess.run(
+        [sys.executable, output], cwd=str(tmp_path), env=env, capture_output=True, text=True
+    )
+    assert result.returncode == 0, result.stderr
+    assert result.stdout == Shader().shade(bytes([0, 128, 255])) + "\n"
+
+
+def test_optional_exclude(tmp_path):
+    entry = write_entry(tmp_path, "from Asciinpy.screen import Window\n")
+    output = str(tmp_path / "game.pyz")
+
+    assert "Asciinpy.devices" in bundle(output, entry)
+    # the screen only imports the devices under an ImportError guard
+    names = bundle(output, entry, exclude=["devices", "_3D"])
+    assert "Asciinpy.devices" not in names and "Asciinpy.screen" in names
+
+
+def test_required_exclude(tmp_path):
+    entry = write_entry(tmp_path, "from Asciinpy._3D import Cube\n")
+    with pytest.raises(ValueError):
+        bundle(str(tmp_path / "game.pyz"), entry, exclude=["_3D"])
+
+
+@pytest.mark.parametrize(
+    "handler, optional",
+    [("ImportError", True), ("(ModuleNotFoundError, OSError)", True), ("Exception", False), ("", False)],
+)
+def test_import_guards(tmp_path, handler, optional):
+    entry = write_entry(
+        tmp_path, f"try:\n    from Asciinpy._3D import Cube\nexcept {handler}:\n    Cube = None\n"
+    )
+    output = str(tmp_path / "game.pyz")
+    if optional:
+        assert "Asciinpy._3D" not in bundle(output, entry, exclude=["_3D"])
+    else:
+        with pytest.raises(ValueError):
+            bundle(output, entry, exclude=["_3D"])
@@ -0,0 +1,23 @@
+import io
+
+from Asciinpy.tools.convert import convert, downsample, read_pnm_stream, read_raw_stream
+
+
+def test_area_average():
+    # a 4x2 grey image of two flat halves
+    pgm = b"P5\n# halves\n4 2\n255\n" + bytes([0, 0, 200, 200, 0, 0, 100, 100])
+    (image,) = read_pnm_stream(io.BytesIO(pgm))
+
+    assert (image.width, image.height, image.channels) == (4, 2, 1)
+    assert downsample(image, (2, 1)) == bytes([0, 150])
+
+
+def test_raw_stream_is_lazy():
+    frame = bytes([255, 255, 255]) * 4
+    stream = io.BytesIO(frame * 3 + b"\x00")
+    frames = convert(read_raw_stream(stream, (2, 2)), (1, 1))
+
+    assert next(frames) == "@"
+    # only the first frame has been read off the stream so far
+    assert stream.tell() == len(frame)
+    assert list(frames) == ["@", "@"]
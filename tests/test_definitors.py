@@ -1,6 +1,16 @@
 from typing import Any
 from tests.utils import move_somewhere, change_each, change_summation, transform_somewhere
 from Asciinpy._2D import Mask
+from Asciinpy.screen import Screen
+from Asciinpy.values import ANSI, Color, Resolutions
+
+
+class Canvas(Screen):
+    def __init__(self):
+        super().__init__(Resolutions.Basic, None, None, False, False, False, False)
+
+    def _update(self, frame: str):
+        pass
 
 
 def test_dimension():
@@ -35,3 +45,26 @@ def test_movement():
 
         lmove = change_each(obj.occupancy.tolist(), lambda at, dist: [at[0]+dist[0], at[1]+dist[1]], move_somewhere(obj))
         assert lmove == obj.occupancy.tolist()
+
+
+def test_color():
+    red, blue = Color.foreground(255, 0, 0), Color.background(0, 0, 255)
+    screen = Canvas()
+
+    # coloured per glyph, the spaces are left uncoloured
+    obj = Mask("#o #", (0, 0), {"#": red})
+    obj.blit(screen)
+    assert screen._attrs[0][:5] == [red, None, None, red, None]
+    frame, _ = screen._compose()
+    assert frame.startswith(red.ansi() + "#" + ANSI.RESET + "o " + red.ansi() + "#" + ANSI.RESET)
+
+    # the colours of the cells follow the mask as it moves
+    obj = Mask("###\n###", (0, 0), red, colors=[[None, blue, blue]])
+    obj.x += 2
+    screen._attrs = None
+    obj.blit(screen)
+    assert screen._attrs[0][2:5] == [red, blue, blue]
+    assert screen._attrs[1][2:5] == [red, red, red]
+    frame, _ = screen._compose()
+    # a run of a colour is a single sequence
+    assert frame.count(blue.ansi()) == 1 and frame.count(red.ansi()) == 2
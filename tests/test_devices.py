@@ -0,0 +1,113 @@
+import os
+
+import pytest
+
+from Asciinpy.devices import ByteRing, Keyboard, KeyParser, KeyReader
+
+Keys = Keyboard.Keys
+
+
+def test_ring_overflow():
+    ring = ByteRing(8)
+    ring.write(b"abcdef")
+    ring.write(b"ghij")
+
+    assert len(ring) == 8 and ring.dropped == 2
+    assert ring.read() == b"cdefghij"
+    assert len(ring) == 0
+
+    ring.write(b"0123456789")
+    assert ring.read() == b"23456789"
+
+
+def test_plain_keys():
+    parser = KeyParser(windows=False)
+    assert parser.feed(b"wA \r\x7f\t") == [
+        Keys.W,
+        Keys.A,
+        Keys.Space,
+        Keys.Return,
+        Keys.Backspace,
+        Keys.Tab,
+    ]
+
+
+def test_escape_sequences():
+    parser = KeyParser(windows=False)
+    assert parser.feed(b"\x1b[A\x1b[D\x1bOP\x1b[3~\x1b[15~\x1b[1;5C") == [
+        Keys.UpArrow,
+        Keys.LeftArrow,
+        Keys.F1,
+        Keys.Delete,
+        Keys.F5,
+        Keys.RightArrow,
+    ]
+    # unknown sequences are swallowed whole
+    assert parser.feed(b"\x1b[200~x") == [Keys.X]
+
+
+def test_split_sequence():
+    parser = KeyParser(windows=False)
+    assert parser.feed(b"\x1b", now=0.0) == []
+    assert parser.feed(b"[", now=0.01) == []
+    assert parser.feed(b"B", now=0.02) == [Keys.DownArrow]
+
+
+def test_lone_escape():
+    parser = KeyParser(windows=False)
+    assert parser.feed(b"\x1b", now=0.0) == []
+    assert parser.flush(now=0.01) == []
+    assert parser.flush(now=1.0) == [Keys.Escape]
+    assert parser.flush(now=2.0) == []
+
+
+    # a key that comes after the timeout is not read as an alt chord of the escape
+    assert parser.feed(b"\x1b", now=3.0) == []
+    assert parser.flush(now=3.01) == []
+    assert parser.feed(b"a", now=4.0) == [Keys.Escape, Keys.A]
+    # while one within it still is
+    assert parser.feed(b"\x1ba", now=5.0) == [Keys.A]
+
+
+def test_windows_prefix():
+    parser = KeyParser(windows=True)
+    assert parser.feed(b"\xe0Hq\x00;") == [Keys.UpArrow, Keys.Q, Keys.F1]
+
+    with pytest.raises(KeyboardInterrupt):
+        parser.feed(b"\x03")
+
+
+@pytest.mark.skipif(os.name == "nt", reason="select only polls pipes on unix")
+def test_reader_never_blocks():
+    rfd, wfd = os.pipe()
+    try:
+        reader = KeyReader(rfd)
+        assert reader.poll() == []
+
+        os.write(wfd, b"ab\x1b[")
+        assert reader.poll() == [Keys.A, Keys.B]
+        os.write(wfd, b"C")
+        assert reader.poll() == [Keys.RightArrow]
+
+        os.close(wfd)
+        wfd = -1
+        assert reader.poll() == [] and reader.eof
+    finally:
+        os.close(rfd)
+        if wfd >= 0:
+            os.close(wfd)
+
+
+@pytest.mark.skipif(os.name == "nt", reason="select only polls pipes on unix")
+def test_reader_clock():
+    rfd, wfd = os.pipe()
+    try:
+        reader = KeyReader(rfd)
+        # a lone escape is timed out on the time given rather than the wall
+        os.write(wfd, b"\x1b")
+        assert reader.poll(now=10.0) == []
+        assert reader.poll(now=10.0 + KeyParser.ESCAPE_TIMEOUT / 2) == []
+        assert reader.poll(now=10.0 + KeyParser.ESCAPE_TIMEOUT) == [Keys.Escape]
+    finally:
+        os.close(rfd)
+        os.close(wfd)
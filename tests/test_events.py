@@ -0,0 +1,325 @@
+import asyncio
+import functools
+import gc
+import threading
+import time
+
+import pytest
+
+from Asciinpy.events import (
+    Backpressure,
+    Dispatcher,
+    Event,
+    EventListener,
+    LatestPerFrame,
+    RateLimit,
+    Throttle,
+)
+from Asciinpy.clock import VirtualClock
+from Asciinpy.utils import isinstancemethod
+
+
+def test_ordered_pooled_delivery():
+    event = Event("test", maxsize=1000)
+    received = []
+
+    @Event.listen(event)
+    def handler(i):
+        received.append(i)
+
+    before = threading.active_count()
+    for i in range(500):
+        event.emit(i)
+    assert event.flush(5)
+
+    assert received == list(range(500))
+    assert threading.active_count() - before <= Event.dispatcher.workers
+
+
+def test_drop_oldest():
+    event = Event("test", maxsize=2)
+    gate = threading.Event()
+    received = []
+
+    @Event.listen(event)
+    def handler(i):
+        gate.wait(5)
+        received.append(i)
+
+    for i in range(10):
+        event.emit(i)
+    gate.set()
+    assert event.flush(5)
+
+    # the first delivery was already running, the rest were trimmed to the newest two
+    assert received[-2:] == [8, 9]
+    assert event.dropped == 10 - len(received)
+
+
+def test_coalesce():
+    event = Event("test", backpressure=Backpressure.Coalesce)
+    gate = threading.Event()
+    received = []
+
+    @Event.listen(event)
+    def handler(i):
+        gate.wait(5)
+        received.append(i)
+
+    for i in range(10):
+        event.emit(i)
+    gate.set()
+    assert event.flush(5)
+
+    assert received[-1] == 9
+    assert len(received) <= 2
+
+
+def test_block():
+    event = Event("test", maxsize=1, backpressure=Backpressure.Block)
+    received = []
+
+    @Event.listen(event)
+    def handler(i):
+        time.sleep(0.001)
+        received.append(i)
+
+    for i in range(20):
+        event.emit(i)
+    assert event.flush(5)
+
+    assert received == list(range(20))
+    assert event.dropped == 0
+
+
+@pytest.mark.filterwarnings("ignore::pytest.PytestUnhandledThreadExceptionWarning")
+def test_exiting_subscriber():
+    Event.dispatcher, default = Dispatcher(workers=1), Event.dispatcher
+    try:
+        event = Event("test")
+        received = []
+        exited = []
+
+        @Event.listen(event)
+        def handler(i):
+            if i == 0:
+                exited.append(threading.current_thread())
+                raise SystemExit
+            received.append(i)
+
+        event.emit(0)
+        event.emit(1)
+        assert event.flush(5)
+        exited[0].join(5)
+        # the worker that exited is replaced and the mailbox is still delivered to
+        event.emit(2)
+        assert event.flush(5)
+        assert received == [1, 2]
+        assert len(Event.dispatcher._threads) == 1
+    finally:
+        Event.dispatcher = default
+
+
+def test_bounded_workers():
+    Event.dispatcher, default = Dispatcher(workers=2), Event.dispatcher
+    try:
+        events = [Event(str(i)) for i in range(8)]
+        threads = set()
+        for event in events:
+            Event.listen(event)(lambda: threads.add(threading.current_thread()))
+            event.emit()
+        for event in events:
+            assert event.flush(5)
+        assert len(threads) <= 2
+    finally:
+        Event.dispatcher = default
+
+
+def test_deferred_delivery():
+    event = Event("test")
+    received = []
+
+    @Event.listen(event, deferred=True)
+    def handler(i):
+        received.append((i, threading.current_thread()))
+
+    event.emit(1)
+    event.emit(2)
+    assert received == []
+
+    assert Event.queue.drain() == 2
+    assert received == [(1, threading.main_thread()), (2, threading.main_thread())]
+
+
+def test_partial_subscriber():
+    event = Event("test")
+    received = []
+
+    # partials and builtins have no code object, they subscribe like plain functions
+    assert not isinstancemethod(len)
+    Event.listen(event)(functools.partial(received.append))
+    event.emit(1)
+    assert event.flush(1) and received == [1]
+
+
+def test_deferred_error(capsys):
+    event = Event("test")
+    received = []
+
+    @Event.listen(event, deferred=True)
+    def failing(i):
+        raise ValueError(i)
+
+    @Event.listen(event, deferred=True)
+    def handler(i):
+        received.append(i)
+
+    event.emit(1)
+    event.emit(2)
+    # every delivery of the frame is still made, the errors are reported
+    assert Event.queue.drain() == 4
+    assert received == [1, 2]
+    assert capsys.readouterr().err.count("ValueError: ") == 2
+
+
+def test_batched_delivery():
+    event = Event("test")
+    batches = []
+
+    @Event.listen(event, deferred=True, batched=True)
+    def handler(batch):
+        batches.append(batch)
+
+    for i in range(3):
+        event.emit(i, i * 2)
+    Event.queue.drain()
+
+    assert batches == [[(0, 0), (1, 2), (2, 4)]]
+
+
+def test_listener_subscriptions():
+    event = Event("test")
+    touched = []
+
+    class Base(EventListener):
+        @property
+        def expensive(self):
+            touched.append(self)
+            return 0
+
+        @Event.listen(event, threaded=False)
+        def on_test(self, i):
+            self.received.append(i)
+
+        @Event.listen(event, threaded=False)
+        def overridden(self, i):
+            raise AssertionError("overridden subscribers must not be called")
+
+    class Child(Base):
+        def __init__(self):
+            self.received = []
+
+        def overridden(self, i):
+            raise AssertionError("overridden subscribers must not be called")
+
+    listeners = [Child() for _ in range(3)]
+    event.emit(1)
+
+    assert [listener.received for listener in listeners] == [[1]] * 3
+    assert touched == []
+    assert len(event.subscribers) == 3
+
+    subscribers = event.subscribers
+    del listeners
+    kept = Child()
+    gc.collect()
+    # dead subscriptions are removed in place, later ones are kept
+    assert event.subscribers is subscribers and len(subscribers) == 1
+    event.emit(2)
+    assert kept.received == [2]
+
+
+def test_latest_per_frame():
+    event = Event("test", throttle=LatestPerFrame(key=lambda key: key))
+    received = []
+
+    @Event.listen(event, threaded=False)
+    def handler(key):
+        received.append(key)
+
+    for key in "aaab" * 10:
+        event.emit(key)
+    assert received == []
+
+    Event.queue.drain()
+    assert received == ["a", "b"]
+    assert event.merged == 38
+
+    Event.queue.drain()
+    assert received == ["a", "b"]
+
+
+def test_rate_limit():
+    event = Event("test", throttle=RateLimit(per_second=20))
+    received = []
+
+    @Event.listen(event, threaded=False)
+    def handler(i):
+        received.append(i)
+
+    for i in range(100):
+        event.emit(i)
+    # the first emission goes through, the rest wait for their slot
+    assert received == [0]
+    Event.queue.drain()
+    assert received == [0]
+
+    time.sleep(0.06)
+    Event.queue.drain()
+    assert received == [0, 99]
+    assert event.merged == 98
+
+
+def test_incomplete_throttle():
+    class Hold(Throttle):
+        def offer(self, args, kwargs, now):
+            return False
+
+    # a throttle that can't release what it holds is refused up front
+    with pytest.raises(TypeError):
+        Hold()
+
+
+def test_rate_limit_clock():
+    clock = VirtualClock(1 / 100)
+    Event.clock = clock
+    try:
+        event = Event("test", throttle=RateLimit(per_second=20))
+        received = []
+
+        @Event.listen(event, threaded=False)
+        def handler(i):
+            received.append(i)
+
+        # the throttle waits on the clock rather than the wall
+        for frame in range(11):
+            event.emit(frame)
+            Event.queue.drain()
+            clock.advance()
+        assert received == [0, 5, 10]
+    finally:
+        Event.clock = None
+
+
+def test_stream():
+    event = Event("test")
+
+    async def consume():
+        async with event.stream() as stream:
+            event.emit(1)
+            threading.Thread(target=event.emit, args=(2, 3)).start()
+            received = [await stream.__anext__(), await stream.__anext__()]
+        assert stream not in event.subscribers
+        return received
+
+    assert asyncio.run(consume()) == [1, (2, 3)]
@@ -0,0 +1,58 @@
+import json
+import os
+import subprocess
+import sys
+
+from importlib import import_module
+
+import Asciinpy
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PROBE = """
+import json, signal, sys
+import {module}
+print(json.dumps({{
+    "modules": sorted(sys.modules),
+    "sigint": signal.getsignal(signal.SIGINT) is signal.default_int_handler,
+}}))
+"""
+
+
+def probe(module: str) -> dict:
+    out = subprocess.run(
+        [sys.executable, "-c", PROBE.format(module=module)],
+        cwd=ROOT,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(out)
+
+
+def test_import_is_lazy():
+    result = probe("Asciinpy")
+
+    assert [m for m in result["modules"] if m.startswith("Asciinpy")] == ["Asciinpy"]
+    assert "termios" not in result["modules"]
+    assert result["sigint"]
+
+
+def test_import_skips_heavy_modules():
+    # what the screen stack pulls in is only imported once it is used
+    eager = set(probe("Asciinpy.screen")["modules"])
+    lazy = set(probe("Asciinpy")["modules"])
+    heavy = {"Asciinpy.screen", "Asciinpy.events", "Asciinpy.utils", "threading", "array"}
+
+    assert heavy <= eager
+    assert not heavy & lazy
+    assert not {"Asciinpy._3D", "Asciinpy.devices", "cProfile", "pstats", "asyncio"} & lazy
+
+
+def test_exports():
+    for module, names in Asciinpy._EXPORTS.items():
+        mod = import_module(f"Asciinpy.{module}")
+        if hasattr(mod, "__all__"):
+            assert sorted(names) == sorted(mod.__all__), module
+        for name in names:
+            assert getattr(Asciinpy, name) is getattr(mod, name)
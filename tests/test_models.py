@@ -0,0 +1,55 @@
+import os
+import tempfile
+
+from Asciinpy._3D import Cube, Model
+
+OBJ = """\
+# a unit quad and a triangle sharing an edge, some records are tab separated
+v 0 0 0
+v 1 0 0
+v 1 1 0
+v	0	1	0
+v 0.5 2 0
+vn 0 0 1
+f 1/1/1 2/2/1 3/3/1 4/4/1
+f	-3 -2	-1
+"""
+
+
+def write_obj(directory):
+    path = os.path.join(directory, "mesh.obj")
+    with open(path, "w") as f:
+        f.write(OBJ)
+    return path
+
+
+def test_from_obj():
+    with tempfile.TemporaryDirectory() as directory:
+        model = Model.from_obj(write_obj(directory))
+
+    assert model.vertex_count == 5
+    # the quad is triangulated as a fan
+    assert model.indices.tolist() == [0, 1, 2, 0, 2, 3, 2, 3, 4]
+
+
+def test_cache_roundtrip():
+    with tempfile.TemporaryDirectory() as directory:
+        path = write_obj(directory)
+        model = Model.from_cached_obj(path)
+        assert os.path.exists(os.path.join(directory, "mesh.amdl"))
+
+        cached = Model.from_cached_obj(path)
+
+    assert cached.vertices == model.vertices
+    assert cached.indices == model.indices
+
+
+def test_cube():
+    cube = Cube(2, (1, 1, 1))
+
+    assert cube.vertex_count == 8
+    assert cube.face_count == 12
+    assert cube.bounding_sphere == ((2.0, 2.0, 2.0), 3 ** 0.5)
+    for triangle in cube.triangles():
+        for vertex in triangle:
+            assert all(c in (1.0, 3.0) for c in vertex)
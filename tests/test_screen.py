@@ -0,0 +1,384 @@
+import gc
+import json
+import time
+
+from Asciinpy.clock import VirtualClock
+from Asciinpy.events import ON_RESIZE, Event
+from Asciinpy.screen import Screen
+from Asciinpy.utils import FrameMetrics, FrameProfiler, GCPolicy, MemoryProfiler, Tracer, percentile
+from Asciinpy._2D import Plane
+from Asciinpy.values import ANSI, Color, ColorDepth, Resolutions, palette_lut
+
+
+class FakeScreen(Screen):
+    __slots__ = ("terminal", "updates", "repaints")
+
+    def __init__(self, resolution: Resolutions):
+        super().__init__(resolution, None, None, False, True, True, False)
+        self.terminal = resolution.value
+        self.updates = []
+        self.repaints = 0
+
+    def _terminal_size(self):
+        return self.terminal
+
+    def _update(self, frame: str):
+        if self._repaint:
+            self._repaint = False
+            self.repaints += 1
+        self.updates.append(frame)
+
+
+class Slow:
+    def blit(self, screen):
+        time.sleep(0.002)
+
+
+def test_debounced_resize():
+    screen = FakeScreen(Resolutions.Basic)
+    sizes = []
+
+    @Event.listen(ON_RESIZE, threaded=False)
+    def on_resize(width, height):
+        sizes.append((width, height))
+
+    try:
+        screen.terminal = (70, 20)
+        screen.request_resize()
+        screen.refresh()
+        screen.refresh()
+        # nothing is painted while the size settles
+        assert screen.updates == [] and sizes == []
+
+        time.sleep(Screen.RESIZE_DEBOUNCE)
+        screen.refresh()
+        assert sizes == [(70, 20)]
+        assert (screen.width, screen.height) == (70, 20)
+        assert len(screen._frame) == 20 and len(screen._frame[0]) == 70
+
+        screen.refresh()
+        screen.refresh()
+        assert screen.repaints == 1
+        assert [len(frame) for frame in screen.updates] == [70 * 20] * 2
+        # the debug menu is rendered for the new width
+        assert screen._infotext.endswith(Screen.palette[2] * 70)
+
+        # a resize back and forth that settles on the same size is only repainted
+        screen.request_resize()
+        time.sleep(Screen.RESIZE_DEBOUNCE)
+        screen.refresh()
+        assert sizes == [(70, 20)]
+        screen.refresh()
+        assert screen.repaints == 2 and len(screen.updates) == 3
+    finally:
+        ON_RESIZE.subscribers.remove(on_resize)
+
+
+def test_percentile():
+    values = list(range(1, 101))
+    assert [percentile(values, q) for q in (1, 50, 95, 99, 100)] == [1, 50, 95, 99, 100]
+    values = list(range(1, 21))
+    assert [percentile(values, q) for q in (0, 50, 95, 99)] == [1, 10, 19, 20]
+    assert percentile([], 50) == 0
+
+
+def test_frame_profiler():
+    screen = FakeScreen(Resolutions.Basic)
+    screen.profiler = FrameProfiler(frames=4)
+
+    for _ in range(6):
+        screen.blit(Slow())
+        screen.refresh()
+
+    profiler = screen.profiler
+    assert profiler.count == 6
+    blits = profiler.samples("blit")
+    assert len(blits) == 4 and all(ns >= 2_000_000 for ns in blits)
+
+    summary = profiler.summary()
+    assert set(summary) == set(FrameProfiler.PHASES)
+    assert summary["blit"]["p50"] >= 2
+    assert summary["blit"]["p50"] <= summary["blit"]["p99"]
+
+
+def test_frame_profiler_ring():
+    profiler = FrameProfiler(frames=3)
+    for i in range(5):
+        profiler.start_frame(0)
+        profiler.record(FrameProfiler.WRITE, 0, i)
+        profiler.end_frame(10)
+
+    assert profiler.samples("write") == [2, 3, 4]
+    assert profiler.samples("loop") == [8, 7, 6]
+
+
+def test_tracer(tmp_path):
+    path = str(tmp_path / "trace.json")
+    event = Event("traced")
+    received = []
+
+    @Event.listen(event)
+    def handler(i):
+        received.append(i)
+
+    screen = FakeScreen(Resolutions.Basic)
+    with Tracer(path, chunk=4, profiler=FrameProfiler()) as tracer:
+        screen.profiler = tracer
+        for i in range(10):
+            event.emit(i)
+            screen.refresh()
+        assert event.flush(5)
+
+    with open(path) as f:
+        events = json.load(f)
+
+    spans = [e for e in events if e["ph"] == "X"]
+    assert sum(e["name"] == "frame" for e in spans) == 10
+    assert {"infograph", "join"} <= {e["name"] for e in spans}
+    emits = [e for e in spans if e["name"] == "emit traced"]
+    delivers = [e for e in spans if e["name"] == "deliver traced"]
+    assert len(emits) == len(delivers) == 10
+    # threaded deliveries are on a dispatcher worker, named in the metadata
+    names = {e["tid"]: e["args"]["name"] for e in events if e["ph"] == "M"}
+    assert all(names[e["tid"]].startswith("Asciinpy-Dispatcher") for e in delivers)
+    assert tracer.profiler.count == 10
+    assert Tracer.active is None
+
+
+def test_frame_metrics():
+    metrics = FrameMetrics(frames=4)
+    for duration in (10, 20, 10, 20, 40):
+        metrics.record(duration * 1_000_000, duration * 600_000, duration * 100_000, 25_000_000)
+
+    assert metrics.durations() == [20_000_000, 10_000_000, 20_000_000, 40_000_000]
+    assert metrics.percentiles(50, 99) == [20_000_000, 40_000_000]
+    assert metrics.jitter == (10 + 10 + 20) / 3 * 1_000_000
+    assert metrics.missed == 1
+    assert metrics.fps == 4 / 0.09
+
+    summary = metrics.summary()
+    assert summary["render"]["p99"] == 24 and summary["output"]["p50"] == 2
+    assert summary["missed"] == 1
+
+
+def test_metrics_overlay():
+    screen = FakeScreen(Resolutions.Large)
+    screen.show_fps = screen.timer = True
+    screen._prerender()
+
+    for _ in range(3):
+        screen.blit(Slow())
+        screen.refresh()
+
+    assert screen.metrics.count == 3
+    assert all(ns >= 2_000_000 for ns in screen.metrics.render_times()[1:])
+    frame = screen.updates[-1]
+    assert len(frame) == screen.width * screen.height
+    top = frame[: screen.width]
+    assert "FPS: [" in top and "StopWatch:" in top and " p99 " in top
+
+
+class VirtualScreen(FakeScreen):
+    __slots__ = ()
+
+    def __init__(self, clock: VirtualClock, max_fps=None, forcestop=None):
+        Screen.__init__(self, Resolutions.Basic, max_fps, forcestop, False, True, True, True, clock)
+        self.terminal = Resolutions.Basic.value
+        self.updates = []
+        self.repaints = 0
+
+
+def simulate(max_fps=None) -> VirtualScreen:
+    screen = VirtualScreen(VirtualClock(1 / 50), max_fps, forcestop=2)
+    try:
+        while True:
+            # moves a column across the screen with the time passed
+            x = int(screen.elapsed * 20) % screen.width
+            for y in range(2, screen.height):
+                screen.draw((x, y), "#")
+            screen.refresh()
+    except RuntimeError:
+        return screen
+
+
+def test_virtual_clock():
+    # nothing has passed before the first frame, and the screen keeps its clock to itself
+    fresh = VirtualScreen(VirtualClock(1 / 50))
+    assert fresh.average_fps == 0 and fresh.clock.monotonic() == 0
+    assert Event.clock is None
+
+    start = time.perf_counter()
+    screen = simulate()
+    # two seconds of frames are simulated without waiting for them
+    assert time.perf_counter() - start < 1
+    assert len(screen.updates) == 100
+    assert screen.metrics.durations()[1:] == [20_000_000] * 99
+    assert screen.metrics.percentiles(50, 99) == [20_000_000] * 2
+    assert screen.elapsed == 2 and screen.average_fps == 50
+
+    again = simulate()
+    assert again.updates == screen.updates
+
+    # frames are paced on the clock instead of the wall
+    capped = simulate(max_fps=25)
+    assert len(capped.updates) == 51
+    assert capped.metrics.durations()[2:] == [40_000_000] * 49
+
+
+class Churn:
+    def blit(self, screen):
+        # cycles only the garbage collector can free
+        for _ in range(2000):
+            a = []
+            a.append(a)
+
+
+def test_memory_profiler(tmp_path):
+    screen = FakeScreen(Resolutions.Basic)
+    with MemoryProfiler(frames=8, snapshot_every=2) as memory:
+        screen.metrics.memory = memory
+        for _ in range(4):
+            screen.blit(Churn())
+            screen.refresh()
+
+    assert memory.count == 4 and len(memory.snapshots) == 2
+    assert all(n >= 1000 for n in memory.allocations())
+    assert sum(memory.pauses()) > 0
+
+    summary = screen.metrics.summary()["memory"]
+    assert summary["collections"] == len(memory.collections)
+    # the collections triggered by the churn are blamed on it
+    assert summary["phases"]["Churn"] > 0
+
+    path = str(tmp_path / "frames.json")
+    screen.metrics.dump(path)
+    with open(path) as f:
+        dumped = json.load(f)
+    assert len(dumped["samples"]["frame"]) == 4
+    assert len(dumped["memory"]["collections"]) == len(memory.collections)
+    assert any("test_screen.py" in line for line, _, _ in memory.snapshots[0][1])
+
+
+def test_gc_policy():
+    screen = FakeScreen(Resolutions.Basic)
+    screen.max_fps = 100
+    policy = GCPolicy(force_after=5000)
+    screen.collector = policy
+    policy.start()
+    try:
+        assert not gc.isenabled()
+        for _ in range(10):
+            screen.blit(Churn())
+            screen.refresh()
+        # every collection ran in the slack between frames
+        assert sum(policy.collections) >= 10 and policy.forced == 0
+        assert gc.get_count()[0] < 2000
+
+        # without any slack the collector waits until too much is allocated
+        policy._cost = [10**9] * 3
+        screen.max_fps = None
+        ran = sum(policy.collections)
+        screen.blit(Churn())
+        screen.refresh()
+        assert sum(policy.collections) == ran
+        for _ in range(3):
+            screen.blit(Churn())
+            screen.refresh()
+        assert policy.forced >= 1
+    finally:
+        policy.stop()
+    assert gc.isenabled()
+
+
+def test_sgr_state():
+    red, blue = Color.foreground(255, 0, 0), Color.background(0, 0, 255)
+    assert red.ansi() is red.ansi() and red == Color.foreground(255, 0, 0)
+
+    screen = FakeScreen(Resolutions.Basic)
+    screen.show_fps = False
+    screen._prerender()
+    plane = Plane("ab cd", (0, 0), red)
+
+    screen.blit(plane)
+    screen.draw((10, 0), "x", blue)
+    screen.draw((11, 0), "y", Color.background(0, 0, 255))
+    screen.refresh()
+    first = screen.updates[-1]
+    # one sequence per run of a colour, the space between runs is uncoloured
+    assert first.startswith(red.ansi() + "ab" + ANSI.RESET + " " + red.ansi() + "cd" + ANSI.RESET)
+    assert first.count(blue.ansi()) == 1 and first.endswith(" " * (screen.width - 12) + " " * 50 * 24)
+    assert first.count(ANSI.RESET) == 3
+
+    # the terminal is left uncoloured, the next frame starts from there
+    screen.draw((49, 24), "z", red)
+    screen.refresh()
+    last = screen.updates[-1]
+    assert last.endswith(red.ansi() + "z") and ANSI.RESET not in last
+    screen.blit(Plane("w", (0, 0), red))
+    screen.refresh()
+    assert screen.updates[-1].startswith("w" + ANSI.RESET)
+
+    # a frame without colours resets what the previous one left
+    screen.draw((49, 24), "z", red)
+    screen.refresh()
+    screen.refresh()
+    screen.refresh()
+    assert screen.updates[-2] == ANSI.RESET + " " * screen.width * screen.height
+    assert screen.updates[-1] == " " * screen.width * screen.height
+
+
+def test_color_depth():
+    assert ColorDepth.detect({"COLORTERM": "truecolor", "TERM": "xterm"}) is ColorDepth.TrueColor
+    assert ColorDepth.detect({"TERM": "xterm-256color"}) is ColorDepth.Palette256
+    assert ColorDepth.detect({"TERM": "xterm"}) is ColorDepth.Palette16
+
+    # a lookup per value of the top 5 bits of every channel
+    assert len(palette_lut(ColorDepth.Palette256)) == len(palette_lut(ColorDepth.Palette16)) == 32768
+    red, grey = Color.foreground(255, 0, 0), Color.background(118, 118, 118)
+    assert red.ansi(ColorDepth.Palette256) == ANSI.CSI + "38;5;196m"
+    assert red.ansi(ColorDepth.Palette16) == ANSI.CSI + "91m"
+    assert grey.ansi(ColorDepth.Palette256) == ANSI.CSI + "48;5;243m"
+    assert grey.ansi(ColorDepth.Palette16) == ANSI.CSI + "100m"
+    assert Color.foreground(0, 0, 0).ansi(ColorDepth.Palette16) == ANSI.CSI + "30m"
+    assert red.ansi() == ANSI.CSI + "38;2;255;0;0m"
+
+    screen = FakeScreen(Resolutions.Basic)
+    screen.show_fps = False
+    screen._prerender()
+    screen.color_depth = ColorDepth.Palette16
+    # two reds that are the same colour of the palette are a single run
+    screen.draw((0, 0), "a", red)
+    screen.draw((1, 0), "b", Color.foreground(250, 10, 10))
+    screen.draw((2, 0), "c", Color.foreground(0, 0, 0))
+    screen.refresh()
+    assert screen.updates[-1].startswith(ANSI.CSI + "91mab" + ANSI.CSI + "30mc" + ANSI.RESET)
+
+
+class SleepLog(VirtualClock):
+    __slots__ = ("sleeps",)
+
+    def __init__(self, step: float):
+        super().__init__(step)
+        self.sleeps = []
+
+    def sleep(self, seconds: float):
+        self.sleeps.append(round(seconds, 6))
+        super().sleep(seconds)
+
+
+def test_sync_pacing():
+    # a blocking refresh never sleeps unless the fps is capped
+    clock = SleepLog(1 / 1000)
+    screen = VirtualScreen(clock)
+    for _ in range(5):
+        screen.refresh()
+    assert clock.sleeps == []
+
+    # and sleeps out what is left of every frame when it is
+    clock = SleepLog(1 / 1000)
+    screen = VirtualScreen(clock, max_fps=50)
+    for _ in range(5):
+        screen.refresh()
+    # the first frame is due at once, the others a fiftieth of a second apart
+    assert clock.sleeps == [0.019] * 4
+    assert screen.elapsed == 0.081
@@ -0,0 +1,30 @@
+from Asciinpy.shading import Shader
+from Asciinpy.values import Characters
+
+
+def test_ramp_ends():
+    shader = Shader(Characters.some)
+
+    assert shader.shade(bytes([0, 255])) == Characters.some[-1] + Characters.some[0]
+    assert shader.shade([0.0, 1.0, 5.0, -1.0]) == " @@ "
+    assert shader.glyph(255) == shader.glyph(1.0) == "@"
+
+
+def test_gamma():
+    linear = Shader(Characters.some)
+    darker = Shader(Characters.some, gamma=2.2)
+    assert Characters.some.index(darker.glyph(128)) > Characters.some.index(linear.glyph(128))
+
+
+def test_dither():
+    shader = Shader(Characters.some, dither=True)
+    rows = shader.shade_rows(bytes([120]) * 32, 8)
+
+    assert len(rows) == 4 and all(len(row) == 8 for row in rows)
+    # a flat intensity between two levels is spread over both glyphs
+    assert len(set("".join(rows))) == 2
+
+
+def test_unicode_palette():
+    shader = Shader("█▓▒░ ")
+    assert shader.shade(bytes([0, 255])) == " █"